@@ -8,10 +8,13 @@ Designed for use with MADiE (Measure Authoring Development Integrated Environmen
 
 Components:
 - FHIRBundleGenerator: Creates FHIR transaction bundles with QICore resources
-- VSACClient: Downloads valuesets from VSAC FHIR API
+- VSACClient: Downloads valuesets from VSAC FHIR API (AsyncVSACClient for asyncio)
 - MADiEExporter: Creates MADiE-compatible export structure
+- MADiEExportReader: Reads MADiE exports lazily; diff_exports compares two
 - Code Systems: Common code system URLs and codes
 - QICore Profiles: QICore 6.0.0 profile URLs
+- ParameterSweep: Generates test-case families from parameterized factories
+- PopulationGenerator: Synthetic populations as Bulk Data NDJSON
 
 Usage:
     from fhir_test_utils import (
@@ -45,6 +48,7 @@ from .bundle_generator import FHIRBundleGenerator
 # VSAC Client
 from .vsac_client import (
     VSACClient,
+    AsyncVSACClient,
     extract_valuesets_from_cql,
     extract_codesystems_from_cql,
     extract_direct_codes_from_cql,
@@ -62,7 +66,15 @@ from .vsac_client import (
 # MADiE Exporter
 from .madie_exporter import (
     MADiEExporter,
-    TestCaseRegistry
+    TestCaseRegistry,
+    parse_test_case_selection
+)
+
+# MADiE Export Reader
+from .madie_reader import (
+    MADiEExportReader,
+    ExportDiff,
+    diff_exports
 )
 
 # Code Systems
@@ -75,6 +87,35 @@ from .code_systems import (
     create_codeable_concept
 )
 
+# ID Strategies
+from .id_strategy import (
+    RandomIdStrategy,
+    DeterministicIdStrategy,
+    get_default_id_strategy,
+    get_default_patient_id,
+    use_id_strategy,
+    use_patient_id
+)
+
+# Parameter Sweeps
+from .parameter_sweep import (
+    ParameterGrid,
+    RandomSampler,
+    ParameterSweep
+)
+
+# Synthetic Populations
+from .population import (
+    PopulationGenerator,
+    NDJSONWriter
+)
+
+# JSON Backend
+from .json_backend import (
+    get_json_backend,
+    set_json_backend
+)
+
 # QICore Profiles
 from .qicore_profiles import (
     QICORE_PROFILES,
@@ -92,8 +133,18 @@ __all__ = [
     # Classes
     "FHIRBundleGenerator",
     "VSACClient",
+    "AsyncVSACClient",
     "MADiEExporter",
     "TestCaseRegistry",
+    "MADiEExportReader",
+    "ExportDiff",
+    "RandomIdStrategy",
+    "DeterministicIdStrategy",
+    "ParameterGrid",
+    "RandomSampler",
+    "ParameterSweep",
+    "PopulationGenerator",
+    "NDJSONWriter",
 
     # VSAC Exceptions
     "VSACError",
@@ -128,4 +179,20 @@ __all__ = [
     "extract_valuesets_from_cql",
     "extract_codesystems_from_cql",
     "extract_direct_codes_from_cql",
+
+    # ID Strategies
+    "get_default_id_strategy",
+    "get_default_patient_id",
+    "use_id_strategy",
+    "use_patient_id",
+
+    # Test Case Selection
+    "parse_test_case_selection",
+
+    # Export Diff
+    "diff_exports",
+
+    # JSON Backend
+    "get_json_backend",
+    "set_json_backend",
 ]
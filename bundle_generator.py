@@ -7,15 +7,150 @@ A reusable class for generating FHIR R4 transaction bundles for test cases.
 Resources conform to QICore 6.0.0 profiles.
 """
 
-import uuid
-import json
+import copy
+import hashlib
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
 
 from .qicore_profiles import (
-    QICORE_PROFILES, USCORE_PROFILES, CQFM_PROFILES, FHIR_EXTENSIONS,
-    get_profile_url, get_extension_url
+    QICORE_PROFILES, USCORE_PROFILES, CQFM_PROFILES, FHIR_EXTENSIONS, REFERENCE_PATHS,
+    get_profile_url, get_extension_url, get_reference_paths
 )
 from .code_systems import CODE_SYSTEMS, COMMON_CODES, create_coding
+from .json_backend import dumps as json_dumps
+from .id_strategy import get_default_id_strategy, get_default_patient_id
+
+
+def _as_datetime_list(timestamps) -> List[str]:
+    """Convert a sequence or NumPy array of timestamps to FHIR datetime strings"""
+    dtype = getattr(timestamps, "dtype", None)
+    if dtype is not None and dtype.kind == "M":
+        # datetime64 arrays: convert at millisecond precision to datetime objects
+        timestamps = timestamps.astype("datetime64[ms]")
+    if hasattr(timestamps, "tolist"):
+        timestamps = timestamps.tolist()
+
+    return [format_datetime(timestamp) if isinstance(timestamp, datetime) else timestamp
+            for timestamp in timestamps]
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a datetime as a FHIR datetime string in UTC with millisecond precision"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"{value:%Y-%m-%dT%H:%M:%S}.{value.microsecond // 1000:03d}Z"
+
+
+def _parse_datetime(value) -> datetime:
+    """Parse a FHIR datetime string (or pass through a datetime) for date arithmetic"""
+    if isinstance(value, datetime):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _iter_references(value):
+    """Yield every literal reference string ("Type/id") found in a resource"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "reference" and isinstance(item, str):
+                yield item
+            elif isinstance(item, (dict, list)):
+                yield from _iter_references(item)
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, (dict, list)):
+                yield from _iter_references(item)
+
+
+# Reference paths split into keys once, per resource type
+_REFERENCE_PATH_KEYS = {
+    resource_type: tuple(tuple(path.split(".")) for path in get_reference_paths(resource_type))
+    for resource_type in REFERENCE_PATHS
+}
+
+
+def _iter_path_references(node, keys, depth: int = 0):
+    """Yield the Reference dicts at a key path, traversing lists at every step"""
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_path_references(item, keys, depth)
+    elif isinstance(node, dict):
+        if depth == len(keys):
+            if isinstance(node.get("reference"), str):
+                yield node
+        else:
+            child = node.get(keys[depth])
+            if child is not None:
+                yield from _iter_path_references(child, keys, depth + 1)
+
+
+def _iter_any_references(value):
+    """Yield every dict with a string "reference" (for types without known paths)"""
+    if isinstance(value, dict):
+        if isinstance(value.get("reference"), str):
+            yield value
+        for key, item in value.items():
+            if key != "contained" and isinstance(item, (dict, list)):
+                yield from _iter_any_references(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_any_references(item)
+
+
+def _iter_parameter_references(parameters):
+    """Yield the Reference dicts in Parameters.parameter (including parts and resources)"""
+    for parameter in parameters:
+        if isinstance(parameter.get("valueReference"), dict) and \
+                isinstance(parameter["valueReference"].get("reference"), str):
+            yield parameter["valueReference"]
+        if isinstance(parameter.get("resource"), dict):
+            yield from _iter_reference_holders(parameter["resource"])
+        yield from _iter_parameter_references(parameter.get("part", []))
+
+
+def _iter_reference_holders(resource: Dict):
+    """
+    Yield every Reference dict in a resource, using REFERENCE_PATHS.
+
+    Contained resources, Bundle entries and Parameters (values, parts and
+    embedded resources) are followed. Resource types without known paths
+    are searched exhaustively.
+    """
+    resource_type = resource.get("resourceType")
+    if resource_type == "Parameters":
+        yield from _iter_parameter_references(resource.get("parameter", []))
+    elif resource_type == "Bundle":
+        for entry in resource.get("entry", []):
+            if isinstance(entry.get("resource"), dict):
+                yield from _iter_reference_holders(entry["resource"])
+    elif resource_type in _REFERENCE_PATH_KEYS:
+        for keys in _REFERENCE_PATH_KEYS[resource_type]:
+            yield from _iter_path_references(resource, keys)
+    else:
+        yield from _iter_any_references(resource)
+
+    for contained in resource.get("contained", []):
+        yield from _iter_reference_holders(contained)
+
+
+def _remap_reference(reference: str, reference_map: Dict[str, str]) -> Optional[str]:
+    """
+    Remap a literal reference ("Type/id" or an absolute URL ending in it).
+
+    Returns:
+        The new reference, or None if the reference is not remapped
+    """
+    new_reference = reference_map.get(reference)
+    if new_reference is not None:
+        return new_reference
+    parts = reference.rsplit("/", 2)
+    if len(parts) == 3:
+        new_reference = reference_map.get(f"{parts[1]}/{parts[2]}")
+        if new_reference is not None:
+            return f"{parts[0]}/{new_reference}"
+    return None
 
 
 class FHIRBundleGenerator:
@@ -33,27 +168,160 @@ class FHIRBundleGenerator:
     """
 
     MADIE_BASE_URL = "https://madie.cms.gov"
-
-    def __init__(self, test_case_name: str, patient_id: str = None):
+    POOL_SUPPORT_RESOURCES = True
+    GENERAL_PRACTITIONER_ID = "gp-001"  # Practitioner added (and referenced) by add_patient*
+    DEFAULT_ADMINISTERED_MEDICATION = {
+        "system": CODE_SYSTEMS["RXNORM"],
+        "code": "860975",
+        "display": "insulin human, isophane 70 UNT/ML / insulin human, regular 30 UNT/ML Injectable Suspension"
+    }
+
+    def __init__(self, test_case_name: str, patient_id: str = None, id_strategy=None,
+                 pool_support_resources: bool = None):
         """
         Initialize the bundle generator.
 
         Args:
             test_case_name: Name of the test case (used in patient name)
-            patient_id: Optional patient ID (auto-generated if not provided)
+            patient_id: Optional patient ID (defaults to the active default
+                        patient ID, see use_patient_id, or a generated one)
+            id_strategy: Optional ID strategy (e.g., DeterministicIdStrategy);
+                         defaults to the active default strategy (uuid4)
+            pool_support_resources: Reuse identical support resources (Practitioner,
+                                    Device, ...) instead of adding one per call.
+                                    Defaults to POOL_SUPPORT_RESOURCES; pass False
+                                    for exact legacy output.
         """
         self.test_case_name = test_case_name
-        self.patient_id = patient_id or str(uuid.uuid4())
+        if pool_support_resources is None:
+            pool_support_resources = self.POOL_SUPPORT_RESOURCES
+        self.pool_support_resources = pool_support_resources
+        self.id_strategy = id_strategy or get_default_id_strategy()
+        self.patient_id = patient_id or get_default_patient_id() or self.id_strategy.generate_id()
         self.bundle = {
             "resourceType": "Bundle",
-            "id": str(uuid.uuid4()).replace("-", "")[:24],
+            "id": self.id_strategy.generate_id().replace("-", "")[:24],
             "type": "transaction",
             "entry": []
         }
 
+    @property
+    def bundle(self) -> Dict:
+        """The FHIR Bundle dictionary"""
+        return self._bundle
+
+    @bundle.setter
+    def bundle(self, bundle: Dict):
+        """Replace the bundle and rebuild the resource index from its entries"""
+        self._bundle = bundle
+        self._rebuild_index()
+
     def _generate_id(self) -> str:
-        """Generate a new UUID for a resource"""
-        return str(uuid.uuid4())
+        """Generate a new ID for a resource using the generator's ID strategy"""
+        return self.id_strategy.generate_id()
+
+    # =========================================================================
+    # RESOURCE INDEX
+    # =========================================================================
+
+    def _rebuild_index(self):
+        """Rebuild the type, id and referrer indexes from the bundle entries"""
+        self._by_key = {}       # "Type/id" -> entry
+        self._by_type = {}      # resourceType -> {"Type/id": entry}
+        self._referrers = None  # referenced "Type/id" -> {"Type/id": entry}, built on first use
+        self._support_pool = {}  # content digest -> pooled support resource id
+        self._shared_entries = set()  # id() of entries sharing objects (with a fork or a series)
+        for entry in self._bundle.get("entry", []):
+            self._index_entry(entry)
+
+    def _index_entry(self, entry: Dict):
+        """Add a bundle entry to the indexes (last entry wins for duplicate ids)"""
+        resource = entry["resource"]
+        key = f"{resource['resourceType']}/{resource['id']}"
+        self._by_key[key] = entry
+        self._by_type.setdefault(resource["resourceType"], {})[key] = entry
+        if self._referrers is not None:
+            self._index_references(key, entry)
+
+    def _index_references(self, key: str, entry: Dict):
+        """Add a bundle entry to the referrer index"""
+        for reference in _iter_references(entry["resource"]):
+            self._referrers.setdefault(reference, {})[key] = entry
+
+    def _get_referrers(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Return the referrer index, building it on first use.
+
+        Walking every resource for references is the most expensive part of
+        indexing, and most generators are saved without ever asking who
+        references what, so the referrer index is only built when needed.
+        """
+        if self._referrers is None:
+            self._referrers = {}
+            for entry in self._bundle.get("entry", []):
+                resource = entry["resource"]
+                self._index_references(f"{resource['resourceType']}/{resource['id']}", entry)
+        return self._referrers
+
+    def _unindex_entry(self, entry: Dict):
+        """Remove a bundle entry from the indexes"""
+        resource = entry["resource"]
+        key = f"{resource['resourceType']}/{resource['id']}"
+        if self._by_key.get(key) is entry:
+            del self._by_key[key]
+            self._by_type[resource["resourceType"]].pop(key, None)
+        if self._referrers is None:
+            return
+        for reference in _iter_references(resource):
+            referrers = self._referrers.get(reference)
+            if referrers is not None and referrers.get(key) is entry:
+                del referrers[key]
+                if not referrers:
+                    del self._referrers[reference]
+
+    def _get_entry(self, resource_type: str, resource_id: str) -> Optional[Dict]:
+        """Return the bundle entry for a resource, or None if not present"""
+        return self._by_key.get(f"{resource_type}/{resource_id}")
+
+    def get_by_id(self, resource_type: str, resource_id: str) -> Optional[Dict]:
+        """
+        Look up a resource in the bundle by type and ID.
+
+        Args:
+            resource_type: FHIR resource type (e.g., "Encounter")
+            resource_id: The resource ID
+
+        Returns:
+            The resource dictionary, or None if not in the bundle
+        """
+        entry = self._by_key.get(f"{resource_type}/{resource_id}")
+        return entry["resource"] if entry is not None else None
+
+    def get_by_type(self, resource_type: str) -> List[Dict]:
+        """
+        Get all resources of a given type, in the order they were added.
+
+        Args:
+            resource_type: FHIR resource type (e.g., "Observation")
+
+        Returns:
+            List of resource dictionaries
+        """
+        return [entry["resource"] for entry in self._by_type.get(resource_type, {}).values()]
+
+    def referrers_of(self, resource_type: str, resource_id: str) -> List[Dict]:
+        """
+        Get all resources in the bundle that reference the given resource.
+
+        Args:
+            resource_type: FHIR resource type of the referenced resource
+            resource_id: ID of the referenced resource
+
+        Returns:
+            List of referencing resource dictionaries
+        """
+        referrers = self._get_referrers().get(f"{resource_type}/{resource_id}", {})
+        return [entry["resource"] for entry in referrers.values()]
 
     def _add_entry(self, resource: Dict, resource_id: str = None) -> str:
         """
@@ -80,7 +348,35 @@ class FHIRBundleGenerator:
             }
         }
 
-        self.bundle["entry"].append(entry)
+        self._bundle["entry"].append(entry)
+        self._index_entry(entry)
+        return resource_id
+
+    def _add_support_resource(self, resource: Dict) -> str:
+        """
+        Add a support resource (Practitioner, Device, ...), reusing an identical one.
+
+        When support pooling is enabled, a resource whose content (ignoring
+        its id) matches one already added is not added again; the existing
+        resource's ID is returned instead, and callers must reference that ID.
+
+        Args:
+            resource: The FHIR resource dictionary (with a freshly generated id)
+
+        Returns:
+            The ID of the resource to reference
+        """
+        if not self.pool_support_resources:
+            return self._add_entry(resource, resource["id"])
+
+        content = {key: value for key, value in resource.items() if key != "id"}
+        content_key = hashlib.sha256(json_dumps(content, separators=(",", ":")).encode("utf-8")).digest()
+        pooled_id = self._support_pool.get(content_key)
+        if pooled_id is not None and self._get_entry(resource["resourceType"], pooled_id) is not None:
+            return pooled_id
+
+        resource_id = self._add_entry(resource, resource["id"])
+        self._support_pool[content_key] = resource_id
         return resource_id
 
     def _build_encounter_locations(self,
@@ -163,6 +459,190 @@ class FHIRBundleGenerator:
             }
         ]
 
+    # =========================================================================
+    # FORKING
+    # =========================================================================
+
+    def fork(self, test_case_name: str = None) -> "FHIRBundleGenerator":
+        """
+        Create a copy-on-write variant of this generator.
+
+        The fork shares the parent's entries instead of copying them. An entry
+        is copied only when either generator modifies it through
+        edit_resource(); resources added to or removed from one generator
+        never appear in or disappear from the other. Deriving many variants
+        from one base scenario therefore costs little more than the
+        resources each variant adds.
+
+        Resources returned by get_by_id(), get_by_type() and referrers_of()
+        may be shared with forks and must be treated as read-only; use
+        edit_resource() to change an existing resource.
+
+        Args:
+            test_case_name: Name for the variant (defaults to the parent's)
+
+        Returns:
+            A new FHIRBundleGenerator with the same patient and resources
+        """
+        child = self.__class__.__new__(self.__class__)
+        child.test_case_name = test_case_name or self.test_case_name
+        child.pool_support_resources = self.pool_support_resources
+        child.id_strategy = self.id_strategy
+        child.patient_id = self.patient_id
+
+        bundle = {key: copy.deepcopy(value) for key, value in self._bundle.items() if key != "entry"}
+        bundle["id"] = self._generate_id().replace("-", "")[:24]
+        bundle["entry"] = list(self._bundle.get("entry", []))
+        child._bundle = bundle
+
+        child._by_key = dict(self._by_key)
+        child._by_type = {resource_type: dict(entries) for resource_type, entries in self._by_type.items()}
+        child._referrers = None
+        child._support_pool = dict(self._support_pool)
+
+        # Both sides now hold the same entry objects, so neither may modify
+        # them in place any more.
+        shared = {id(entry) for entry in bundle["entry"]}
+        self._shared_entries |= shared
+        child._shared_entries = shared
+        return child
+
+    def edit_resource(self, resource_type: str, resource_id: str) -> Optional[Dict]:
+        """
+        Get a resource for modification.
+
+        If the resource is shared with a fork (or the generator it was forked
+        from), it is copied first so the change stays local to this generator.
+
+        Args:
+            resource_type: FHIR resource type (e.g., "Encounter")
+            resource_id: The resource ID
+
+        Returns:
+            The resource dictionary, or None if not in the bundle
+        """
+        entry = self._get_entry(resource_type, resource_id)
+        if entry is None:
+            return None
+        return self._writable_entry(entry)["resource"]
+
+    def remove_resource(self, resource_type: str, resource_id: str) -> bool:
+        """
+        Remove a resource from the bundle.
+
+        References to the removed resource from other resources are left as-is.
+
+        Args:
+            resource_type: FHIR resource type (e.g., "MedicationAdministration")
+            resource_id: The resource ID
+
+        Returns:
+            True if the resource was removed, False if it was not in the bundle
+        """
+        entry = self._get_entry(resource_type, resource_id)
+        if entry is None:
+            return False
+        entries = self._bundle["entry"]
+        for position, candidate in enumerate(entries):
+            if candidate is entry:
+                del entries[position]
+                break
+        self._unindex_entry(entry)
+        self._shared_entries.discard(id(entry))
+        return True
+
+    def remap_ids(self, id_map: Dict[str, str]) -> int:
+        """
+        Change resource IDs and every reference to them, in one pass.
+
+        References are found through the per-type paths in
+        qicore_profiles.REFERENCE_PATHS, including those in contained
+        resources and Parameters; relative ("Patient/123") and absolute
+        references are both remapped. Identifier values are not changed.
+
+        Args:
+            id_map: Dict of "Type/old-id" -> new ID (e.g., {"Patient/123": "456"})
+
+        Returns:
+            Number of entries changed
+        """
+        if not id_map:
+            return 0
+
+        reference_map = {key: f"{key.partition('/')[0]}/{new_id}" for key, new_id in id_map.items()}
+        entries = self._bundle["entry"]
+        changed = 0
+        for position, entry in enumerate(entries):
+            resource = entry["resource"]
+            key = f"{resource['resourceType']}/{resource['id']}"
+            renamed = key in reference_map
+            if not renamed and not any(_remap_reference(holder["reference"], reference_map)
+                                       for holder in _iter_reference_holders(resource)):
+                continue
+
+            # Entries shared with a fork are copied before they are changed
+            if id(entry) in self._shared_entries:
+                self._shared_entries.discard(id(entry))
+                entry = copy.deepcopy(entry)
+                entries[position] = entry
+                resource = entry["resource"]
+
+            if renamed:
+                resource["id"] = id_map[key]
+                for container, field in ((entry, "fullUrl"), (entry.get("request", {}), "url")):
+                    if isinstance(container.get(field), str):
+                        container[field] = _remap_reference(container[field], reference_map) or container[field]
+
+            for holder in _iter_reference_holders(resource):
+                new_reference = _remap_reference(holder["reference"], reference_map)
+                if new_reference is not None:
+                    holder["reference"] = new_reference
+            changed += 1
+
+        # Keys changed, so rebuild the lookup indexes (in bundle order)
+        self._by_key = {}
+        self._by_type = {}
+        self._referrers = None
+        for entry in entries:
+            self._index_entry(entry)
+
+        renamed_ids = {key.partition("/")[2]: new_id for key, new_id in id_map.items()}
+        self._support_pool = {digest: renamed_ids.get(resource_id, resource_id)
+                              for digest, resource_id in self._support_pool.items()}
+        return changed
+
+    def _writable_entry(self, entry: Dict) -> Dict:
+        """
+        Return a bundle entry that may be modified in place.
+
+        Entries shared with a fork (or sharing fragments with the other
+        readings of an observation series) are replaced by a private deep
+        copy, at the same position in the bundle and in every index.
+        """
+        if id(entry) not in self._shared_entries:
+            return entry
+
+        private = copy.deepcopy(entry)
+        entries = self._bundle["entry"]
+        for position, candidate in enumerate(entries):
+            if candidate is entry:
+                entries[position] = private
+                break
+
+        resource = entry["resource"]
+        key = f"{resource['resourceType']}/{resource['id']}"
+        if self._by_key.get(key) is entry:
+            self._by_key[key] = private
+            self._by_type[resource["resourceType"]][key] = private
+        if self._referrers is not None:
+            for reference in _iter_references(resource):
+                referrers = self._referrers.get(reference)
+                if referrers is not None and referrers.get(key) is entry:
+                    referrers[key] = private
+
+        self._shared_entries.discard(id(entry))
+        return private
+
     # =========================================================================
     # PATIENT
     # =========================================================================
@@ -189,7 +669,7 @@ class FHIRBundleGenerator:
             family_name = "TestPatient"
 
         # Add General Practitioner first (referenced by Patient)
-        gp_id = "gp-001"
+        gp_id = self.GENERAL_PRACTITIONER_ID
         gp_practitioner = {
             "resourceType": "Practitioner",
             "id": gp_id,
@@ -740,8 +1220,62 @@ class FHIRBundleGenerator:
         Returns:
             The observation ID
         """
-        observation_id = self._generate_id()
-        specimen_id = self._generate_id()
+        if effective_datetime is None:
+            effective_datetime = "2022-01-06T10:00:00.000Z"
+
+        return self.add_observation_series(
+            encounter_id=encounter_id,
+            timestamps=[effective_datetime],
+            values=[value],
+            units=unit,
+            category=category,
+            code=code
+        )[0]
+
+    def add_observation_series(self,
+                               encounter_id: str,
+                               timestamps,
+                               values,
+                               units="mg/dL",
+                               category: str = "laboratory",
+                               code: Dict = None) -> List[str]:
+        """
+        Add a time series of Observations (one per reading) for a single code.
+
+        Each reading produces the same Specimen and Observation as add_observation.
+        The static parts of the resources (profiles, codings, reference ranges)
+        are built once and shared by every reading, so long glucose or
+        vital-sign streams are much cheaper than repeated add_observation calls.
+        The entries are copy-on-write like those of a fork: edit_resource
+        copies a reading before it is changed, so edits stay local to it.
+
+        Args:
+            encounter_id: Reference to the encounter
+            timestamps: Sequence or NumPy array of effective datetimes (ISO strings,
+                        datetime objects or datetime64 values)
+            values: Sequence or NumPy array of numeric values, parallel to timestamps
+            units: Unit of measure for all readings, or a sequence parallel to values
+            category: Observation category (laboratory, vital-signs, etc.)
+            code: Observation code {system, code, display}
+
+        Returns:
+            List of observation IDs, in reading order
+
+        Raises:
+            ValueError: If the parallel arrays have different lengths
+        """
+        timestamps = _as_datetime_list(timestamps)
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        if isinstance(units, str):
+            units = [units] * len(values)
+        else:
+            units = units.tolist() if hasattr(units, "tolist") else list(units)
+
+        if not len(timestamps) == len(values) == len(units):
+            raise ValueError(
+                f"timestamps, values and units must have the same length "
+                f"(got {len(timestamps)}, {len(values)}, {len(units)})"
+            )
 
         if code is None:
             if category == "laboratory":
@@ -757,9 +1291,6 @@ class FHIRBundleGenerator:
                     "display": "Heart rate"
                 }
 
-        if effective_datetime is None:
-            effective_datetime = "2022-01-06T10:00:00.000Z"
-
         # Select appropriate profile based on category
         if category == "laboratory":
             profile = QICORE_PROFILES["ObservationLab"]
@@ -768,122 +1299,149 @@ class FHIRBundleGenerator:
         else:
             profile = QICORE_PROFILES["SimpleObservation"]
 
-        # Add Specimen resource for the observation
-        specimen = {
-            "resourceType": "Specimen",
-            "id": specimen_id,
-            "meta": {"profile": [USCORE_PROFILES["Specimen"]]},
-            "type": {
-                "coding": [{
-                    "system": CODE_SYSTEMS["SNOMED"],
-                    "code": "119297000",
-                    "display": "Blood specimen"
-                }]
-            },
-            "subject": {"reference": f"Patient/{self.patient_id}"},
-            "receivedTime": effective_datetime,
-            "collection": {"collectedDateTime": effective_datetime}
+        # Static fragments shared by every reading in the series (the entries
+        # are marked shared below, so edits copy them first)
+        specimen_meta = {"profile": [USCORE_PROFILES["Specimen"]]}
+        specimen_type = {
+            "coding": [{
+                "system": CODE_SYSTEMS["SNOMED"],
+                "code": "119297000",
+                "display": "Blood specimen"
+            }]
         }
-        self._add_entry(specimen, specimen_id)
-
-        observation = {
-            "resourceType": "Observation",
-            "id": observation_id,
-            "meta": {"profile": [profile]},
-            "extension": [
-                {
-                    "url": FHIR_EXTENSIONS["observation-bodyPosition"],
-                    "valueCodeableConcept": {
-                        "coding": [{
-                            "system": CODE_SYSTEMS["SNOMED"],
-                            "code": "33586001",
-                            "display": "Sitting position"
-                        }]
-                    }
-                }
-            ],
-            "partOf": [{"reference": f"Procedure/proc-{observation_id[:8]}"}],
-            "status": "final",
-            "category": [
-                {
-                    "coding": [{
-                        "system": CODE_SYSTEMS["ObservationCategory"],
-                        "code": category,
-                        "display": category.replace("-", " ").title()
-                    }]
-                }
-            ],
-            "code": {"coding": [code]},
-            "subject": {"reference": f"Patient/{self.patient_id}"},
-            "encounter": {"reference": f"Encounter/{encounter_id}"},
-            "effectiveDateTime": effective_datetime,
-            "issued": effective_datetime,
-            "valueQuantity": {
-                "value": value,
-                "unit": unit,
-                "system": CODE_SYSTEMS["UCUM"],
-                "code": unit
-            },
-            "interpretation": [
-                {
+        observation_meta = {"profile": [profile]}
+        extension = [
+            {
+                "url": FHIR_EXTENSIONS["observation-bodyPosition"],
+                "valueCodeableConcept": {
                     "coding": [{
-                        "system": CODE_SYSTEMS["ObservationInterpretation"],
-                        "code": "N",
-                        "display": "Normal"
+                        "system": CODE_SYSTEMS["SNOMED"],
+                        "code": "33586001",
+                        "display": "Sitting position"
                     }]
                 }
-            ],
-            "bodySite": {
+            }
+        ]
+        observation_category = [
+            {
                 "coding": [{
-                    "system": CODE_SYSTEMS["SNOMED"],
-                    "code": "368209003",
-                    "display": "Right upper arm structure"
+                    "system": CODE_SYSTEMS["ObservationCategory"],
+                    "code": category,
+                    "display": category.replace("-", " ").title()
                 }]
-            },
-            "method": {
+            }
+        ]
+        observation_code = {"coding": [code]}
+        interpretation = [
+            {
                 "coding": [{
-                    "system": CODE_SYSTEMS["SNOMED"],
-                    "code": "129300006",
-                    "display": "Measurement - action"
+                    "system": CODE_SYSTEMS["ObservationInterpretation"],
+                    "code": "N",
+                    "display": "Normal"
                 }]
-            },
-            "specimen": {"reference": f"Specimen/{specimen_id}"},
-            "referenceRange": [
-                {
-                    "low": {"value": 70, "unit": unit, "system": CODE_SYSTEMS["UCUM"], "code": unit},
-                    "high": {"value": 140, "unit": unit, "system": CODE_SYSTEMS["UCUM"], "code": unit},
-                    "type": {
-                        "coding": [{
-                            "system": CODE_SYSTEMS["ReferenceRangeMeaning"],
-                            "code": "normal",
-                            "display": "Normal Range"
-                        }]
-                    }
+            }
+        ]
+        body_site = {
+            "coding": [{
+                "system": CODE_SYSTEMS["SNOMED"],
+                "code": "368209003",
+                "display": "Right upper arm structure"
+            }]
+        }
+        method = {
+            "coding": [{
+                "system": CODE_SYSTEMS["SNOMED"],
+                "code": "129300006",
+                "display": "Measurement - action"
+            }]
+        }
+        component = [
+            {
+                "code": {
+                    "coding": [{
+                        "system": CODE_SYSTEMS["LOINC"],
+                        "code": "8480-6",
+                        "display": "Systolic blood pressure"
+                    }]
+                },
+                "valueQuantity": {
+                    "value": 120,
+                    "unit": "mmHg",
+                    "system": CODE_SYSTEMS["UCUM"],
+                    "code": "mm[Hg]"
                 }
-            ],
-            "hasMember": [{"reference": f"Observation/member-{observation_id[:8]}"}],
-            "derivedFrom": [{"reference": f"Observation/derived-{observation_id[:8]}"}],
-            "component": [
-                {
-                    "code": {
-                        "coding": [{
-                            "system": CODE_SYSTEMS["LOINC"],
-                            "code": "8480-6",
-                            "display": "Systolic blood pressure"
-                        }]
-                    },
-                    "valueQuantity": {
-                        "value": 120,
-                        "unit": "mmHg",
-                        "system": CODE_SYSTEMS["UCUM"],
-                        "code": "mm[Hg]"
+            }
+        ]
+        reference_ranges = {}
+
+        observation_ids = []
+        for effective_datetime, value, unit in zip(timestamps, values, units):
+            observation_id = self._generate_id()
+            specimen_id = self._generate_id()
+
+            reference_range = reference_ranges.get(unit)
+            if reference_range is None:
+                reference_range = reference_ranges[unit] = [
+                    {
+                        "low": {"value": 70, "unit": unit, "system": CODE_SYSTEMS["UCUM"], "code": unit},
+                        "high": {"value": 140, "unit": unit, "system": CODE_SYSTEMS["UCUM"], "code": unit},
+                        "type": {
+                            "coding": [{
+                                "system": CODE_SYSTEMS["ReferenceRangeMeaning"],
+                                "code": "normal",
+                                "display": "Normal Range"
+                            }]
+                        }
                     }
-                }
-            ]
-        }
+                ]
 
-        self._add_entry(observation, observation_id)
-        return observation_id
+            # Add Specimen resource for the observation
+            specimen = {
+                "resourceType": "Specimen",
+                "id": specimen_id,
+                "meta": specimen_meta,
+                "type": specimen_type,
+                "subject": {"reference": f"Patient/{self.patient_id}"},
+                "receivedTime": effective_datetime,
+                "collection": {"collectedDateTime": effective_datetime}
+            }
+            self._add_entry(specimen, specimen_id)
+            self._shared_entries.add(id(self._bundle["entry"][-1]))
+
+            observation = {
+                "resourceType": "Observation",
+                "id": observation_id,
+                "meta": observation_meta,
+                "extension": extension,
+                "partOf": [{"reference": f"Procedure/proc-{observation_id[:8]}"}],
+                "status": "final",
+                "category": observation_category,
+                "code": observation_code,
+                "subject": {"reference": f"Patient/{self.patient_id}"},
+                "encounter": {"reference": f"Encounter/{encounter_id}"},
+                "effectiveDateTime": effective_datetime,
+                "issued": effective_datetime,
+                "valueQuantity": {
+                    "value": value,
+                    "unit": unit,
+                    "system": CODE_SYSTEMS["UCUM"],
+                    "code": unit
+                },
+                "interpretation": interpretation,
+                "bodySite": body_site,
+                "method": method,
+                "specimen": {"reference": f"Specimen/{specimen_id}"},
+                "referenceRange": reference_range,
+                "hasMember": [{"reference": f"Observation/member-{observation_id[:8]}"}],
+                "derivedFrom": [{"reference": f"Observation/derived-{observation_id[:8]}"}],
+                "component": component
+            }
+
+            self._add_entry(observation, observation_id)
+            self._shared_entries.add(id(self._bundle["entry"][-1]))
+            observation_ids.append(observation_id)
+
+        return observation_ids
 
     def add_observation_data_absent(self,
                                      encounter_id: str,
@@ -1162,16 +1720,115 @@ class FHIRBundleGenerator:
             The medication administration ID
         """
         med_admin_id = self._generate_id()
-        practitioner_id = self._generate_id()
-        device_id = self._generate_id()
+        practitioner_id, device_id = self._add_administration_support(
+            self._generate_id(), self._generate_id()
+        )
 
         if medication_code is None:
-            medication_code = {
-                "system": CODE_SYSTEMS["RXNORM"],
-                "code": "860975",
-                "display": "insulin human, isophane 70 UNT/ML / insulin human, regular 30 UNT/ML Injectable Suspension"
-            }
+            medication_code = self.DEFAULT_ADMINISTERED_MEDICATION
 
+        medication_admin = self._build_medication_administration(
+            med_admin_id, encounter_id, effective_start, effective_end,
+            practitioner_id, device_id,
+            {"medicationCodeableConcept": {"coding": [medication_code]}}
+        )
+        self._add_entry(medication_admin, med_admin_id)
+        return med_admin_id
+
+    def add_medication_course(self,
+                              encounter_id: str,
+                              start,
+                              days: int,
+                              doses_per_day: int = 1,
+                              duration=60,
+                              gaps: List[int] = None,
+                              medication_code: Dict = None,
+                              medication_id: str = None,
+                              share_support: bool = True) -> List[str]:
+        """
+        Add a course of MedicationAdministration resources.
+
+        Administration periods are computed with datetime arithmetic, so
+        courses may cross month and year boundaries. Doses are spaced evenly
+        over each day, starting at the time of day given by start. By default
+        the whole course shares one Practitioner and one Device.
+
+        Args:
+            encounter_id: Reference to the encounter
+            start: First administration start (FHIR datetime string or datetime)
+            days: Number of calendar days the course spans
+            doses_per_day: Administrations per day (e.g., 1 for daily, 2 for q12h)
+            duration: Length of each administration (minutes or timedelta)
+            gaps: Day offsets (0-based) on which no doses are given
+            medication_code: Medication code {system, code, display}
+            medication_id: Reference to a Medication resource (used instead of
+                           medication_code, e.g., from add_medication())
+            share_support: Share one Practitioner/Device pair across the course;
+                           if False, each administration gets its own pair,
+                           as with add_medication_administration()
+
+        Returns:
+            List of medication administration IDs in administration order
+
+        Raises:
+            ValueError: If days or doses_per_day is less than 1, or duration is negative
+        """
+        if days < 1 or doses_per_day < 1:
+            raise ValueError(f"days and doses_per_day must be at least 1 (got {days}, {doses_per_day})")
+
+        if not isinstance(duration, timedelta):
+            duration = timedelta(minutes=duration)
+        if duration < timedelta(0):
+            raise ValueError(f"duration must not be negative (got {duration})")
+
+        if medication_id is not None:
+            medication = {"medicationReference": {"reference": f"Medication/{medication_id}"}}
+        else:
+            medication = {"medicationCodeableConcept": {
+                "coding": [medication_code or self.DEFAULT_ADMINISTERED_MEDICATION]
+            }}
+
+        first_start = _parse_datetime(start)
+        dose_interval = timedelta(days=1) / doses_per_day
+        skipped_days = set(gaps or ())
+
+        if share_support:
+            support_ids = self._add_administration_support(self._generate_id(), self._generate_id())
+
+        med_admin_ids = []
+        for day in range(days):
+            if day in skipped_days:
+                continue
+            day_start = first_start + timedelta(days=day)
+            for dose in range(doses_per_day):
+                dose_start = day_start + dose * dose_interval
+                effective_start = format_datetime(dose_start)
+                effective_end = format_datetime(dose_start + duration)
+
+                med_admin_id = self._generate_id()
+                if not share_support:
+                    support_ids = self._add_administration_support(self._generate_id(), self._generate_id())
+                practitioner_id, device_id = support_ids
+                medication_admin = self._build_medication_administration(
+                    med_admin_id, encounter_id, effective_start, effective_end,
+                    practitioner_id, device_id, medication
+                )
+                self._add_entry(medication_admin, med_admin_id)
+                med_admin_ids.append(med_admin_id)
+
+        return med_admin_ids
+
+    def _add_administration_support(self, practitioner_id: str, device_id: str):
+        """
+        Add the Practitioner and Device referenced by a MedicationAdministration.
+
+        Args:
+            practitioner_id: ID for the administering Practitioner
+            device_id: ID for the administration Device
+
+        Returns:
+            Tuple of (practitioner_id, device_id) as added to the bundle
+        """
         # Add Practitioner for performer
         practitioner = {
             "resourceType": "Practitioner",
@@ -1180,7 +1837,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Nurse", "given": ["Admin"]}]
         }
-        self._add_entry(practitioner, practitioner_id)
+        practitioner_id = self._add_support_resource(practitioner)
 
         # Add Device for administration
         device = {
@@ -1196,9 +1853,36 @@ class FHIRBundleGenerator:
             },
             "patient": {"reference": f"Patient/{self.patient_id}"}
         }
-        self._add_entry(device, device_id)
+        device_id = self._add_support_resource(device)
+
+        return practitioner_id, device_id
+
+    def _build_medication_administration(self,
+                                         med_admin_id: str,
+                                         encounter_id: str,
+                                         effective_start: str,
+                                         effective_end: str,
+                                         practitioner_id: str,
+                                         device_id: str,
+                                         medication: Dict) -> Dict:
+        """
+        Build a MedicationAdministration resource.
 
-        medication_admin = {
+        Args:
+            med_admin_id: Resource ID
+            encounter_id: Reference to the encounter
+            effective_start: Effective period start
+            effective_end: Effective period end
+            practitioner_id: Reference to the performing Practitioner
+            device_id: Reference to the administration Device
+            medication: Either {"medicationCodeableConcept": ...} or
+                        {"medicationReference": ...} (copied into the resource,
+                        so callers may pass shared or class-level dicts)
+
+        Returns:
+            The MedicationAdministration resource
+        """
+        return {
             "resourceType": "MedicationAdministration",
             "id": med_admin_id,
             "meta": {"profile": [QICORE_PROFILES["MedicationAdministration"]]},
@@ -1221,7 +1905,7 @@ class FHIRBundleGenerator:
                     "display": "Inpatient"
                 }]
             },
-            "medicationCodeableConcept": {"coding": [medication_code]},
+            **copy.deepcopy(medication),
             "subject": {"reference": f"Patient/{self.patient_id}"},
             "context": {"reference": f"Encounter/{encounter_id}"},
             "supportingInformation": [{"reference": f"Observation/obs-{med_admin_id[:8]}"}],
@@ -1295,9 +1979,6 @@ class FHIRBundleGenerator:
             }
         }
 
-        self._add_entry(medication_admin, med_admin_id)
-        return med_admin_id
-
     # =========================================================================
     # MEDICATION REQUEST
     # =========================================================================
@@ -1336,7 +2017,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Smith", "given": ["John"]}]
         }
-        self._add_entry(practitioner, practitioner_id)
+        practitioner_id = self._add_support_resource(practitioner)
 
         # Add Practitioner resource (recorder)
         recorder = {
@@ -1346,7 +2027,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Recorder", "given": ["Jane"]}]
         }
-        self._add_entry(recorder, recorder_id)
+        recorder_id = self._add_support_resource(recorder)
 
         medication_request = {
             "resourceType": "MedicationRequest",
@@ -1474,7 +2155,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Smith", "given": ["John"]}]
         }
-        self._add_entry(practitioner, practitioner_id)
+        practitioner_id = self._add_support_resource(practitioner)
 
         recorder = {
             "resourceType": "Practitioner",
@@ -1483,7 +2164,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Recorder", "given": ["NotReq"]}]
         }
-        self._add_entry(recorder, recorder_id)
+        recorder_id = self._add_support_resource(recorder)
 
         medication_not_requested = {
             "resourceType": "MedicationRequest",
@@ -1588,7 +2269,7 @@ class FHIRBundleGenerator:
             "name": "Operating Room 1",
             "type": [{"coding": [{"system": CODE_SYSTEMS["RoleCode"], "code": "OR", "display": "Operating Room"}]}]
         }
-        self._add_entry(location, location_id)
+        location_id = self._add_support_resource(location)
 
         procedure = {
             "resourceType": "Procedure",
@@ -1860,7 +2541,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Requester", "given": ["Dr"]}]
         }
-        self._add_entry(requester, requester_id)
+        requester_id = self._add_support_resource(requester)
 
         # Add performer Practitioner
         performer = {
@@ -1870,7 +2551,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Performer", "given": ["Lab"]}]
         }
-        self._add_entry(performer, performer_id)
+        performer_id = self._add_support_resource(performer)
 
         service_request = {
             "resourceType": "ServiceRequest",
@@ -2002,7 +2683,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Requester", "given": ["Dr"]}]
         }
-        self._add_entry(requester, requester_id)
+        requester_id = self._add_support_resource(requester)
 
         performer = {
             "resourceType": "Practitioner",
@@ -2011,7 +2692,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Performer", "given": ["NotReq"]}]
         }
-        self._add_entry(performer, performer_id)
+        performer_id = self._add_support_resource(performer)
 
         service_not_requested = {
             "resourceType": "ServiceRequest",
@@ -2287,7 +2968,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Smith", "given": ["John"]}]
         }
-        self._add_entry(practitioner, practitioner_id)
+        practitioner_id = self._add_support_resource(practitioner)
 
         recorder = {
             "resourceType": "Practitioner",
@@ -2296,7 +2977,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "Recorder", "given": ["Jane"]}]
         }
-        self._add_entry(recorder, recorder_id)
+        recorder_id = self._add_support_resource(recorder)
 
         medication_request = {
             "resourceType": "MedicationRequest",
@@ -2401,132 +3082,15 @@ class FHIRBundleGenerator:
             The medication administration ID
         """
         med_admin_id = self._generate_id()
-        practitioner_id = self._generate_id()
-        device_id = self._generate_id()
-
-        # Add Practitioner
-        practitioner = {
-            "resourceType": "Practitioner",
-            "id": practitioner_id,
-            "meta": {"profile": [QICORE_PROFILES["Practitioner"]]},
-            "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
-            "name": [{"family": "Nurse", "given": ["Admin"]}]
-        }
-        self._add_entry(practitioner, practitioner_id)
-
-        # Add Device
-        device = {
-            "resourceType": "Device",
-            "id": device_id,
-            "meta": {"profile": [QICORE_PROFILES["Device"]]},
-            "type": {
-                "coding": [{
-                    "system": CODE_SYSTEMS["SNOMED"],
-                    "code": "468063009",
-                    "display": "Infusion pump"
-                }]
-            },
-            "patient": {"reference": f"Patient/{self.patient_id}"}
-        }
-        self._add_entry(device, device_id)
-
-        medication_admin = {
-            "resourceType": "MedicationAdministration",
-            "id": med_admin_id,
-            "meta": {"profile": [QICORE_PROFILES["MedicationAdministration"]]},
-            "instantiates": ["http://example.org/fhir/PlanDefinition/insulin-protocol"],
-            "partOf": [{"reference": f"Procedure/proc-{med_admin_id[:8]}"}],
-            "status": "completed",
-            "statusReason": [
-                {
-                    "coding": [{
-                        "system": CODE_SYSTEMS["SNOMED"],
-                        "code": "373066001",
-                        "display": "Yes"
-                    }]
-                }
-            ],
-            "category": {
-                "coding": [{
-                    "system": CODE_SYSTEMS["MedicationAdminCategory"],
-                    "code": "inpatient",
-                    "display": "Inpatient"
-                }]
-            },
-            "medicationReference": {"reference": f"Medication/{medication_id}"},
-            "subject": {"reference": f"Patient/{self.patient_id}"},
-            "context": {"reference": f"Encounter/{encounter_id}"},
-            "supportingInformation": [{"reference": f"Observation/obs-{med_admin_id[:8]}"}],
-            "effectivePeriod": {"start": effective_start, "end": effective_end},
-            "performer": [
-                {
-                    "actor": {"reference": f"Practitioner/{practitioner_id}"},
-                    "function": {
-                        "coding": [{
-                            "system": CODE_SYSTEMS["MedicationAdminPerformFunction"],
-                            "code": "performer",
-                            "display": "Performer"
-                        }]
-                    }
-                }
-            ],
-            "reasonCode": [
-                {
-                    "coding": [{
-                        "system": CODE_SYSTEMS["SNOMED"],
-                        "code": "44054006",
-                        "display": "Diabetes mellitus type 2"
-                    }]
-                }
-            ],
-            "reasonReference": [{"reference": f"Condition/cond-{med_admin_id[:8]}"}],
-            "request": {"reference": f"MedicationRequest/req-{med_admin_id[:8]}"},
-            "device": [{"reference": f"Device/{device_id}"}],
-            "note": [
-                {
-                    "authorString": "Nurse Admin",
-                    "time": effective_start,
-                    "text": "Patient tolerated medication well"
-                }
-            ],
-            "dosage": {
-                "text": "10 units subcutaneously",
-                "site": {
-                    "coding": [{
-                        "system": CODE_SYSTEMS["SNOMED"],
-                        "code": "368209003",
-                        "display": "Right upper arm structure"
-                    }]
-                },
-                "route": {
-                    "coding": [{
-                        "system": CODE_SYSTEMS["SNOMED"],
-                        "code": "34206005",
-                        "display": "Subcutaneous route"
-                    }]
-                },
-                "method": {
-                    "coding": [{
-                        "system": CODE_SYSTEMS["SNOMED"],
-                        "code": "422145002",
-                        "display": "Inject"
-                    }]
-                },
-                "dose": {
-                    "value": 10,
-                    "unit": "U",
-                    "system": CODE_SYSTEMS["UCUM"],
-                    "code": "U"
-                },
-                "rateQuantity": {
-                    "value": 1,
-                    "unit": "mL/hour",
-                    "system": CODE_SYSTEMS["UCUM"],
-                    "code": "mL/h"
-                }
-            }
-        }
-
+        practitioner_id, device_id = self._add_administration_support(
+            self._generate_id(), self._generate_id()
+        )
+
+        medication_admin = self._build_medication_administration(
+            med_admin_id, encounter_id, effective_start, effective_end,
+            practitioner_id, device_id,
+            {"medicationReference": {"reference": f"Medication/{medication_id}"}}
+        )
         self._add_entry(medication_admin, med_admin_id)
         return med_admin_id
 
@@ -2561,12 +3125,10 @@ class FHIRBundleGenerator:
             expected_populations = {"initialPopulation": 1}
 
         # Collect all resource references for evaluatedResource
-        evaluated_resources = []
-        for entry in self.bundle["entry"]:
-            resource = entry["resource"]
-            resource_type = resource["resourceType"]
-            resource_id = resource["id"]
-            evaluated_resources.append({"reference": f"{resource_type}/{resource_id}"})
+        evaluated_resources = [
+            {"reference": f"{entry['resource']['resourceType']}/{entry['resource']['id']}"}
+            for entry in self._bundle["entry"]
+        ]
 
         # Build population list
         populations = []
@@ -2902,7 +3464,7 @@ class FHIRBundleGenerator:
             "receivedTime": effective_datetime,
             "collection": {"collectedDateTime": effective_datetime}
         }
-        self._add_entry(specimen, specimen_id)
+        specimen_id = self._add_support_resource(specimen)
 
         # Add Device for the observation
         device = {
@@ -2918,7 +3480,7 @@ class FHIRBundleGenerator:
             },
             "patient": {"reference": f"Patient/{self.patient_id}"}
         }
-        self._add_entry(device, device_id)
+        device_id = self._add_support_resource(device)
 
         # Add Practitioner as performer
         performer = {
@@ -2928,7 +3490,7 @@ class FHIRBundleGenerator:
             "identifier": [{"system": CODE_SYSTEMS["NPI"], "value": "1234567893"}],
             "name": [{"family": "LabTech", "given": ["Sally"]}]
         }
-        self._add_entry(performer, performer_id)
+        performer_id = self._add_support_resource(performer)
 
         # Add ServiceRequest for basedOn
         service_request = {
@@ -2942,7 +3504,7 @@ class FHIRBundleGenerator:
             "encounter": {"reference": f"Encounter/{encounter_id}"},
             "authoredOn": effective_datetime
         }
-        self._add_entry(service_request, service_request_id)
+        service_request_id = self._add_support_resource(service_request)
 
         observation = {
             "resourceType": "Observation",
@@ -3075,7 +3637,7 @@ class FHIRBundleGenerator:
             family_name = "TestPatient"
 
         # Add General Practitioner
-        gp_id = "gp-001"
+        gp_id = self.GENERAL_PRACTITIONER_ID
         gp_practitioner = {
             "resourceType": "Practitioner",
             "id": gp_id,
@@ -3269,7 +3831,7 @@ class FHIRBundleGenerator:
             family_name = "TestPatient"
 
         # Add General Practitioner
-        gp_id = "gp-001"
+        gp_id = self.GENERAL_PRACTITIONER_ID
         gp_practitioner = {
             "resourceType": "Practitioner",
             "id": gp_id,
@@ -3734,14 +4296,63 @@ class FHIRBundleGenerator:
         """Return the FHIR Bundle dictionary"""
         return self.bundle
 
-    def save(self, output_path: str):
+    def write(self, fp, compact: bool = False):
+        """
+        Stream the bundle as JSON to a file-like object, one entry at a time.
+
+        The indented layout is byte-for-byte identical to
+        json.dump(bundle, fp, indent=2), which is what MADiE expects. Only one
+        entry is encoded at a time, so memory stays flat for large bundles.
+
+        Args:
+            fp: Writable text file-like object
+            compact: If True, write without indentation or whitespace
+        """
+        if compact:
+            item_sep, key_sep = ",", ":"
+            open_obj, close_obj = "{", "}"
+            open_entries, entry_sep, close_entries = "[", ",", "]"
+        else:
+            item_sep, key_sep = ",\n  ", ": "
+            open_obj, close_obj = "{\n  ", "\n}"
+            open_entries, entry_sep, close_entries = "[\n    ", ",\n    ", "\n  ]"
+
+        def encode(value, indent: str) -> str:
+            if compact:
+                return json_dumps(value, separators=(",", ":"))
+            # Nested values are re-indented to their depth in the bundle;
+            # JSON strings never contain raw newlines, so this is safe.
+            return json_dumps(value, indent=2).replace("\n", "\n" + indent)
+
+        if not self._bundle:
+            fp.write("{}")
+            return
+
+        fp.write(open_obj)
+        for i, (key, value) in enumerate(self._bundle.items()):
+            if i:
+                fp.write(item_sep)
+            fp.write(json_dumps(key) + key_sep)
+            if key != "entry" or not value:
+                fp.write(encode(value, "  "))
+                continue
+            fp.write(open_entries)
+            for j, entry in enumerate(value):
+                if j:
+                    fp.write(entry_sep)
+                fp.write(encode(entry, "    "))
+            fp.write(close_entries)
+        fp.write(close_obj)
+
+    def save(self, output_path: str, compact: bool = False):
         """
         Save the bundle to a JSON file.
 
         Args:
             output_path: Path to output file
+            compact: If True, write without indentation or whitespace
         """
         # Use Unix line endings (LF) to match MADiE expected format
         with open(output_path, 'w', newline='\n') as f:
-            json.dump(self.bundle, f, indent=2)
+            self.write(f, compact=compact)
         print(f"  Saved: {output_path}")
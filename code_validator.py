@@ -51,6 +51,11 @@ except ImportError:
     print("ERROR: requests library required. Install with: pip install requests")
     raise
 
+try:
+    from . import json_backend
+except ImportError:
+    import json_backend
+
 # Try to import VSACClient for optional VSAC integration
 try:
     from vsac_client import VSACClient, VSACError
@@ -237,7 +242,7 @@ class CodeValidator:
         if os.path.exists(cache_path):
             try:
                 with open(cache_path, 'r', encoding='utf-8') as f:
-                    cache = json.load(f)
+                    cache = json_backend.load(f)
                     # Check cache expiry
                     cache_time = cache.get("_timestamp", 0)
                     if time.time() - cache_time < self.CACHE_EXPIRY_DAYS * 86400:
@@ -252,7 +257,7 @@ class CodeValidator:
         try:
             self.cache["_timestamp"] = time.time()
             with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2)
+                json_backend.dump(self.cache, f, indent=2)
         except OSError as e:
             logger.warning(f"Failed to save cache: {e}")
 
@@ -798,7 +803,7 @@ def save_validation_report(summary: ValidationSummary, output_file: str):
     }
 
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
+        json_backend.dump(report, f, indent=2)
 
     print(f"Report saved to: {output_file}")
 
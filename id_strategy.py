@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ID Strategies
+
+Pluggable resource ID generation for FHIRBundleGenerator and MADiEExporter.
+
+- RandomIdStrategy: uuid4 IDs (the default, matches historical output)
+- DeterministicIdStrategy: uuid4-shaped IDs from a seeded random generator,
+  so two runs with the same seed produce identical bundles and exports
+
+Usage:
+    from fhir_test_utils import DeterministicIdStrategy, FHIRBundleGenerator
+
+    ids = DeterministicIdStrategy(seed=42)
+    gen = FHIRBundleGenerator("TestCaseName", id_strategy=ids)
+
+    # Or make it the default for every generator created in a block
+    with use_id_strategy(ids):
+        gen = build_test_case()
+
+    # Patient IDs can be injected the same way (MADiEExporter does this)
+    with use_patient_id("0f9d..."):
+        gen = build_test_case()
+"""
+
+import uuid
+import random
+import contextvars
+from contextlib import contextmanager
+
+
+class RandomIdStrategy:
+    """Generates random uuid4 resource IDs"""
+
+    def generate_id(self) -> str:
+        """Generate a new resource ID in UUID string form"""
+        return str(uuid.uuid4())
+
+    def derive(self, *labels: str) -> "RandomIdStrategy":
+        """Return a strategy for a named sub-scope (random IDs need no scoping)"""
+        return self
+
+
+class DeterministicIdStrategy:
+    """
+    Generates deterministic uuid4-shaped IDs from a seeded random generator.
+
+    The generator is seeded from the namespace, and each ID spreads its
+    output over all 122 random bits of a version 4 UUID, so the IDs (and
+    the 8-character prefixes used in synthetic references, e.g.
+    "cond-1a2b3c4d") are as unlikely to collide as uuid4 ones, without an
+    entropy syscall per ID.
+    """
+
+    def __init__(self, seed=0, namespace: str = None):
+        """
+        Initialize the strategy.
+
+        Args:
+            seed: Seed (int or str) the namespace is derived from
+            namespace: Explicit namespace key (overrides seed; used by derive)
+        """
+        self.seed = seed
+        self.namespace = namespace if namespace is not None else f"seed:{seed}"
+        # Seeding from a str is stable across runs (it is hashed with SHA-512)
+        self._rng = random.Random(self.namespace)
+
+    def generate_id(self) -> str:
+        """Generate the next resource ID in UUID string form"""
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def derive(self, *labels: str) -> "DeterministicIdStrategy":
+        """
+        Return an independent strategy for a named sub-scope.
+
+        IDs in a derived scope depend only on the seed and the labels, not on
+        how many IDs other scopes used, so editing one test case does not
+        shift the IDs of the others.
+
+        Args:
+            labels: Scope labels (e.g., series and title)
+        """
+        return DeterministicIdStrategy(
+            seed=self.seed,
+            namespace="/".join((self.namespace,) + tuple(str(label) for label in labels))
+        )
+
+
+_default_id_strategy = contextvars.ContextVar("default_id_strategy", default=RandomIdStrategy())
+
+
+def get_default_id_strategy():
+    """Return the ID strategy used by generators created without one"""
+    return _default_id_strategy.get()
+
+
+_default_patient_id = contextvars.ContextVar("default_patient_id", default=None)
+
+
+def get_default_patient_id():
+    """Return the patient ID used by generators created without one (or None)"""
+    return _default_patient_id.get()
+
+
+@contextmanager
+def use_id_strategy(strategy):
+    """
+    Make an ID strategy the default within a block.
+
+    Generators created inside the block without an explicit id_strategy use
+    this one. The default is scoped to the current thread/context.
+
+    Args:
+        strategy: RandomIdStrategy, DeterministicIdStrategy or compatible object
+    """
+    token = _default_id_strategy.set(strategy)
+    try:
+        yield strategy
+    finally:
+        _default_id_strategy.reset(token)
+
+
+@contextmanager
+def use_patient_id(patient_id: str):
+    """
+    Make a patient ID the default within a block.
+
+    Generators created inside the block without an explicit patient_id use
+    this one instead of minting a new ID, so a test case function builds
+    its bundle already keyed to the patient it will be exported as.
+
+    Args:
+        patient_id: Patient resource ID
+    """
+    token = _default_patient_id.set(patient_id)
+    try:
+        yield patient_id
+    finally:
+        _default_patient_id.reset(token)
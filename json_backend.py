@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON Backend
+
+Single serialization layer for bundles, caches and MADiE metadata.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Output is always byte-for-byte identical to the stdlib json
+module with the same arguments: whenever orjson cannot reproduce the stdlib
+layout exactly (custom separators, non-ASCII text, exponent-form floats,
+NaN/Infinity, integers beyond 64 bits, non-string keys), the stdlib encoder
+is used. Values the stdlib cannot serialize (datetimes, UUIDs, enums,
+dataclasses, ...) raise the stdlib TypeError with either backend.
+
+Usage:
+    from fhir_test_utils.json_backend import dumps, loads, set_json_backend
+
+    text = dumps(bundle, indent=2)
+    set_json_backend("stdlib")  # force the pure-Python backend
+"""
+
+import json
+import uuid
+import enum
+from typing import Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+JSON_BACKENDS = ("stdlib", "orjson")
+
+_backend = "orjson" if ORJSON_AVAILABLE else "stdlib"
+
+if ORJSON_AVAILABLE:
+    # Hand datetimes, dataclasses and subclasses of str/int/dict/list to
+    # _reject_non_json instead of letting orjson convert them
+    _ORJSON_PASSTHROUGH = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+                           | orjson.OPT_PASSTHROUGH_SUBCLASS)
+
+# Types of JSON values the stdlib encodes as is
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+# Types orjson always converts (there is no passthrough option for them)
+_ORJSON_NATIVE = (uuid.UUID, enum.Enum)
+
+
+def _reject_non_json(obj):
+    """orjson default hook: refuse anything the stdlib encoder would not accept as is"""
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_orjson_native_values(obj) -> bool:
+    """
+    Return True if obj contains a UUID or enum, which orjson converts even
+    with the passthrough options but the stdlib rejects.
+
+    Only called after orjson has serialized obj, so obj has no cycles.
+    """
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        values = container.values() if type(container) is dict else container
+        for value in values:
+            value_type = type(value)
+            if value_type is dict or value_type is list or value_type is tuple:
+                stack.append(value)
+            elif value_type not in _JSON_SCALARS and isinstance(value, _ORJSON_NATIVE):
+                return True
+    return False
+
+
+def _diverges_from_stdlib(data: bytes) -> bool:
+    """
+    Return True if orjson output may differ from the stdlib encoding.
+
+    orjson writes non-ASCII text and DEL (U+007F) unescaped, formats some
+    floats differently ("1e16" vs "1e+16", "0.00001" vs "1e-05") and writes
+    NaN/Infinity as null.
+    String contents are dropped first so that only structure, numbers and
+    literals remain to be checked.
+    """
+    if not data.isascii() or data[:1] not in b"{[" or b'\\"' in data or b"\x7f" in data:
+        return True
+    structure = b"".join(data.split(b'"')[::2])
+    structure = structure.replace(b"true", b"").replace(b"false", b"")
+    return (b"e" in structure or b"E" in structure
+            or b"null" in structure or b"0.0000" in structure)
+
+
+def get_json_backend() -> str:
+    """Return the name of the active JSON backend"""
+    return _backend
+
+
+def set_json_backend(name: str):
+    """
+    Select the JSON backend.
+
+    Args:
+        name: "stdlib" or "orjson"
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If "orjson" is requested but not installed
+    """
+    global _backend
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'. Expected one of: {', '.join(JSON_BACKENDS)}")
+    if name == "orjson" and not ORJSON_AVAILABLE:
+        raise ImportError("orjson is not installed. Install with: pip install orjson")
+    _backend = name
+
+
+def dumps(obj: Any, indent: int = None, separators: Tuple[str, str] = None) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation level (as in json.dumps)
+        separators: (item, key) separators (as in json.dumps)
+
+    Returns:
+        JSON text identical to json.dumps(obj, indent=indent, separators=separators)
+    """
+    if _backend == "orjson":
+        option = None
+        if indent == 2 and separators is None:
+            option = orjson.OPT_INDENT_2
+        elif indent is None and separators == (",", ":"):
+            option = 0
+
+        if option is not None:
+            try:
+                data = orjson.dumps(obj, default=_reject_non_json, option=option | _ORJSON_PASSTHROUGH)
+            except TypeError:
+                # Let the stdlib encode (or reject) it, with its own error
+                data = None
+            if data is not None and not _diverges_from_stdlib(data) \
+                    and not _has_orjson_native_values(obj):
+                return data.decode("ascii")
+
+    return json.dumps(obj, indent=indent, separators=separators)
+
+
+def dump(obj: Any, fp, indent: int = None, separators: Tuple[str, str] = None):
+    """
+    Serialize an object as JSON to a writable text file-like object.
+
+    Args:
+        obj: Object to serialize
+        fp: Writable text file-like object
+        indent: Indentation level (as in json.dump)
+        separators: (item, key) separators (as in json.dump)
+    """
+    fp.write(dumps(obj, indent=indent, separators=separators))
+
+
+def loads(text) -> Any:
+    """
+    Deserialize a JSON document from a str or bytes.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if _backend == "orjson":
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity and arbitrarily large
+            # integers; let it decide (and raise) for anything orjson rejects.
+            pass
+    return json.loads(text)
+
+
+def load(fp) -> Any:
+    """
+    Deserialize a JSON document from a readable file-like object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    return loads(fp.read())
@@ -10,14 +10,30 @@ Creates MADiE-compatible test case output structure including:
 - ZIP archive for import
 """
 
+import io
 import os
-import json
-import uuid
+import re
+import time
+import zlib
+import copy
+import heapq
+import pickle
+import marshal
+import cProfile
+import tracemalloc
+import hashlib
 import shutil
+import fnmatch
 import zipfile
-from typing import Dict, List, Any, Optional
+import argparse
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 
 from .bundle_generator import FHIRBundleGenerator
+from . import json_backend
+from .id_strategy import DeterministicIdStrategy, get_default_id_strategy, use_id_strategy, use_patient_id
 
 
 class MADiEExporter:
@@ -30,12 +46,26 @@ class MADiEExporter:
         exporter.export()
     """
 
+    # Written by incremental exports: (series, title) -> patientId/testCaseId
+    # and the content hash of each bundle. Not included in the ZIP.
+    EXPORT_MANIFEST = ".export_manifest.json"
+
+    # Written by profiled exports (see export(profile=True)). Not included
+    # in the ZIP; cProfile dumps go in EXPORT_PROFILE_DIR.
+    EXPORT_PROFILE = "export_profile.json"
+    EXPORT_PROFILE_DIR = "export_profiles"
+
+    # Test cases built ahead of the writer, on top of one per worker. Each
+    # holds a serialized bundle, so this caps export memory.
+    PIPELINE_DEPTH = 2
+
     def __init__(self,
                  measure_name: str,
                  version: str,
                  measure_url: str = None,
                  measurement_period_start: str = "2022-01-01",
-                 measurement_period_end: str = "2022-01-31"):
+                 measurement_period_end: str = "2022-01-31",
+                 id_strategy=None):
         """
         Initialize the MADiE exporter.
 
@@ -45,18 +75,22 @@ class MADiEExporter:
             measure_url: URL of the measure (auto-generated if not provided)
             measurement_period_start: Start of measurement period (YYYY-MM-DD)
             measurement_period_end: End of measurement period (YYYY-MM-DD)
+            id_strategy: Optional ID strategy for patient folders, testCaseIds and
+                         generator resources (e.g., DeterministicIdStrategy(seed=1)
+                         for reproducible exports); defaults to uuid4
         """
         self.measure_name = measure_name
         self.version = version
         self.measure_url = measure_url or f"https://madie.cms.gov/Measure/{measure_name}"
         self.measurement_period_start = measurement_period_start
         self.measurement_period_end = measurement_period_end
+        self.id_strategy = id_strategy or get_default_id_strategy()
 
         self.test_cases = []
 
-    def _generate_test_case_id(self) -> str:
+    def _generate_test_case_id(self, id_strategy=None) -> str:
         """Generate a MongoDB-style ObjectId (24 hex characters)"""
-        return uuid.uuid4().hex[:24]
+        return (id_strategy or self.id_strategy).generate_id().replace("-", "")[:24]
 
     def add_test_case(self,
                       generator_func,
@@ -68,7 +102,9 @@ class MADiEExporter:
         Add a test case to be exported.
 
         Args:
-            generator_func: Function that returns a FHIRBundleGenerator
+            generator_func: Function that returns a FHIRBundleGenerator. It is
+                            called inside use_patient_id/use_id_strategy, so
+                            generators it creates get the exported patient ID
             series: Test series name (e.g., "QualEncPass")
             title: Test title (e.g., "EncInpatient")
             description: Description of what this test case tests
@@ -112,31 +148,109 @@ class MADiEExporter:
 
         self.add_test_case(gen_func, series, title, description, expected_populations)
 
-    def export(self, output_dir: str = None, create_zip: bool = True) -> str:
+    def export(self,
+               output_dir: str = None,
+               create_zip: bool = True,
+               jobs: int = 1,
+               incremental: bool = False,
+               write_directory: bool = True,
+               compression_level: int = None,
+               max_archive_size: int = None,
+               max_in_flight: int = None,
+               profile: bool = False,
+               profile_slowest: int = 0):
         """
         Export all test cases to MADiE-compatible format.
 
+        Export is a pipeline: worker threads/processes generate each bundle,
+        set its patient ID, add the MeasureReport and serialize it, while the
+        calling thread writes (or compresses) finished bundles in order. At
+        most max_in_flight bundles exist at once, so memory stays flat however
+        many test cases are registered.
+
         Args:
             output_dir: Output directory path (auto-generated if not provided)
             create_zip: Whether to create a ZIP file
+            jobs: Number of worker processes for generating and writing test
+                  cases (None or 0 for one per CPU). The output layout, .madie
+                  and README order are the same as for a serial export.
+            incremental: Keep the existing output and rewrite only test cases
+                         whose bundle changed (see EXPORT_MANIFEST). Test cases
+                         keep their patientId and testCaseId across exports.
+                         The output always mirrors the registered test cases:
+                         cases from the previous export that are not
+                         registered now (e.g., outside a select() subset) are
+                         removed. An existing directory without a manifest
+                         (a non-incremental export) is replaced.
+            write_directory: Whether to write the unzipped directory. If False,
+                             bundles, README.txt and .madie are serialized
+                             straight into the ZIP (requires create_zip and
+                             cannot be combined with incremental).
+            compression_level: Deflate level 1-9, 0 to store entries uncompressed
+                               (fastest, for development loops), or None for
+                               the zlib default
+            max_archive_size: Split the ZIP into archives of at most this many
+                              bytes ({output_dir}-1.zip, -2.zip, ...), each with
+                              whole test cases and its own README.txt and .madie.
+                              Requires write_directory.
+            max_in_flight: Maximum number of test cases being built or waiting
+                           to be written (defaults to jobs + PIPELINE_DEPTH)
+            profile: Write EXPORT_PROFILE to the output directory (next to the
+                     ZIP, prefixed with its name, when write_directory is
+                     False) with, per test case, the generator function's wall
+                     time and peak traced memory (tracemalloc), entry count,
+                     serialized size and the time spent rewriting IDs,
+                     serializing and writing (which includes compression when
+                     streaming), plus the total ZIP time. Profiling slows the
+                     export down: test cases built in this process are built
+                     one at a time, between writes, so their memory peaks are
+                     their own.
+            profile_slowest: Also cProfile every generator function and keep
+                             the dumps of the N slowest in EXPORT_PROFILE_DIR
+                             (implies profile; view with pstats or snakeviz)
 
         Returns:
-            Path to the output directory (or ZIP file if create_zip=True)
+            Path to the output directory (or ZIP file if create_zip=True; or a
+            list of ZIP paths if max_archive_size is set)
+
+        Raises:
+            ValueError: If write_directory is False without create_zip or with
+                        incremental or max_archive_size, or if compression_level
+                        is not between 0 and 9
         """
+        if not write_directory and (not create_zip or incremental or max_archive_size):
+            raise ValueError("write_directory=False requires create_zip=True, "
+                             "incremental=False and no max_archive_size")
+        if compression_level is not None and not 0 <= compression_level <= 9:
+            raise ValueError(f"compression_level must be between 0 and 9 (got {compression_level})")
+
         if output_dir is None:
             output_dir = f"{self.measure_name}-v{self.version}-FHIR-TestCases"
 
         zip_file = f"{output_dir}.zip"
 
-        # Clean up old output
-        if os.path.exists(output_dir):
+        # Clean up old output (an incremental export updates it in place)
+        previous_cases = None
+        if incremental:
+            if os.path.exists(output_dir) and \
+                    not os.path.exists(os.path.join(output_dir, self.EXPORT_MANIFEST)):
+                # Without a manifest the old test case folders cannot be
+                # matched (or recognized as stale), so start over
+                print(f"Removing old directory (no export manifest): {output_dir}")
+                shutil.rmtree(output_dir)
+            previous_cases = self._load_export_manifest(output_dir)
+        elif os.path.exists(output_dir):
             print(f"Removing old directory: {output_dir}")
             shutil.rmtree(output_dir)
         if os.path.exists(zip_file):
             print(f"Removing old zip: {zip_file}")
             os.remove(zip_file)
+        for shard_file in _find_archive_shards(zip_file):
+            print(f"Removing old zip: {shard_file}")
+            os.remove(shard_file)
 
-        os.makedirs(output_dir, exist_ok=True)
+        if write_directory:
+            os.makedirs(output_dir, exist_ok=True)
 
         print("=" * 70)
         print(f"{self.measure_name} Test Case Export")
@@ -146,85 +260,388 @@ class MADiEExporter:
         print(f"Test Cases: {len(self.test_cases)}")
         print()
 
-        madie_metadata = []
+        if jobs is None or jobs < 1:
+            jobs = os.cpu_count() or 1
+        export_profile = None
+        if profile or profile_slowest > 0:
+            export_profile = _ExportProfile(jobs, profile_slowest)
+        if max_in_flight is None:
+            max_in_flight = jobs + self.PIPELINE_DEPTH
+        compression, compresslevel = _zip_compression(compression_level)
+
+        # Without a directory, every entry is written straight into the ZIP
+        archive = None
+        if not write_directory:
+            print(f"Streaming test cases into: {zip_file}")
+            archive = zipfile.ZipFile(zip_file, 'w', compression, compresslevel=compresslevel)
+
+        try:
+            results = self._export_pipeline(output_dir, self._export_tasks(previous_cases),
+                                            jobs, max_in_flight, archive, export_profile)
+            madie_metadata = [metadata for metadata, _ in results]
+
+            if incremental:
+                records = [record for _, record in results]
+                written = sum(1 for record in records if record.pop("written"))
+                self._remove_stale_test_cases(output_dir, previous_cases, records)
+                manifest_path = os.path.join(output_dir, self.EXPORT_MANIFEST)
+                with open(manifest_path, 'w', newline='\n') as f:
+                    json_backend.dump({"cases": records}, f, indent=2)
+                print(f"\n  Incremental export: {written} of {len(records)} test cases rewritten")
+
+            if archive is None:
+                # Generate README.txt
+                readme_path = os.path.join(output_dir, "README.txt")
+                self._create_readme(readme_path, madie_metadata)
+                print(f"\n  Created README: {readme_path}")
+
+                # Generate .madie metadata file
+                madie_path = os.path.join(output_dir, ".madie")
+                with open(madie_path, 'w', newline='\n') as f:
+                    json_backend.dump(madie_metadata, f)
+                print(f"  Created .madie: {madie_path}")
+            else:
+                with _open_text_entry(archive, "README.txt") as f:
+                    self._write_readme(f, madie_metadata)
+                with _open_text_entry(archive, ".madie") as f:
+                    json_backend.dump(madie_metadata, f)
+                print("\n  Added: README.txt, .madie")
+        finally:
+            if archive is not None:
+                archive.close()
+
+        # Print summary
+        self._print_summary(madie_metadata)
+
+        if archive is not None:
+            print(f"\n  Zip created: {zip_file}")
+            if export_profile is not None:
+                # There is no output directory: write the profile beside the ZIP
+                self._write_export_profile(os.path.dirname(zip_file) or os.curdir, export_profile,
+                                           prefix=f"{os.path.basename(output_dir)}.")
+            self._print_next_steps()
+            return zip_file
 
-        # Generate each test case
+        # Create zip file
+        result = output_dir
+        if create_zip:
+            zip_started = time.perf_counter()
+            archives = self._create_zip(output_dir, zip_file,
+                                        compression_level=compression_level,
+                                        jobs=jobs,
+                                        max_archive_size=max_archive_size,
+                                        metadata=madie_metadata)
+            if export_profile is not None:
+                export_profile.zip_seconds = time.perf_counter() - zip_started
+            for archive_path in archives:
+                print(f"\n  Zip created: {archive_path}")
+            result = archives if max_archive_size else zip_file
+
+        if export_profile is not None:
+            self._write_export_profile(output_dir, export_profile)
+        return result
+
+    def _export_tasks(self, previous_cases: Dict[Tuple[str, str, int], Dict[str, Any]] = None):
+        """
+        Yield (index, test case, occurrence, previous record) export tasks.
+
+        Each test case gets its own ID scope, so deterministic IDs depend only
+        on the seed and the case (not on the cases before it).
+        """
+        scope_counts = {}
         for i, tc in enumerate(self.test_cases, 1):
-            series = tc["series"]
-            title = tc["title"]
-            description = tc["description"]
-            expected_populations = tc["expected_populations"]
-            generator_func = tc["generator_func"]
-
-            print(f"[{i:2d}] Generating: {series}-{title}")
-
-            # Create UUID for test case directory - this will also be the patient ID
-            patient_id = str(uuid.uuid4())
-            test_case_id = self._generate_test_case_id()
-
-            # Create test case directory
-            test_case_dir = os.path.join(output_dir, patient_id)
-            os.makedirs(test_case_dir, exist_ok=True)
-
-            # Create generator with the patient_id matching the folder UUID
-            gen = FHIRBundleGenerator(f"{series}_{title}", patient_id=patient_id)
-
-            # Call the generator function to get a configured generator
-            source_gen = generator_func()
-
-            # Copy the bundle structure
-            gen.bundle = source_gen.bundle
-
-            # Update patient ID in all resources
-            self._update_patient_references(gen, patient_id, series, title)
-
-            # Add MeasureReport with expected population values
-            gen.patient_id = patient_id
-            gen.add_measure_report(
-                description=description,
-                measure_url=self.measure_url,
-                measurement_period_start=self.measurement_period_start,
-                measurement_period_end=self.measurement_period_end,
-                expected_populations=expected_populations
-            )
+            scope = (tc["series"], tc["title"])
+            scope_counts[scope] = scope_counts.get(scope, 0) + 1
+            previous = None
+            if previous_cases is not None:
+                previous = previous_cases.get(scope + (scope_counts[scope],), {})
+            yield i, tc, scope_counts[scope], previous
+
+    def _export_pipeline(self,
+                         output_dir: str,
+                         tasks,
+                         jobs: int,
+                         max_in_flight: int,
+                         archive: zipfile.ZipFile = None,
+                         export_profile: "_ExportProfile" = None) -> List[Tuple[Dict[str, str], Optional[Dict[str, Any]]]]:
+        """
+        Build test cases on workers and write them in registration order.
+
+        With jobs > 1, test cases are built in a process pool; those whose
+        generator_func cannot be sent to another process (lambdas, closures
+        such as add_test_case_from_generator) are built on a thread instead.
+        Building stops whenever max_in_flight test cases are waiting to be
+        written (backpressure), so a slow disk or ZIP does not let finished
+        bundles pile up in memory. If export_profile is given, each test case
+        is profiled and its timings are added to it. tracemalloc is then
+        started once for the whole export, and test cases built in this
+        process are built synchronously (not on the build thread), because
+        tracemalloc's peak covers every thread of a process; each worker
+        process builds one test case at a time anyway.
 
-            # Filename format: MeasureName-Version-SeriesTitle.json
-            filename = f"{self.measure_name}-v{self.version}-{series}{title}.json"
-            filepath = os.path.join(test_case_dir, filename)
+        Returns:
+            List of (.madie metadata entry, manifest record or None)
+        """
+        # Workers only need the exporter settings, not the registered cases
+        worker_exporter = copy.copy(self)
+        worker_exporter.test_cases = []
+        profile = export_profile is not None
+        cprofile = profile and export_profile.slowest > 0
+
+        with ExitStack() as stack:
+            if profile and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                stack.callback(tracemalloc.stop)
+            thread_pool = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+            process_pool = None
+            if jobs > 1 and len(self.test_cases) > 1:
+                process_pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+
+            def submit(task):
+                if process_pool is not None and _is_picklable(task[1]["generator_func"]):
+                    return process_pool.submit(_build_test_case_worker, worker_exporter, task, profile, cprofile)
+                if profile:
+                    return _call_now(self._build_test_case, *task, profile=profile, cprofile=cprofile)
+                return thread_pool.submit(self._build_test_case, *task, profile=profile, cprofile=cprofile)
+
+            results = []
+            for task, built in _pipelined(tasks, submit, max_in_flight):
+                write_started = time.perf_counter()
+                results.append(self._write_test_case(output_dir, built, previous=task[3], archive=archive))
+                if profile:
+                    export_profile.add(built, time.perf_counter() - write_started)
+            return results
+
+    def _build_test_case(self,
+                         index: int,
+                         tc: Dict[str, Any],
+                         occurrence: int,
+                         previous: Dict[str, Any] = None,
+                         profile: bool = False,
+                         cprofile: bool = False) -> Dict[str, Any]:
+        """
+        Generate, finalize and serialize one test case (the worker stage).
 
-            # Save test case
-            gen.save(filepath)
+        Args:
+            index: 1-based position of the test case (for progress output)
+            tc: Registered test case (see add_test_case)
+            occurrence: How many cases with this series/title precede it, plus one
+            previous: For incremental exports, the case's manifest record from
+                      the last export ({} for a new case); None otherwise
+            profile: Record timings and memory use ("profile")
+            cprofile: Also cProfile the generator function ("cprofile", the
+                      marshalled pstats data)
 
-            # Add to .madie metadata
-            madie_metadata.append({
+        Returns:
+            Dict with the .madie metadata, manifest fields, file name and
+            serialized bundle ("content")
+        """
+        series = tc["series"]
+        title = tc["title"]
+        description = tc["description"]
+        expected_populations = tc["expected_populations"]
+        generator_func = tc["generator_func"]
+
+        print(f"[{index:2d}] Generating: {series}-{title}")
+
+        case_ids = self.id_strategy.derive(series, title, occurrence)
+
+        # Create UUID for test case directory - this will also be the patient ID
+        if previous and previous.get("patientId"):
+            patient_id = previous["patientId"]
+            test_case_id = previous["testCaseId"]
+        else:
+            patient_id = case_ids.generate_id()
+            test_case_id = self._generate_test_case_id(case_ids)
+
+        # Incremental exports need identical bundles for unchanged scenarios,
+        # so resource IDs are derived from the (stable) patient ID
+        if previous is not None:
+            case_ids = DeterministicIdStrategy(namespace=f"test-case:{patient_id}")
+
+        # Call the generator function to get a configured generator; the
+        # bundle is built with the target patient ID and ID strategy
+        timings = {} if profile else None
+        cprofile_stats = None
+        with use_id_strategy(case_ids), use_patient_id(patient_id):
+            if timings is None:
+                gen = generator_func()
+            else:
+                gen, cprofile_stats = _profiled_call(generator_func, timings, cprofile)
+
+        # Set the patient name (and rewrite references if the generator
+        # function chose its own patient ID)
+        rewrite_started = time.perf_counter()
+        self._update_patient_references(gen, patient_id, series, title)
+        rewrite_done = time.perf_counter()
+
+        # Add MeasureReport with expected population values
+        gen.patient_id = patient_id
+        gen.add_measure_report(
+            description=description,
+            measure_url=self.measure_url,
+            measurement_period_start=self.measurement_period_start,
+            measurement_period_end=self.measurement_period_end,
+            expected_populations=expected_populations
+        )
+
+        serialize_started = time.perf_counter()
+        buffer = io.StringIO()
+        gen.write(buffer)
+        content = buffer.getvalue()
+        serialize_done = time.perf_counter()
+
+        built = {
+            # Metadata for .madie
+            "metadata": {
                 "testCaseId": test_case_id,
                 "patientId": patient_id,
                 "title": f"{series}{title}",
                 "series": "",  # Empty string matches MADiE export format
                 "description": description
-            })
-
-        # Generate README.txt
-        readme_path = os.path.join(output_dir, "README.txt")
-        self._create_readme(readme_path, madie_metadata)
-        print(f"\n  Created README: {readme_path}")
-
-        # Generate .madie metadata file
-        madie_path = os.path.join(output_dir, ".madie")
-        with open(madie_path, 'w', newline='\n') as f:
-            json.dump(madie_metadata, f)
-        print(f"  Created .madie: {madie_path}")
+            },
+            "series": series,
+            "title": title,
+            "occurrence": occurrence,
+            # Filename format: MeasureName-Version-SeriesTitle.json
+            "file": f"{self.measure_name}-v{self.version}-{series}{title}.json",
+            "content": content
+        }
+        if timings is not None:
+            built["profile"] = {
+                "index": index,
+                "title": f"{series}{title}",
+                "patientId": patient_id,
+                **timings,
+                "entries": len(gen.bundle.get("entry", [])),
+                "bytes": len(content.encode("utf-8")),
+                "rewrite_seconds": rewrite_done - rewrite_started,
+                "serialize_seconds": serialize_done - serialize_started
+            }
+            built["cprofile"] = cprofile_stats
+        return built
+
+    def _write_test_case(self,
+                         output_dir: str,
+                         built: Dict[str, Any],
+                         previous: Dict[str, Any] = None,
+                         archive=None) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+        """
+        Write one built test case (the writer stage).
 
-        # Print summary
-        self._print_summary(madie_metadata)
+        Args:
+            output_dir: Export directory
+            built: Result of _build_test_case
+            previous: For incremental exports, the case's manifest record from
+                      the last export ({} for a new case); None otherwise
+            archive: ZipFile to write the bundle into instead of the output
+                     directory
 
-        # Create zip file
-        if create_zip:
-            self._create_zip(output_dir, zip_file)
-            print(f"\n  Zip created: {zip_file}")
-            return zip_file
+        Returns:
+            Tuple of (.madie metadata entry, manifest record or None)
+        """
+        metadata = built["metadata"]
+        patient_id = metadata["patientId"]
+        filename = built["file"]
+        content = built["content"]
+
+        # Save test case
+        if archive is not None:
+            arcname = f"{patient_id}/{filename}"
+            with _open_text_entry(archive, arcname) as f:
+                f.write(content)
+            print(f"  Added: {arcname}")
+            return metadata, None
+
+        # Create test case directory
+        test_case_dir = os.path.join(output_dir, patient_id)
+        os.makedirs(test_case_dir, exist_ok=True)
+        filepath = os.path.join(test_case_dir, filename)
+
+        if previous is None:
+            # Use Unix line endings (LF) to match MADiE expected format
+            with open(filepath, 'w', newline='\n') as f:
+                f.write(content)
+            print(f"  Saved: {filepath}")
+            return metadata, None
+
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        unchanged = (previous.get("hash") == content_hash and
+                     previous.get("file") == filename and
+                     os.path.exists(filepath))
+        if unchanged:
+            print(f"  Unchanged: {filepath}")
+        else:
+            if previous.get("file") and previous["file"] != filename:
+                old_path = os.path.join(test_case_dir, previous["file"])
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+            with open(filepath, 'w', newline='\n') as f:
+                f.write(content)
+            print(f"  Saved: {filepath}")
+
+        record = {
+            "series": built["series"],
+            "title": built["title"],
+            "occurrence": built["occurrence"],
+            "patientId": patient_id,
+            "testCaseId": metadata["testCaseId"],
+            "file": filename,
+            "hash": content_hash,
+            "written": not unchanged
+        }
+        return metadata, record
+
+    def _load_export_manifest(self, output_dir: str) -> Dict[Tuple[str, str, int], Dict[str, Any]]:
+        """
+        Load the incremental export manifest of a previous export.
 
-        return output_dir
+        Returns:
+            Dict of (series, title, occurrence) -> manifest record (empty if
+            there is no previous incremental export)
+        """
+        manifest_path = os.path.join(output_dir, self.EXPORT_MANIFEST)
+        if not os.path.exists(manifest_path):
+            return {}
+        with open(manifest_path, 'r') as f:
+            manifest = json_backend.load(f)
+        return {(record["series"], record["title"], record["occurrence"]): record
+                for record in manifest.get("cases", [])}
+
+    def _write_export_profile(self, output_dir: str, export_profile: "_ExportProfile",
+                              prefix: str = ""):
+        """Write EXPORT_PROFILE (and cProfile dumps) to output_dir, names prefixed with prefix"""
+        profile_dir = os.path.join(output_dir, prefix + self.EXPORT_PROFILE_DIR)
+        if os.path.exists(profile_dir):
+            shutil.rmtree(profile_dir)
+
+        profiled = export_profile.slowest_profiles()
+        if profiled:
+            os.makedirs(profile_dir)
+        for record, stats in profiled:
+            dump_name = f"{record['index']:04d}-{record['title']}.prof"
+            with open(os.path.join(profile_dir, dump_name), 'wb') as f:
+                f.write(stats)
+            record["cprofile"] = f"{prefix}{self.EXPORT_PROFILE_DIR}/{dump_name}"
+
+        profile_path = os.path.join(output_dir, prefix + self.EXPORT_PROFILE)
+        with open(profile_path, 'w', newline='\n') as f:
+            json_backend.dump(export_profile.summary(), f, indent=2)
+        print(f"  Created export profile: {profile_path}")
+
+    def _remove_stale_test_cases(self,
+                                 output_dir: str,
+                                 previous_cases: Dict[Tuple[str, str, int], Dict[str, Any]],
+                                 records: List[Dict[str, Any]]):
+        """Delete directories of test cases that are no longer registered"""
+        current = {record["patientId"] for record in records}
+        for record in previous_cases.values():
+            if record["patientId"] not in current:
+                stale_dir = os.path.join(output_dir, record["patientId"])
+                if os.path.isdir(stale_dir):
+                    print(f"  Removing stale test case: {record['series']}-{record['title']}")
+                    shutil.rmtree(stale_dir)
 
     def _update_patient_references(self,
                                     gen: FHIRBundleGenerator,
@@ -232,42 +649,34 @@ class MADiEExporter:
                                     series: str,
                                     title: str):
         """Update all patient references in the bundle to use the new patient ID"""
-        for entry in gen.bundle["entry"]:
-            resource = entry["resource"]
-
-            # Update Patient resource
-            if resource["resourceType"] == "Patient":
-                resource["id"] = patient_id
-                entry["fullUrl"] = f"https://madie.cms.gov/Patient/{patient_id}"
-                entry["request"]["url"] = f"Patient/{patient_id}"
-
-                # Update identifier value
-                if "identifier" in resource:
-                    for identifier in resource["identifier"]:
-                        identifier["value"] = patient_id
+        gen.remap_ids({f"Patient/{patient['id']}": patient_id
+                       for patient in gen.get_by_type("Patient") if patient["id"] != patient_id})
 
-                # Update name to use series/title format
-                if "name" in resource:
-                    resource["name"] = [{"family": series, "given": [title]}]
+        patient = gen.edit_resource("Patient", patient_id)
+        if patient is None:
+            return
 
-            # Update references to patient
-            elif "subject" in resource:
-                resource["subject"]["reference"] = f"Patient/{patient_id}"
+        # Update identifier value
+        if "identifier" in patient:
+            for identifier in patient["identifier"]:
+                identifier["value"] = patient_id
 
-            if "beneficiary" in resource:
-                resource["beneficiary"]["reference"] = f"Patient/{patient_id}"
-
-            if "patient" in resource and isinstance(resource["patient"], dict):
-                resource["patient"]["reference"] = f"Patient/{patient_id}"
+        # Update name to use series/title format
+        if "name" in patient:
+            patient["name"] = [{"family": series, "given": [title]}]
 
     def _create_readme(self, filepath: str, metadata: List[Dict]):
         """Create README.txt with UUID to name mapping"""
         with open(filepath, 'w', newline='\n') as f:
-            f.write("The purpose of this file is to allow users to view the mapping of test case names to their test case UUIDs.\n")
-            f.write("In order to find a specific test case file in the export, first locate the test case name in this document\n")
-            f.write("and then use the associated UUID to find the name of the folder in the export.\n\n")
-            for i, tc in enumerate(metadata, 1):
-                f.write(f"Case # {i} - {tc['patientId']} = {tc['series']}-{tc['title']}\n")
+            self._write_readme(f, metadata)
+
+    def _write_readme(self, f, metadata: List[Dict]):
+        """Write the README.txt UUID to name mapping to a text file object"""
+        f.write("The purpose of this file is to allow users to view the mapping of test case names to their test case UUIDs.\n")
+        f.write("In order to find a specific test case file in the export, first locate the test case name in this document\n")
+        f.write("and then use the associated UUID to find the name of the folder in the export.\n\n")
+        for i, tc in enumerate(metadata, 1):
+            f.write(f"Case # {i} - {tc['patientId']} = {tc['series']}-{tc['title']}\n")
 
     def _print_summary(self, metadata: List[Dict]):
         """Print summary of generated test cases"""
@@ -300,37 +709,416 @@ class MADiEExporter:
         for series, titles in sorted(series_groups.items()):
             print(f"\n  {series}: {len(titles)} test cases")
 
-    def _create_zip(self, source_dir: str, zip_path: str):
-        """Create ZIP file with files at root level (not inside parent folder)"""
+    def _create_zip(self,
+                    source_dir: str,
+                    zip_path: str,
+                    compression_level: int = None,
+                    jobs: int = 1,
+                    max_archive_size: int = None,
+                    metadata: List[Dict] = None) -> List[str]:
+        """
+        Create ZIP file(s) with files at root level (not inside parent folder).
+
+        Entries are compressed before any archive is written; entries of at
+        least PARALLEL_COMPRESS_MIN_SIZE bytes are compressed in worker
+        processes when jobs > 1, and all entries are then added to the archive
+        already compressed. Knowing the compressed sizes up front is also what
+        allows packing test cases into archives under max_archive_size. The
+        compressed entries are held in memory until they are written.
+
+        Args:
+            source_dir: Export directory
+            zip_path: ZIP file path (shards are named with -1, -2, ... suffixes)
+            compression_level: Deflate level 1-9, 0 for stored, None for default
+            jobs: Number of worker processes for compression
+            max_archive_size: Maximum archive size in bytes (None for one archive)
+            metadata: .madie metadata of the export (required for sharding)
+
+        Returns:
+            List of ZIP file paths written
+        """
         print(f"\nCreating zip file: {zip_path}")
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    # Get path relative to source_dir (not including source_dir itself)
-                    rel_path = os.path.relpath(file_path, source_dir)
-                    zipf.write(file_path, rel_path)
-                    print(f"  Added: {rel_path}")
+        # (archive name, file path) in directory walk order
+        members = []
+        for root, dirs, files in os.walk(source_dir):
+            if root == source_dir:
+                dirs[:] = [d for d in dirs if d != self.EXPORT_PROFILE_DIR]
+            for file in files:
+                if root == source_dir and file in (self.EXPORT_MANIFEST, self.EXPORT_PROFILE):
+                    continue
+                file_path = os.path.join(root, file)
+                # Get path relative to source_dir (not including source_dir itself)
+                rel_path = os.path.relpath(file_path, source_dir)
+                members.append((rel_path, file_path))
+
+        compressed = _compress_files([file_path for _, file_path in members], compression_level, jobs)
+        entries = [(zipfile.ZipInfo.from_file(file_path, rel_path), member)
+                   for (rel_path, file_path), member in zip(members, compressed)]
+
+        if max_archive_size is None:
+            archives = [(zip_path, entries)]
+        else:
+            archives = self._shard_entries(zip_path, entries, metadata, compression_level, max_archive_size)
+
+        for archive_path, archive_entries in archives:
+            with _PrecompressedZipWriter(archive_path) as zipf:
+                for zinfo, member in archive_entries:
+                    zipf.write(zinfo, member)
+                    print(f"  Added: {zinfo.filename}")
+
+        self._print_next_steps()
+        return [archive_path for archive_path, _ in archives]
+
+    def _shard_entries(self,
+                       zip_path: str,
+                       entries: List[Tuple[zipfile.ZipInfo, Tuple]],
+                       metadata: List[Dict],
+                       compression_level: int,
+                       max_archive_size: int) -> List[Tuple[str, List]]:
+        """
+        Pack test cases into archives of at most max_archive_size bytes.
+
+        Test cases are never split across archives, and each archive gets a
+        README.txt and .madie listing only its own test cases. A test case
+        that is larger than max_archive_size on its own gets an archive to
+        itself.
 
+        Args:
+            entries: (ZipInfo, compressed member) of each file, see _compress_bytes
+
+        Returns:
+            List of (archive path, entries) pairs
+        """
+        def entry_size(zinfo, member):
+            # Local header, central directory record and data (no zip64 extras)
+            return 30 + 46 + 2 * len(zinfo.filename.encode("utf-8")) + len(member[3])
+
+        case_entries = {}
+        for zinfo, member in entries:
+            case_dir, sep, _ = zinfo.filename.replace(os.sep, "/").partition("/")
+            if sep:
+                case_entries.setdefault(case_dir, []).append((zinfo, member))
+
+        def index_entries(cases):
+            readme = io.StringIO()
+            self._write_readme(readme, cases)
+            texts = (("README.txt", readme.getvalue()), (".madie", json_backend.dumps(cases)))
+            result = []
+            for name, text in texts:
+                zinfo = zipfile.ZipInfo(name, time.localtime()[:6])
+                zinfo.external_attr = 0o600 << 16
+                result.append((zinfo, _compress_bytes(text.encode("utf-8"), compression_level)))
+            return result
+
+        # README.txt and .madie for all cases bound those of any shard
+        reserve = 22 + sum(entry_size(*entry) for entry in index_entries(metadata))
+
+        shards = []
+        current, current_size = [], reserve
+        for tc in metadata:
+            size = sum(entry_size(*entry) for entry in case_entries.get(tc["patientId"], []))
+            if current and current_size + size > max_archive_size:
+                shards.append(current)
+                current, current_size = [], reserve
+            if reserve + size > max_archive_size:
+                print(f"  Warning: test case {tc['title']} alone exceeds max_archive_size")
+            current.append(tc)
+            current_size += size
+        if current or not shards:
+            shards.append(current)
+
+        base = zip_path[:-len(".zip")] if zip_path.endswith(".zip") else zip_path
+        archives = []
+        for number, cases in enumerate(shards, 1):
+            archive_path = zip_path if len(shards) == 1 else f"{base}-{number}.zip"
+            archive_entries = []
+            for tc in cases:
+                archive_entries.extend(case_entries.get(tc["patientId"], []))
+            archive_entries.extend(index_entries(cases))
+            archives.append((archive_path, archive_entries))
+        return archives
+
+    def _print_next_steps(self):
+        """Print what to do with the exported ZIP file"""
         print(f"\nNext steps:")
         print("1. Import the zip file into MADiE")
         print("2. Run measure execution")
         print("3. Verify each test case passes/fails as expected")
 
 
+# Entries smaller than this are compressed in the parent process; sending
+# them to a worker costs more than compressing them
+PARALLEL_COMPRESS_MIN_SIZE = 64 * 1024
+
+
+def _zip_compression(compression_level: int = None) -> Tuple[int, Optional[int]]:
+    """Map a compression level to a (zipfile compression method, compresslevel) pair"""
+    if compression_level == 0:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, compression_level
+
+
+def _compress_bytes(data: bytes, compression_level: int = None) -> Tuple[int, int, int, bytes]:
+    """
+    Compress data for a ZIP entry.
+
+    Returns:
+        Tuple of (compression method, CRC-32, uncompressed size, compressed data)
+    """
+    compression, level = _zip_compression(compression_level)
+    crc = zlib.crc32(data)
+    if compression == zipfile.ZIP_STORED:
+        return compression, crc, len(data), data
+    # Raw deflate stream (no zlib header), as zipfile writes it
+    compressor = zlib.compressobj(-1 if level is None else level, zlib.DEFLATED, -15)
+    return compression, crc, len(data), compressor.compress(data) + compressor.flush()
+
+
+def _compress_file(file_path: str, compression_level: int = None) -> Tuple[int, int, int, bytes]:
+    """Read and compress one file (worker process entry point)"""
+    with open(file_path, 'rb') as f:
+        return _compress_bytes(f.read(), compression_level)
+
+
+def _compress_files(file_paths: List[str], compression_level: int = None, jobs: int = 1) -> List[Tuple]:
+    """Compress files, sending the large ones to a process pool when jobs > 1"""
+    results = [None] * len(file_paths)
+    large = []
+    for position, file_path in enumerate(file_paths):
+        if jobs > 1 and os.path.getsize(file_path) >= PARALLEL_COMPRESS_MIN_SIZE:
+            large.append(position)
+        else:
+            results[position] = _compress_file(file_path, compression_level)
+
+    if large:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            compressed = pool.map(_compress_file,
+                                  [file_paths[position] for position in large],
+                                  [compression_level] * len(large))
+            for position, member in zip(large, compressed):
+                results[position] = member
+    return results
+
+
+class _PrecompressedZipWriter:
+    """
+    Writes a ZIP archive from entries that were compressed beforehand.
+
+    zipfile cannot add compressed data as is, so each entry's data goes
+    through ZipFile.open(zinfo, 'w') as a stored entry (no second
+    compression), and the entry's local header is then rewritten with its
+    real compression method, CRC and size. The central directory is written
+    by ZipFile.close() from the same ZipInfo.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'w+b')
+        self._zipf = zipfile.ZipFile(self._file, 'w')
+
+    def write(self, zinfo: zipfile.ZipInfo, member: Tuple[int, int, int, bytes]):
+        """Add an entry (see _compress_bytes for member)"""
+        compression, crc, file_size, data = member
+        # The header is rewritten in place, so it needs the same (zip64) layout
+        zip64 = max(file_size, len(data)) * 1.05 > zipfile.ZIP64_LIMIT
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.file_size = len(data)
+        with self._zipf.open(zinfo, 'w', force_zip64=zip64) as f:
+            f.write(data)
+
+        zinfo.compress_type = compression
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        end = self._file.tell()
+        self._file.seek(zinfo.header_offset)
+        self._file.write(zinfo.FileHeader(zip64))
+        self._file.seek(end)
+
+    def close(self):
+        """Write the central directory and close the file"""
+        try:
+            self._zipf.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _find_archive_shards(zip_path: str) -> List[str]:
+    """Return existing shard archives ({base}-1.zip, ...) of a ZIP path"""
+    directory, name = os.path.split(zip_path)
+    base = name[:-len(".zip")] if name.endswith(".zip") else name
+    pattern = re.compile(rf"{re.escape(base)}-\d+\.zip")
+    try:
+        names = os.listdir(directory or ".")
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, candidate) for candidate in sorted(names) if pattern.fullmatch(candidate)]
+
+
+def _pipelined(tasks, submit, depth: int):
+    """
+    Yield (task, result) for each task in order, with at most depth in flight.
+
+    submit(task) starts a task and returns a Future. A new task is only
+    started once the consumer has taken an earlier result, so the consumer
+    (the next stage) applies backpressure to submit (the previous one).
+    """
+    in_flight = deque()
+    for task in tasks:
+        if len(in_flight) >= max(depth, 1):
+            pending_task, future = in_flight.popleft()
+            yield pending_task, future.result()
+        in_flight.append((task, submit(task)))
+    while in_flight:
+        pending_task, future = in_flight.popleft()
+        yield pending_task, future.result()
+
+
+def _is_picklable(value) -> bool:
+    """Whether a value can be sent to a worker process"""
+    try:
+        pickle.dumps(value)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+@contextmanager
+def _open_text_entry(archive, name: str):
+    """Open a ZIP entry for writing UTF-8 text with Unix line endings"""
+    with archive.open(name, 'w') as raw:
+        f = io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
+        try:
+            yield f
+        finally:
+            f.flush()
+            f.detach()
+
+
+def _build_test_case_worker(exporter: MADiEExporter,
+                            task: Tuple,
+                            profile: bool = False,
+                            cprofile: bool = False) -> Dict[str, Any]:
+    """Worker process entry point for MADiEExporter._export_pipeline"""
+    return exporter._build_test_case(*task, profile=profile, cprofile=cprofile)
+
+
+def _call_now(func, *args, **kwargs) -> Future:
+    """Call func in the current thread and return its outcome as a completed Future"""
+    future = Future()
+    try:
+        future.set_result(func(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _profiled_call(func, timings: Dict[str, Any], cprofile: bool = False):
+    """
+    Call func, recording its wall time and peak traced memory in timings.
+
+    tracemalloc is process-wide, so calls must not overlap (or run alongside
+    other work) within a process. It is started on first use and left
+    running; the exporter starts it for the whole export in its own process.
+
+    Returns:
+        Tuple of (func's result, marshalled cProfile stats or None)
+    """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile() if cprofile else None
+    started = time.perf_counter()
+    try:
+        result = profiler.runcall(func) if profiler is not None else func()
+    finally:
+        timings["generator_seconds"] = time.perf_counter() - started
+        timings["generator_peak_bytes"] = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+
+    stats = None
+    if profiler is not None:
+        # Same format as Profile.dump_stats, so pstats.Stats can load it
+        profiler.create_stats()
+        stats = marshal.dumps(profiler.stats)
+    return result, stats
+
+
+class _ExportProfile:
+    """Per-test-case timings of a profiled export (written as EXPORT_PROFILE)"""
+
+    def __init__(self, jobs: int, slowest: int = 0):
+        self.jobs = jobs
+        self.slowest = slowest
+        self.started = time.perf_counter()
+        self.zip_seconds = None
+        self.test_cases = []
+        # Min-heap of (generator seconds, index, record, stats): the N slowest
+        self._slowest = []
+
+    def add(self, built: Dict[str, Any], write_seconds: float):
+        """Add a built test case's timings (and keep its cProfile if among the slowest)"""
+        record = dict(built["profile"], write_seconds=write_seconds)
+        self.test_cases.append(record)
+        stats = built.get("cprofile")
+        if stats is not None and self.slowest > 0:
+            item = (record["generator_seconds"], record["index"], record, stats)
+            if len(self._slowest) < self.slowest:
+                heapq.heappush(self._slowest, item)
+            else:
+                heapq.heappushpop(self._slowest, item)
+
+    def slowest_profiles(self) -> List[Tuple[Dict[str, Any], bytes]]:
+        """(record, marshalled stats) of the slowest generator functions, slowest first"""
+        return [(record, stats) for _, _, record, stats in sorted(self._slowest, reverse=True)]
+
+    def summary(self) -> Dict[str, Any]:
+        """EXPORT_PROFILE content"""
+        return {
+            "jobs": self.jobs,
+            "total_seconds": time.perf_counter() - self.started,
+            "zip_seconds": self.zip_seconds,
+            "test_cases": self.test_cases
+        }
+
+
 class TestCaseRegistry:
     """
     Registry for organizing test cases by category.
 
+    Test cases can be added explicitly or registered with the test_case
+    decorator when a protocol module is imported; generator functions are
+    only called when the exporter builds the selected test cases.
+
     Usage:
-        registry = TestCaseRegistry()
+        registry = TestCaseRegistry(protocol="sepsis")
+
+        @registry.test_case("SCO", "PositiveBasic", "Community-onset sepsis",
+                            expected_populations={"initialPopulation": 1},
+                            tags=["sco", "lactate"])
+        def create_sco_positive_basic():
+            ...
+
         registry.add("QualEncTypePass", "EncInpatient", "Tests inpatient encounter", gen_func, {"initialPopulation": 1})
         exporter = MADiEExporter("MeasureName", "1.0.0")
-        registry.register_all(exporter)
+        registry.select("SCO*", tags=["lactate"]).register_all(exporter)
     """
 
-    def __init__(self):
+    def __init__(self, protocol: str = None):
+        """
+        Initialize the registry.
+
+        Args:
+            protocol: Protocol name recorded on the test cases added to it
+                      (e.g., "sepsis"), for select(protocol=...)
+        """
+        self.protocol = protocol
         self.test_cases = []
 
     def add(self,
@@ -338,7 +1126,9 @@ class TestCaseRegistry:
             title: str,
             description: str,
             generator_func,
-            expected_populations: Dict[str, int] = None):
+            expected_populations: Dict[str, int] = None,
+            tags: List[str] = (),
+            protocol: str = None):
         """
         Add a test case to the registry.
 
@@ -348,15 +1138,96 @@ class TestCaseRegistry:
             description: Description
             generator_func: Function that returns FHIRBundleGenerator
             expected_populations: Expected population counts
+            tags: Tags for select() (e.g., ["boundary"])
+            protocol: Protocol name (defaults to the registry's)
         """
         self.test_cases.append({
             "series": series,
             "title": title,
             "description": description,
             "generator_func": generator_func,
-            "expected_populations": expected_populations
+            "expected_populations": expected_populations,
+            "tags": tuple(tags),
+            "protocol": protocol or self.protocol
         })
 
+    def test_case(self,
+                  series: str,
+                  title: str,
+                  description: str = None,
+                  expected_populations: Dict[str, int] = None,
+                  tags: List[str] = ()):
+        """
+        Decorator that registers a generator function without calling it.
+
+        Args:
+            series: Test series name
+            title: Test title
+            description: Description (defaults to the first line of the
+                         function's docstring)
+            expected_populations: Expected population counts
+            tags: Tags for select()
+
+        Returns:
+            Decorator returning the function unchanged
+        """
+        def decorator(generator_func):
+            case_description = description
+            if case_description is None:
+                case_description = (generator_func.__doc__ or "").strip().split("\n")[0]
+            self.add(series, title, case_description, generator_func, expected_populations, tags)
+            return generator_func
+        return decorator
+
+    def select(self,
+               patterns: List[str] = None,
+               tags: List[str] = None,
+               protocol: str = None) -> "TestCaseRegistry":
+        """
+        Select a subset of the test cases, in registration order.
+
+        Args:
+            patterns: Glob pattern(s), matched case-insensitively against the
+                      title, "{series}{title}", "{series}-{title}" and the
+                      generator function name (e.g., "SCO*", "*Boundary")
+            tags: Keep test cases with at least one of these tags
+            protocol: Keep test cases of this protocol (or list of protocols)
+
+        Returns:
+            New TestCaseRegistry with the selected test cases (all of them
+            if no criteria are given). Note that an incremental export of a
+            selection removes the previously exported cases it leaves out.
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        if isinstance(tags, str):
+            tags = [tags]
+        protocols = [protocol] if isinstance(protocol, str) else protocol
+        patterns = [pattern.lower() for pattern in patterns or []]
+
+        selected = TestCaseRegistry(self.protocol)
+        for tc in self.test_cases:
+            if patterns:
+                names = (tc["title"], f"{tc['series']}{tc['title']}", f"{tc['series']}-{tc['title']}",
+                         getattr(tc["generator_func"], "__name__", ""))
+                if not any(fnmatch.fnmatchcase(name.lower(), pattern)
+                           for name in names for pattern in patterns):
+                    continue
+            if tags and not set(tags) & set(tc.get("tags", ())):
+                continue
+            if protocols and tc.get("protocol") not in protocols:
+                continue
+            selected.test_cases.append(tc)
+        return selected
+
+    @classmethod
+    def merge(cls, *registries: "TestCaseRegistry") -> "TestCaseRegistry":
+        """Combine registries (e.g., of several protocols) into one"""
+        merged = cls()
+        for registry in registries:
+            merged.test_cases.extend(registry.test_cases)
+        return merged
+
     def register_all(self, exporter: MADiEExporter):
         """
         Register all test cases with a MADiEExporter.
@@ -378,3 +1249,25 @@ class TestCaseRegistry:
 
     def __iter__(self):
         return iter(self.test_cases)
+
+
+def parse_test_case_selection(argv: List[str] = None, description: str = None) -> Dict[str, Any]:
+    """
+    Parse the test case selection options of a protocol generator script.
+
+    Options: --select GLOB and --tag TAG (both repeatable).
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        description: Help text of the script
+
+    Returns:
+        Dict with "patterns" and "tags" (None when not given), matching the
+        arguments of TestCaseRegistry.select
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--select", dest="patterns", action="append", metavar="GLOB",
+                        help="Only generate test cases whose series/title matches GLOB (repeatable)")
+    parser.add_argument("--tag", dest="tags", action="append", metavar="TAG",
+                        help="Only generate test cases with TAG (repeatable)")
+    return vars(parser.parse_args(argv))
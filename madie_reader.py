@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MADiE Export Reader
+
+Reads MADiE test case exports (as written by MADiEExporter) and compares
+two of them by content rather than by bytes.
+
+- MADiEExportReader: opens an export ZIP (or export directory) lazily;
+  .madie and README.txt are parsed on first use and bundles are streamed
+  one member at a time
+- diff_exports: compares two exports test case by test case, ignoring
+  generated IDs (UUIDs, ObjectIds, "cond-1a2b3c4d" style IDs) and the order
+  of bundle entries
+
+Test cases are matched by title (and occurrence, for repeated titles).
+Unchanged test cases are skipped cheaply: first by the CRC-32 and size in
+the ZIP directory, then by a hash of the bundle text with generated IDs
+renumbered in order of appearance. Only bundles that differ after that are
+parsed and compared resource by resource.
+
+Usage:
+    from fhir_test_utils import MADiEExportReader, diff_exports
+
+    with MADiEExportReader("ACHMeasure-v0.0.000-FHIR-TestCases.zip") as export:
+        for test_case, bundle in export.bundles():
+            print(test_case["title"], len(bundle["entry"]))
+
+    diff = diff_exports("old.zip", "new.zip")
+    print(diff.format())
+
+    # Or from the command line
+    python -m fhir_test_utils.madie_reader old.zip new.zip
+"""
+
+import os
+import re
+import sys
+import hashlib
+import zipfile
+import argparse
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import json_backend
+
+
+# Generated identifiers: uuid4-style resource IDs, 24-hex bundle IDs and
+# testCaseIds, and prefixed short IDs built from a UUID ("cond-1a2b3c4d",
+# "default-loc-1a2b3c4d")
+GENERATED_ID_PATTERN = re.compile(
+    r"\b(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{24}|[a-z]+(?:-[a-z]+)*-[0-9a-f]{8})\b"
+)
+
+_README_LINE = re.compile(r"Case # (\d+) - (\S+) = (.*)")
+
+
+# =============================================================================
+# READER
+# =============================================================================
+
+class MADiEExportReader:
+    """
+    Lazy reader for a MADiE export ZIP or export directory.
+
+    Opening a ZIP only reads its central directory. Each test case is a dict
+    of its .madie entry plus "key" (title, with "#n" for the n-th repeat of
+    a title) and "member" (path of its bundle within the export).
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the reader.
+
+        Args:
+            path: Export ZIP file or export directory
+
+        Raises:
+            FileNotFoundError: If the path does not exist
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Export not found: {path}")
+        self.path = path
+        self._zip = None if os.path.isdir(path) else zipfile.ZipFile(path)
+        self._metadata = None
+        self._readme = None
+        self._members = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying ZIP file"""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def _read(self, name: str) -> bytes:
+        """Read a member of the export"""
+        if self._zip is not None:
+            return self._zip.read(name)
+        with open(os.path.join(self.path, name), 'rb') as f:
+            return f.read()
+
+    def _bundle_members(self) -> Dict[str, str]:
+        """Map patient ID -> bundle member name"""
+        if self._members is None:
+            if self._zip is not None:
+                names = self._zip.namelist()
+            else:
+                names = [f"{patient_id}/{name}"
+                         for patient_id in sorted(os.listdir(self.path))
+                         if os.path.isdir(os.path.join(self.path, patient_id))
+                         for name in sorted(os.listdir(os.path.join(self.path, patient_id)))]
+            self._members = {}
+            for name in names:
+                patient_id, _, filename = name.partition("/")
+                if filename.endswith(".json") and "/" not in filename:
+                    self._members.setdefault(patient_id, name)
+        return self._members
+
+    @property
+    def metadata(self) -> List[Dict[str, Any]]:
+        """The parsed .madie test case list"""
+        if self._metadata is None:
+            self._metadata = json_backend.loads(self._read(".madie"))
+        return self._metadata
+
+    @property
+    def readme(self) -> List[Dict[str, Any]]:
+        """The parsed README.txt mapping: [{"case", "patientId", "name"}, ...]"""
+        if self._readme is None:
+            self._readme = []
+            text = self._read("README.txt").decode("utf-8")
+            for line in text.splitlines():
+                match = _README_LINE.fullmatch(line)
+                if match:
+                    self._readme.append({
+                        "case": int(match.group(1)),
+                        "patientId": match.group(2),
+                        "name": match.group(3)
+                    })
+        return self._readme
+
+    def test_cases(self) -> Iterator[Dict[str, Any]]:
+        """Yield the test cases in .madie order"""
+        members = self._bundle_members()
+        occurrences = Counter()
+        for entry in self.metadata:
+            occurrences[entry["title"]] += 1
+            count = occurrences[entry["title"]]
+            test_case = dict(entry)
+            test_case["key"] = entry["title"] if count == 1 else f"{entry['title']}#{count}"
+            test_case["member"] = members.get(entry["patientId"])
+            yield test_case
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.test_cases()
+
+    def __len__(self) -> int:
+        return len(self.metadata)
+
+    def member_digest(self, test_case: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the CRC-32 and size of a test case's bundle from the ZIP
+        directory, without reading it (None for export directories).
+        """
+        if self._zip is None or test_case["member"] is None:
+            return None
+        info = self._zip.getinfo(test_case["member"])
+        return f"{info.CRC:08x}:{info.file_size}"
+
+    def read_bundle_text(self, test_case: Dict[str, Any]) -> str:
+        """
+        Read a test case's bundle as text.
+
+        Raises:
+            KeyError: If the export has no bundle for the test case
+        """
+        if test_case["member"] is None:
+            raise KeyError(f"No bundle for test case '{test_case['title']}' ({test_case['patientId']})")
+        return self._read(test_case["member"]).decode("utf-8")
+
+    def load_bundle(self, test_case: Dict[str, Any]) -> Dict:
+        """Read and parse a test case's bundle"""
+        return json_backend.loads(self.read_bundle_text(test_case))
+
+    def bundles(self) -> Iterator[Tuple[Dict[str, Any], Dict]]:
+        """Yield (test case, bundle) pairs, parsing one bundle at a time"""
+        for test_case in self.test_cases():
+            yield test_case, self.load_bundle(test_case)
+
+
+# =============================================================================
+# CANONICALIZATION
+# =============================================================================
+
+def content_hash(text: str) -> str:
+    """
+    Hash bundle text with generated IDs renumbered in order of appearance.
+
+    Two bundles have the same hash if they are identical up to a consistent
+    renaming of their generated IDs. No JSON parsing is involved.
+    """
+    numbers = {}
+
+    def renumber(match):
+        return f"<{numbers.setdefault(match.group(0), len(numbers))}>"
+
+    return hashlib.sha256(GENERATED_ID_PATTERN.sub(renumber, text).encode("utf-8")).hexdigest()
+
+
+def _sorted_keys(value):
+    """Return a copy of a JSON value with all object keys sorted"""
+    if isinstance(value, dict):
+        return {key: _sorted_keys(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_sorted_keys(item) for item in value]
+    return value
+
+
+def canonicalize_bundle(bundle: Dict, rounds: int = 3) -> List[str]:
+    """
+    Canonical form of a bundle's resources, independent of IDs and order.
+
+    Each resource is serialized with sorted keys; its own ID becomes "@",
+    references to other resources become a label derived from the
+    referenced resource's content, and any other generated ID becomes "#".
+    Labels are refined over a few rounds so that they also reflect what the
+    referenced resources themselves reference.
+
+    Args:
+        bundle: Parsed Bundle
+        rounds: Label refinement rounds
+
+    Returns:
+        Sorted list of canonical resource JSON texts
+    """
+    resources = [entry["resource"] for entry in bundle.get("entry", []) if "resource" in entry]
+    own_ids = [resource.get("id") for resource in resources]
+    texts = [json_backend.dumps(_sorted_keys(resource), separators=(",", ":")) for resource in resources]
+
+    resource_ids = sorted({resource_id for resource_id in own_ids if resource_id}, key=len, reverse=True)
+    alternatives = [re.escape(resource_id) for resource_id in resource_ids] + [GENERATED_ID_PATTERN.pattern]
+    token_pattern = re.compile(r"(?<![\w-])(?:" + "|".join(alternatives) + r")(?!\w)")
+
+    def substitute(text: str, own_id: str, labels: Dict[str, str]) -> str:
+        def replace(match):
+            token = match.group(0)
+            if token == own_id:
+                return "@"
+            return labels.get(token, "#")
+        return token_pattern.sub(replace, text)
+
+    labels = {}
+    for _ in range(rounds):
+        labels = {own_id: "&" + hashlib.sha256(substitute(text, own_id, labels).encode("utf-8")).hexdigest()[:12]
+                  for own_id, text in zip(own_ids, texts) if own_id}
+    return sorted(substitute(text, own_id, labels) for own_id, text in zip(own_ids, texts))
+
+
+# =============================================================================
+# DIFF
+# =============================================================================
+
+@dataclass
+class ExportDiff:
+    """Result of diff_exports; test cases are identified by their key"""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    unchanged: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """True if the exports differ"""
+        return bool(self.added or self.removed or self.changed)
+
+    def format(self) -> str:
+        """Format the diff as a human-readable report"""
+        lines = []
+        for key in self.removed:
+            lines.append(f"- {key}")
+        for key in self.added:
+            lines.append(f"+ {key}")
+        for key, change in self.changed.items():
+            lines.append(f"~ {key}")
+            if "description" in change:
+                old, new = change["description"]
+                lines.append(f"    description: {old!r} -> {new!r}")
+            for modified in change.get("modified", []):
+                lines.append(f"    ~ {modified['resourceType']}")
+                for path, old, new in modified["changes"]:
+                    lines.append(f"        {path}: {_short(old)} -> {_short(new)}")
+            for resource in change.get("removed", []):
+                lines.append(f"    - {resource['resourceType']} {_short(resource)}")
+            for resource in change.get("added", []):
+                lines.append(f"    + {resource['resourceType']} {_short(resource)}")
+        lines.append(f"{len(self.unchanged)} unchanged, {len(self.changed)} changed, "
+                     f"{len(self.added)} added, {len(self.removed)} removed")
+        return "\n".join(lines)
+
+
+_MISSING = object()
+
+
+def _short(value, limit: int = 120) -> str:
+    """Compact JSON of a value, truncated for reports"""
+    if value is _MISSING:
+        return "(missing)"
+    text = json_backend.dumps(value, separators=(",", ":"))
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _value_changes(old, new, path: str = "") -> Iterator[Tuple[str, Any, Any]]:
+    """Yield (path, old value, new value) for each difference between two JSON values"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in list(old) + [key for key in new if key not in old]:
+            yield from _value_changes(old.get(key, _MISSING), new.get(key, _MISSING),
+                                      f"{path}.{key}" if path else key)
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from _value_changes(old_item, new_item, f"{path}[{index}]")
+    elif old != new:
+        yield path, old, new
+
+
+def _resource_changes(old_bundle: Dict, new_bundle: Dict) -> Dict[str, Any]:
+    """Compare the canonical resources of two bundles"""
+    old_resources = Counter(canonicalize_bundle(old_bundle))
+    new_resources = Counter(canonicalize_bundle(new_bundle))
+    removed = [json_backend.loads(text) for text in sorted((old_resources - new_resources).elements())]
+    added = [json_backend.loads(text) for text in sorted((new_resources - old_resources).elements())]
+
+    # Pair removed and added resources of the same type as modifications
+    modified = []
+    for resource in list(removed):
+        match = next((candidate for candidate in added
+                      if candidate["resourceType"] == resource["resourceType"]), None)
+        if match is not None:
+            removed.remove(resource)
+            added.remove(match)
+            modified.append({
+                "resourceType": resource["resourceType"],
+                "changes": list(_value_changes(resource, match))
+            })
+
+    changes = {}
+    if modified:
+        changes["modified"] = modified
+    if removed:
+        changes["removed"] = removed
+    if added:
+        changes["added"] = added
+    return changes
+
+
+def diff_exports(old, new) -> ExportDiff:
+    """
+    Compare two MADiE exports by content.
+
+    Args:
+        old: Path of the old export (ZIP or directory) or a MADiEExportReader
+        new: Path of the new export (ZIP or directory) or a MADiEExportReader
+
+    Returns:
+        ExportDiff listing added, removed, changed and unchanged test cases
+    """
+    old_reader = old if isinstance(old, MADiEExportReader) else MADiEExportReader(old)
+    new_reader = new if isinstance(new, MADiEExportReader) else MADiEExportReader(new)
+    try:
+        old_cases = {test_case["key"]: test_case for test_case in old_reader.test_cases()}
+        diff = ExportDiff()
+        for new_case in new_reader.test_cases():
+            key = new_case["key"]
+            old_case = old_cases.pop(key, None)
+            if old_case is None:
+                diff.added.append(key)
+                continue
+
+            change = {}
+            if old_case.get("description") != new_case.get("description"):
+                change["description"] = (old_case.get("description"), new_case.get("description"))
+
+            old_digest = old_reader.member_digest(old_case)
+            if old_digest is None or old_digest != new_reader.member_digest(new_case):
+                old_text = old_reader.read_bundle_text(old_case)
+                new_text = new_reader.read_bundle_text(new_case)
+                if content_hash(old_text) != content_hash(new_text):
+                    change.update(_resource_changes(json_backend.loads(old_text), json_backend.loads(new_text)))
+
+            if change:
+                diff.changed[key] = change
+            else:
+                diff.unchanged.append(key)
+        diff.removed = list(old_cases)
+        return diff
+    finally:
+        if old_reader is not old:
+            old_reader.close()
+        if new_reader is not new:
+            new_reader.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare two MADiE test case exports, ignoring generated IDs and entry order"
+    )
+    parser.add_argument("old", help="Old export (ZIP or directory)")
+    parser.add_argument("new", help="New export (ZIP or directory)")
+    args = parser.parse_args()
+
+    diff = diff_exports(args.old, args.new)
+    print(diff.format())
+    return 1 if diff else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
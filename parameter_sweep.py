@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parameter Sweep
+
+Generates families of test cases from one parameterized factory function
+instead of one hand-written function per variant.
+
+- ParameterGrid: every combination of the given parameter values
+- RandomSampler: a fixed number of seeded random parameter combinations
+- ParameterSweep: applies a factory to each combination, lazily
+
+Bundles are built one at a time as the sweep is consumed, so sweeping
+thousands of combinations never holds more than one bundle in memory.
+
+Usage:
+    from fhir_test_utils import MADiEExporter, ParameterGrid, ParameterSweep
+
+    sweep = ParameterSweep(
+        factory=create_glucose_at_threshold,
+        parameters=ParameterGrid(glucose_value=[38, 39, 40, 41],
+                                 glucose_time=["2025-01-21T12:00:00.000Z",
+                                               "2025-01-24T12:00:00.000Z"]),
+        series="Hypoglycemia",
+        title="Glucose{glucose_value}",
+        description="Glucose {glucose_value} mg/dL at {glucose_time}"
+    )
+
+    sweep.register(exporter)       # export through MADiEExporter
+    sweep.save("output/sweep")     # or write plain bundle files
+"""
+
+import os
+import re
+import random
+import itertools
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from .bundle_generator import FHIRBundleGenerator
+
+
+# Characters kept in file names written by ParameterSweep.save
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _slugify(name: str) -> str:
+    """Make a file name stem safe on every platform (e.g., "Glucose39.5mg/dL" -> "Glucose39.5mg_dL")"""
+    return _UNSAFE_FILENAME_CHARS.sub("_", name).strip("._") or "case"
+
+
+# =============================================================================
+# PARAMETER SAMPLERS
+# =============================================================================
+
+class ParameterGrid:
+    """
+    Every combination of the given parameter values.
+
+    Combinations are produced lazily and the grid can be iterated any number
+    of times. The last parameter varies fastest.
+
+    Usage:
+        grid = ParameterGrid(value=[39, 40, 41], unit=["mg/dL"])
+        len(grid)  # 3
+    """
+
+    def __init__(self, **axes):
+        """
+        Initialize the grid.
+
+        Args:
+            axes: Parameter name -> sequence of values
+
+        Raises:
+            ValueError: If no parameters are given
+        """
+        if not axes:
+            raise ValueError("ParameterGrid needs at least one parameter")
+        self.axes = {name: list(values) for name, values in axes.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        names = list(self.axes)
+        for values in itertools.product(*self.axes.values()):
+            yield dict(zip(names, values))
+
+    def __len__(self) -> int:
+        count = 1
+        for values in self.axes.values():
+            count *= len(values)
+        return count
+
+
+class RandomSampler:
+    """
+    A fixed number of random parameter combinations.
+
+    Each parameter is either a sequence (a value is chosen from it) or a
+    callable taking a random.Random and returning a value. Iterating again
+    replays the same combinations for the same seed.
+
+    Usage:
+        sampler = RandomSampler(100, seed=7,
+                                value=lambda rng: rng.randint(30, 50),
+                                day=range(1, 5))
+    """
+
+    def __init__(self, n: int, seed=None, **axes):
+        """
+        Initialize the sampler.
+
+        Args:
+            n: Number of combinations to produce
+            seed: Random seed (combinations are reproducible for a given seed)
+            axes: Parameter name -> sequence of values or callable(rng)
+
+        Raises:
+            ValueError: If n is negative or no parameters are given
+        """
+        if n < 0:
+            raise ValueError(f"n must not be negative (got {n})")
+        if not axes:
+            raise ValueError("RandomSampler needs at least one parameter")
+        self.n = n
+        self.seed = seed
+        self.axes = {name: values if callable(values) else list(values)
+                     for name, values in axes.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        rng = random.Random(self.seed)
+        for _ in range(self.n):
+            yield {name: values(rng) if callable(values) else rng.choice(values)
+                   for name, values in self.axes.items()}
+
+    def __len__(self) -> int:
+        return self.n
+
+
+# =============================================================================
+# SWEEP
+# =============================================================================
+
+class ParameterSweep:
+    """
+    Applies a test-case factory to every parameter combination.
+
+    Series, title and description are str.format templates filled in from
+    each combination (e.g., title="Glucose{value}"). expected_populations may
+    be a dict or a callable taking the combination and returning a dict.
+    """
+
+    def __init__(self,
+                 factory: Callable[..., FHIRBundleGenerator],
+                 parameters,
+                 series: str,
+                 title: str,
+                 description: str = "",
+                 expected_populations=None):
+        """
+        Initialize the sweep.
+
+        Args:
+            factory: Function taking the parameters as keyword arguments and
+                     returning a FHIRBundleGenerator
+            parameters: Iterable of parameter dicts (ParameterGrid, RandomSampler,
+                        or any re-iterable of dicts)
+            series: Test series name template
+            title: Test title template
+            description: Description template
+            expected_populations: Dict of expected population counts, or
+                                  callable(parameters) returning one
+        """
+        self.factory = factory
+        self.parameters = parameters
+        self.series = series
+        self.title = title
+        self.description = description
+        self.expected_populations = expected_populations
+
+    def cases(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one test case description per parameter combination.
+
+        Each case has the keys used by MADiEExporter.add_test_case plus
+        "parameters". Its generator_func builds the bundle only when called.
+        """
+        for params in self.parameters:
+            expected_populations = self.expected_populations
+            if callable(expected_populations):
+                expected_populations = expected_populations(params)
+            yield {
+                "generator_func": partial(self.factory, **params),
+                "series": self.series.format(**params),
+                "title": self.title.format(**params),
+                "description": self.description.format(**params),
+                "expected_populations": expected_populations,
+                "parameters": params
+            }
+
+    def __iter__(self) -> Iterator[Tuple[Dict[str, Any], FHIRBundleGenerator]]:
+        """Yield (parameters, generator) pairs, building each bundle on demand"""
+        for params in self.parameters:
+            yield params, self.factory(**params)
+
+    def register(self, exporter) -> int:
+        """
+        Add every combination to a MADiEExporter.
+
+        Only the lightweight case descriptions are queued; the exporter builds
+        and writes each bundle in turn during export().
+
+        Args:
+            exporter: MADiEExporter instance
+
+        Returns:
+            Number of test cases added
+        """
+        count = 0
+        for case in self.cases():
+            exporter.add_test_case(
+                generator_func=case["generator_func"],
+                series=case["series"],
+                title=case["title"],
+                description=case["description"],
+                expected_populations=case["expected_populations"]
+            )
+            count += 1
+        return count
+
+    def save(self, output_dir: str, compact: bool = False) -> int:
+        """
+        Write each generated bundle to its own JSON file.
+
+        Files are named {series}{title}.json, with characters other than
+        letters, digits, ".", "_" and "-" replaced by "_", and written one at
+        a time. Names that would collide (ignoring case) get a -2, -3, ...
+        suffix in sweep order.
+
+        Args:
+            output_dir: Output directory (created if missing)
+            compact: If True, write without indentation or whitespace
+
+        Returns:
+            Number of bundles written
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        count = 0
+        used = set()
+        for case in self.cases():
+            stem = _slugify(f"{case['series']}{case['title']}")
+            filename = f"{stem}.json"
+            index = 1
+            while filename.lower() in used:
+                index += 1
+                filename = f"{stem}-{index}.json"
+            used.add(filename.lower())
+
+            gen = case["generator_func"]()
+            gen.save(os.path.join(output_dir, filename), compact=compact)
+            count += 1
+        return count
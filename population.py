@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic Population Generator
+
+Generates large synthetic patient populations for measure engine load
+testing, written as FHIR Bulk Data NDJSON (one file per resource type,
+e.g., Patient.ndjson, Encounter.ndjson) with a manifest.json listing them.
+
+Each patient is built with FHIRBundleGenerator from configurable
+distributions (demographics, encounters, locations, labs, medications),
+written out and discarded, so memory use does not grow with the population
+size. Patients are derived only from the seed and their index, so the
+output is identical for any number of worker processes.
+
+Usage:
+    from fhir_test_utils import PopulationGenerator
+
+    population = PopulationGenerator(
+        seed=42,
+        measurement_period_start="2025-01-01",
+        measurement_period_end="2025-01-31",
+        distributions={"encounter_class": {"IMP": 1.0}}
+    )
+    manifest = population.generate("output/population", count=100000, workers=8)
+"""
+
+import os
+import random
+import shutil
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Tuple
+
+from .bundle_generator import FHIRBundleGenerator, format_datetime
+from .id_strategy import DeterministicIdStrategy
+from .code_systems import CODE_SYSTEMS
+from . import json_backend
+
+
+# =============================================================================
+# CODE TABLES
+# =============================================================================
+
+POPULATION_LOCATIONS = {
+    "medical_ward": {
+        "system": CODE_SYSTEMS["HSLOC"],
+        "code": "1060-3",
+        "display": "Medical Ward"
+    },
+    "medical_icu": {
+        "system": CODE_SYSTEMS["HSLOC"],
+        "code": "1027-2",
+        "display": "Medical Critical Care"
+    },
+    "emergency": {
+        "system": CODE_SYSTEMS["HSLOC"],
+        "code": "1108-0",
+        "display": "Emergency Department"
+    },
+}
+
+POPULATION_ENCOUNTER_TYPE = {
+    "system": CODE_SYSTEMS["SNOMED"],
+    "code": "183452005",
+    "display": "Emergency hospital admission"
+}
+
+# Lab code, unit and value distribution (normal, clipped at min, rounded)
+POPULATION_LABS = {
+    "glucose": {
+        "code": {
+            "system": CODE_SYSTEMS["LOINC"],
+            "code": "2339-0",
+            "display": "Glucose [Mass/volume] in Blood"
+        },
+        "unit": "mg/dL",
+        "mean": 130,
+        "sd": 45,
+        "min": 20,
+        "decimals": 0
+    },
+    "lactate": {
+        "code": {
+            "system": CODE_SYSTEMS["LOINC"],
+            "code": "2524-7",
+            "display": "Lactate [Moles/volume] in Serum or Plasma"
+        },
+        "unit": "mmol/L",
+        "mean": 1.8,
+        "sd": 1.0,
+        "min": 0.3,
+        "decimals": 1
+    },
+}
+
+POPULATION_MEDICATIONS = {
+    "insulin": {
+        "system": CODE_SYSTEMS["RXNORM"],
+        "code": "311034",
+        "display": "insulin regular, human 100 UNT/ML Injectable Solution"
+    },
+    "vancomycin": {
+        "system": CODE_SYSTEMS["RXNORM"],
+        "code": "1664986",
+        "display": "Vancomycin 1000 MG Injection"
+    },
+    "ceftriaxone": {
+        "system": CODE_SYSTEMS["RXNORM"],
+        "code": "309090",
+        "display": "Ceftriaxone 1000 MG Injection"
+    },
+}
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def _choose(rng: random.Random, weights: Dict[Any, float]):
+    """Pick a key from a {value: weight} distribution"""
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _uniform_int(rng: random.Random, bounds: Tuple[int, int]) -> int:
+    """Pick an integer uniformly from an inclusive (low, high) range"""
+    return rng.randint(bounds[0], bounds[1])
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date as midnight UTC"""
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+
+# =============================================================================
+# NDJSON OUTPUT
+# =============================================================================
+
+class NDJSONWriter:
+    """
+    Writes resources to one NDJSON file per resource type.
+
+    Files are opened on first use and named {resourceType}{suffix}.ndjson.
+
+    Usage:
+        with NDJSONWriter("output/bulk") as writer:
+            writer.write_bundle(gen)
+        writer.counts  # {"Patient": 1, "Encounter": 2, ...}
+    """
+
+    def __init__(self, output_dir: str, suffix: str = ""):
+        """
+        Initialize the writer.
+
+        Args:
+            output_dir: Directory for the NDJSON files (created if missing)
+            suffix: Optional file name suffix (e.g., ".003" for shard files)
+        """
+        self.output_dir = output_dir
+        self.suffix = suffix
+        self.counts = {}
+        self._files = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def path_for(self, resource_type: str) -> str:
+        """Return the file path used for a resource type"""
+        return os.path.join(self.output_dir, f"{resource_type}{self.suffix}.ndjson")
+
+    def write(self, resource: Dict):
+        """Write one resource as a single NDJSON line"""
+        resource_type = resource["resourceType"]
+        f = self._files.get(resource_type)
+        if f is None:
+            f = open(self.path_for(resource_type), 'w', newline='\n')
+            self._files[resource_type] = f
+            self.counts[resource_type] = 0
+        f.write(json_backend.dumps(resource, separators=(",", ":")))
+        f.write("\n")
+        self.counts[resource_type] += 1
+
+    def write_bundle(self, gen: FHIRBundleGenerator, exclude=()):
+        """
+        Write every resource in a generator's bundle.
+
+        Args:
+            gen: Generator whose bundle is written
+            exclude: "Type/id" keys of resources to leave out
+        """
+        for entry in gen.bundle["entry"]:
+            resource = entry["resource"]
+            if exclude and f"{resource['resourceType']}/{resource['id']}" in exclude:
+                continue
+            self.write(resource)
+
+    def close(self):
+        """Close all open files"""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# =============================================================================
+# POPULATION GENERATOR
+# =============================================================================
+
+class PopulationGenerator:
+    """
+    Generates a synthetic population as Bulk Data NDJSON.
+
+    Distributions are plain data so they can be sent to worker processes:
+    {value: weight} dicts for categorical choices and inclusive (low, high)
+    tuples for uniform integers. Keys given in distributions replace the
+    corresponding DEFAULT_DISTRIBUTIONS entries.
+    """
+
+    DEFAULT_DISTRIBUTIONS = {
+        "gender": {"male": 0.49, "female": 0.51},
+        "age": (18, 90),
+        "encounters": {1: 0.75, 2: 0.2, 3: 0.05},
+        "encounter_class": {"IMP": 0.85, "EMER": 0.1, "OBSENC": 0.05},
+        "length_of_stay": (1, 10),          # days
+        "location": {"medical_ward": 0.6, "medical_icu": 0.25, "emergency": 0.15},
+        "labs_per_day": (0, 4),
+        "lab": {"glucose": 0.7, "lactate": 0.3},
+        "medication_probability": 0.4,
+        "medication": {"insulin": 0.5, "vancomycin": 0.25, "ceftriaxone": 0.25},
+        "doses_per_day": {1: 0.5, 2: 0.3, 4: 0.2},
+    }
+
+    # Resources every patient bundle contains with the same ID and content
+    # (written once per population, not once per patient)
+    SHARED_RESOURCES = frozenset({f"Practitioner/{FHIRBundleGenerator.GENERAL_PRACTITIONER_ID}"})
+
+    def __init__(self,
+                 seed=0,
+                 measurement_period_start: str = "2025-01-01",
+                 measurement_period_end: str = "2025-01-31",
+                 distributions: Dict[str, Any] = None):
+        """
+        Initialize the population generator.
+
+        Args:
+            seed: Seed for all random draws (int or str)
+            measurement_period_start: Start of measurement period (YYYY-MM-DD)
+            measurement_period_end: End of measurement period (YYYY-MM-DD)
+            distributions: Overrides for DEFAULT_DISTRIBUTIONS
+
+        Raises:
+            ValueError: If a distribution name is unknown or the period is empty
+        """
+        unknown = set(distributions or {}) - set(self.DEFAULT_DISTRIBUTIONS)
+        if unknown:
+            raise ValueError(f"Unknown distributions: {', '.join(sorted(unknown))}")
+        if _parse_date(measurement_period_end) < _parse_date(measurement_period_start):
+            raise ValueError("measurement_period_end is before measurement_period_start")
+
+        self.seed = seed
+        self.measurement_period_start = measurement_period_start
+        self.measurement_period_end = measurement_period_end
+        self.distributions = {**self.DEFAULT_DISTRIBUTIONS, **(distributions or {})}
+
+    def build_patient(self, index: int) -> FHIRBundleGenerator:
+        """
+        Build one synthetic patient.
+
+        The result depends only on the seed and the index.
+
+        Args:
+            index: Patient number within the population
+
+        Returns:
+            FHIRBundleGenerator holding the patient's resources
+        """
+        dist = self.distributions
+        rng = random.Random(f"{self.seed}:{index}")
+        gen = FHIRBundleGenerator(
+            f"Population{index}",
+            id_strategy=DeterministicIdStrategy(seed=self.seed).derive("patient", index)
+        )
+
+        period_start = _parse_date(self.measurement_period_start)
+        period_days = (_parse_date(self.measurement_period_end) - period_start).days + 1
+
+        age = _uniform_int(rng, dist["age"])
+        birth_date = period_start - timedelta(days=age * 365 + rng.randrange(365))
+        gen.add_patient(
+            given_name=f"{index:07d}",
+            family_name="Population",
+            gender=_choose(rng, dist["gender"]),
+            birth_date=f"{birth_date:%Y-%m-%d}"
+        )
+        gen.add_coverage(start=self.measurement_period_start, end=self.measurement_period_end)
+
+        for _ in range(_choose(rng, dist["encounters"])):
+            self._add_encounter(gen, rng, period_start, period_days)
+
+        return gen
+
+    def _add_encounter(self,
+                       gen: FHIRBundleGenerator,
+                       rng: random.Random,
+                       period_start: datetime,
+                       period_days: int):
+        """Add one encounter with its location, labs and medications"""
+        dist = self.distributions
+        length_of_stay = _uniform_int(rng, dist["length_of_stay"])
+        start = period_start + timedelta(days=rng.randrange(period_days),
+                                         minutes=rng.randrange(24 * 60))
+        end = start + timedelta(days=length_of_stay, minutes=rng.randrange(12 * 60))
+
+        loc_id = gen.add_location(location_type=POPULATION_LOCATIONS[_choose(rng, dist["location"])])
+        enc_id = gen.add_encounter(
+            start=format_datetime(start),
+            end=format_datetime(end),
+            status="finished",
+            class_code=_choose(rng, dist["encounter_class"]),
+            type_coding=[POPULATION_ENCOUNTER_TYPE],
+            location_id=loc_id
+        )
+
+        # Labs: draw every reading first, then add one series per lab type
+        readings = {}
+        for day in range(length_of_stay):
+            for _ in range(_uniform_int(rng, dist["labs_per_day"])):
+                lab_name = _choose(rng, dist["lab"])
+                lab = POPULATION_LABS[lab_name]
+                value = round(max(lab["min"], rng.gauss(lab["mean"], lab["sd"])), lab["decimals"])
+                if lab["decimals"] == 0:
+                    value = int(value)
+                taken = start + timedelta(days=day, minutes=rng.randrange(24 * 60))
+                readings.setdefault(lab_name, []).append((min(taken, end), value))
+
+        for lab_name, lab_readings in readings.items():
+            lab_readings.sort(key=lambda reading: reading[0])
+            lab = POPULATION_LABS[lab_name]
+            gen.add_observation_series(
+                encounter_id=enc_id,
+                timestamps=[taken for taken, _ in lab_readings],
+                values=[value for _, value in lab_readings],
+                units=lab["unit"],
+                code=lab["code"]
+            )
+
+        if rng.random() < dist["medication_probability"]:
+            gen.add_medication_course(
+                encounter_id=enc_id,
+                start=start + timedelta(minutes=rng.randrange(60, 6 * 60)),
+                days=rng.randint(1, length_of_stay),
+                doses_per_day=_choose(rng, dist["doses_per_day"]),
+                duration=30,
+                medication_code=POPULATION_MEDICATIONS[_choose(rng, dist["medication"])]
+            )
+
+    def write_patients(self, writer: NDJSONWriter, start: int, stop: int):
+        """
+        Build patients start..stop-1 and write them, one patient at a time.
+
+        Resources in SHARED_RESOURCES are only written with patient 0, so
+        each appears once in the population whatever the shard layout.
+
+        Args:
+            writer: NDJSONWriter to write resources to
+            start: First patient index
+            stop: Patient index to stop before
+        """
+        for index in range(start, stop):
+            exclude = () if index == 0 else self.SHARED_RESOURCES
+            writer.write_bundle(self.build_patient(index), exclude=exclude)
+
+    def generate(self, output_dir: str, count: int, workers: int = 1) -> Dict:
+        """
+        Generate the population as NDJSON files plus manifest.json.
+
+        With several workers the index range is split into one contiguous
+        shard per worker process. Each shard writes its own files, which are
+        then concatenated in index order, so the output does not depend on
+        the number of workers.
+
+        Args:
+            output_dir: Output directory (created if missing)
+            count: Number of patients
+            workers: Number of worker processes
+
+        Returns:
+            The manifest (also written to output_dir/manifest.json)
+
+        Raises:
+            ValueError: If count is negative or workers is less than 1
+        """
+        if count < 0 or workers < 1:
+            raise ValueError(f"count must be >= 0 and workers >= 1 (got {count}, {workers})")
+
+        os.makedirs(output_dir, exist_ok=True)
+        workers = max(1, min(workers, count))
+
+        if workers == 1:
+            with NDJSONWriter(output_dir) as writer:
+                self.write_patients(writer, 0, count)
+            counts = writer.counts
+        else:
+            bounds = [count * shard // workers for shard in range(workers + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                shard_counts = list(pool.map(
+                    _generate_shard,
+                    [self] * workers,
+                    [output_dir] * workers,
+                    range(workers),
+                    bounds[:-1],
+                    bounds[1:]
+                ))
+            counts = self._merge_shards(output_dir, shard_counts)
+
+        manifest = {
+            "transactionTime": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "request": f"population?seed={self.seed}&count={count}",
+            "requiresAccessToken": False,
+            "output": [
+                {"type": resource_type, "url": f"{resource_type}.ndjson", "count": counts[resource_type]}
+                for resource_type in sorted(counts)
+            ],
+            "error": []
+        }
+        with open(os.path.join(output_dir, "manifest.json"), 'w', newline='\n') as f:
+            json_backend.dump(manifest, f, indent=2)
+
+        print(f"Generated {count} patients ({sum(counts.values())} resources) in {output_dir}")
+        return manifest
+
+    def _merge_shards(self, output_dir: str, shard_counts: List[Dict[str, int]]) -> Dict[str, int]:
+        """Concatenate per-shard NDJSON files into one file per resource type"""
+        counts = {}
+        for shard_count in shard_counts:
+            for resource_type, n in shard_count.items():
+                counts[resource_type] = counts.get(resource_type, 0) + n
+
+        final = NDJSONWriter(output_dir)
+        for resource_type in counts:
+            with open(final.path_for(resource_type), 'wb') as out:
+                for shard, shard_count in enumerate(shard_counts):
+                    if resource_type not in shard_count:
+                        continue
+                    part = NDJSONWriter(output_dir, suffix=f".{shard:03d}").path_for(resource_type)
+                    with open(part, 'rb') as f:
+                        shutil.copyfileobj(f, out)
+                    os.remove(part)
+        return counts
+
+
+def _generate_shard(population: PopulationGenerator,
+                    output_dir: str,
+                    shard: int,
+                    start: int,
+                    stop: int) -> Dict[str, int]:
+    """Worker process entry point: write one shard and return its resource counts"""
+    with NDJSONWriter(output_dir, suffix=f".{shard:03d}") as writer:
+        population.write_patients(writer, start, stop)
+    return writer.counts
@@ -48,9 +48,12 @@ import os
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.insert(0, root_dir)
 
-from fhir_test_utils import FHIRBundleGenerator, MADiEExporter
+from fhir_test_utils import FHIRBundleGenerator, MADiEExporter, TestCaseRegistry, parse_test_case_selection
 from fhir_test_utils.code_systems import CODE_SYSTEMS
 
+# Test cases register themselves with @registry.test_case; main() exports them
+registry = TestCaseRegistry(protocol="aur")
+
 
 # =============================================================================
 # AUR Protocol Constants
@@ -143,6 +146,13 @@ LOCATIONS = {
 # AU Option Test Case Functions
 # =============================================================================
 
+@registry.test_case(
+    series="AUOption",
+    title="AU1_BasicInpatientIV",
+    description="Basic inpatient with IV antimicrobial administration",
+    expected_populations={"initialPopulation": 1},
+    tags=["au"]
+)
 def create_au_basic_inpatient_iv():
     """
     Test Case AU-1: Basic Inpatient IV Antimicrobial
@@ -213,6 +223,13 @@ def create_au_basic_inpatient_iv():
     return gen
 
 
+@registry.test_case(
+    series="AUOption",
+    title="AU2_MultipleAntimicrobials",
+    description="Multiple antimicrobials administered on same day",
+    expected_populations={"initialPopulation": 1},
+    tags=["au"]
+)
 def create_au_multiple_antimicrobials():
     """
     Test Case AU-2: Multiple Antimicrobials Same Day
@@ -293,6 +310,13 @@ def create_au_multiple_antimicrobials():
     return gen
 
 
+@registry.test_case(
+    series="AUOption",
+    title="AU3_PatientTransfer",
+    description="Patient transfer between locations with antimicrobial",
+    expected_populations={"initialPopulation": 1},
+    tags=["au", "transfer"]
+)
 def create_au_patient_transfer():
     """
     Test Case AU-3: Patient Transfer Between Locations
@@ -354,6 +378,13 @@ def create_au_patient_transfer():
     return gen
 
 
+@registry.test_case(
+    series="AUOption",
+    title="AU4_EDOralAntimicrobial",
+    description="ED encounter with oral antimicrobial",
+    expected_populations={"initialPopulation": 1},
+    tags=["au", "ed"]
+)
 def create_au_ed_oral():
     """
     Test Case AU-4: ED Encounter with Oral Antimicrobial
@@ -401,6 +432,13 @@ def create_au_ed_oral():
     return gen
 
 
+@registry.test_case(
+    series="AUOption",
+    title="AU5_SpanningMonths",
+    description="Multi-day stay spanning December and January",
+    expected_populations={"initialPopulation": 1},
+    tags=["au", "boundary"]
+)
 def create_au_spanning_months():
     """
     Test Case AU-5: Multi-Day Stay Spanning Months
@@ -461,6 +499,13 @@ def create_au_spanning_months():
     return gen
 
 
+@registry.test_case(
+    series="AUOption",
+    title="AU6_InhaledAntimicrobial",
+    description="Inhaled antimicrobial (respiratory route)",
+    expected_populations={"initialPopulation": 1},
+    tags=["au"]
+)
 def create_au_inhaled():
     """
     Test Case AU-6: Inhaled Antimicrobial
@@ -521,6 +566,13 @@ def create_au_inhaled():
     return gen
 
 
+@registry.test_case(
+    series="AUOption",
+    title="AU7_NoAntimicrobial",
+    description="Inpatient without antimicrobial administration",
+    expected_populations={"initialPopulation": 1},
+    tags=["au", "negative"]
+)
 def create_au_no_antimicrobial():
     """
     Test Case AU-7: No Antimicrobial Administration
@@ -561,6 +613,13 @@ def create_au_no_antimicrobial():
 # AR Option Test Case Functions
 # =============================================================================
 
+@registry.test_case(
+    series="AROption",
+    title="AR1_HospitalOnsetMRSA",
+    description="Hospital-onset MRSA bacteremia (day 5)",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar", "hospital-onset"]
+)
 def create_ar_ho_mrsa():
     """
     Test Case AR-1: Hospital-Onset MRSA Bacteremia
@@ -623,6 +682,13 @@ def create_ar_ho_mrsa():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR2_CommunityOnsetEcoliUTI",
+    description="Community-onset E. coli UTI (day 2)",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar", "community-onset"]
+)
 def create_ar_co_ecoli_uti():
     """
     Test Case AR-2: Community-Onset E. coli UTI
@@ -694,6 +760,13 @@ def create_ar_co_ecoli_uti():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR3_CREKlebsiella",
+    description="Carbapenem-resistant Klebsiella pneumoniae",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar"]
+)
 def create_ar_cre_klebsiella():
     """
     Test Case AR-3: Carbapenem-Resistant Klebsiella (CRE)
@@ -774,6 +847,13 @@ def create_ar_cre_klebsiella():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR4_VREFaecium",
+    description="Vancomycin-resistant Enterococcus faecium",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar"]
+)
 def create_ar_vre():
     """
     Test Case AR-4: Vancomycin-Resistant Enterococcus (VRE)
@@ -836,6 +916,13 @@ def create_ar_vre():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR5_SameDayDuplicates",
+    description="Same-day blood and urine cultures (both counted)",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar", "deduplication"]
+)
 def create_ar_same_day_duplicates():
     """
     Test Case AR-5: Same-Day Duplicate Cultures
@@ -897,6 +984,13 @@ def create_ar_same_day_duplicates():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR6_14DayWindow",
+    description="14-day window deduplication test",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar", "deduplication", "boundary"]
+)
 def create_ar_14day_window():
     """
     Test Case AR-6: 14-Day Window Deduplication
@@ -949,6 +1043,13 @@ def create_ar_14day_window():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR7_MDRPseudomonas",
+    description="MDR Pseudomonas aeruginosa (3+ categories)",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar"]
+)
 def create_ar_mdr_pseudomonas():
     """
     Test Case AR-7: MDR Pseudomonas aeruginosa
@@ -1074,6 +1175,13 @@ def create_ar_mdr_pseudomonas():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR8_NegativeCulture",
+    description="Negative blood culture (no AR event)",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar", "negative"]
+)
 def create_ar_negative_culture():
     """
     Test Case AR-8: Negative Culture
@@ -1118,6 +1226,13 @@ def create_ar_negative_culture():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR9_CRAcinetobacter",
+    description="Carbapenem-resistant Acinetobacter baumannii",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar"]
+)
 def create_ar_cr_acinetobacter():
     """
     Test Case AR-9: Carbapenem-Resistant Acinetobacter
@@ -1207,6 +1322,13 @@ def create_ar_cr_acinetobacter():
     return gen
 
 
+@registry.test_case(
+    series="AROption",
+    title="AR10_EDPositiveCulture",
+    description="ED encounter with FQ-resistant E. coli",
+    expected_populations={"initialPopulation": 1},
+    tags=["ar", "ed"]
+)
 def create_ar_ed_positive():
     """
     Test Case AR-10: ED Encounter with Positive Culture
@@ -1282,8 +1404,14 @@ def create_ar_ed_positive():
 # Main Execution
 # =============================================================================
 
-def main():
-    """Generate all AUR test cases and export to MADiE format."""
+def main(patterns=None, tags=None):
+    """
+    Generate all AUR test cases and export to MADiE format.
+
+    Args:
+        patterns: Only export test cases matching these glob patterns
+        tags: Only export test cases with one of these tags
+    """
 
     print("=" * 70)
     print("AUR (Antimicrobial Use and Resistance) Test Case Generator")
@@ -1298,147 +1426,10 @@ def main():
         measurement_period_end=MEASUREMENT_PERIOD_END
     )
 
-    # AU Option Test Cases
-    print("\nAdding AU Option test cases...")
-
-    exporter.add_test_case(
-        generator_func=create_au_basic_inpatient_iv,
-        series="AUOption",
-        title="AU1_BasicInpatientIV",
-        description="Basic inpatient with IV antimicrobial administration",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_au_multiple_antimicrobials,
-        series="AUOption",
-        title="AU2_MultipleAntimicrobials",
-        description="Multiple antimicrobials administered on same day",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_au_patient_transfer,
-        series="AUOption",
-        title="AU3_PatientTransfer",
-        description="Patient transfer between locations with antimicrobial",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_au_ed_oral,
-        series="AUOption",
-        title="AU4_EDOralAntimicrobial",
-        description="ED encounter with oral antimicrobial",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_au_spanning_months,
-        series="AUOption",
-        title="AU5_SpanningMonths",
-        description="Multi-day stay spanning December and January",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_au_inhaled,
-        series="AUOption",
-        title="AU6_InhaledAntimicrobial",
-        description="Inhaled antimicrobial (respiratory route)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_au_no_antimicrobial,
-        series="AUOption",
-        title="AU7_NoAntimicrobial",
-        description="Inpatient without antimicrobial administration",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # AR Option Test Cases
-    print("Adding AR Option test cases...")
-
-    exporter.add_test_case(
-        generator_func=create_ar_ho_mrsa,
-        series="AROption",
-        title="AR1_HospitalOnsetMRSA",
-        description="Hospital-onset MRSA bacteremia (day 5)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_co_ecoli_uti,
-        series="AROption",
-        title="AR2_CommunityOnsetEcoliUTI",
-        description="Community-onset E. coli UTI (day 2)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_cre_klebsiella,
-        series="AROption",
-        title="AR3_CREKlebsiella",
-        description="Carbapenem-resistant Klebsiella pneumoniae",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_vre,
-        series="AROption",
-        title="AR4_VREFaecium",
-        description="Vancomycin-resistant Enterococcus faecium",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_same_day_duplicates,
-        series="AROption",
-        title="AR5_SameDayDuplicates",
-        description="Same-day blood and urine cultures (both counted)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_14day_window,
-        series="AROption",
-        title="AR6_14DayWindow",
-        description="14-day window deduplication test",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_mdr_pseudomonas,
-        series="AROption",
-        title="AR7_MDRPseudomonas",
-        description="MDR Pseudomonas aeruginosa (3+ categories)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_negative_culture,
-        series="AROption",
-        title="AR8_NegativeCulture",
-        description="Negative blood culture (no AR event)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_cr_acinetobacter,
-        series="AROption",
-        title="AR9_CRAcinetobacter",
-        description="Carbapenem-resistant Acinetobacter baumannii",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ar_ed_positive,
-        series="AROption",
-        title="AR10_EDPositiveCulture",
-        description="ED encounter with FQ-resistant E. coli",
-        expected_populations={"initialPopulation": 1}
-    )
+    # Register the selected test cases (all of them by default); only
+    # their generator functions run during export
+    selected = registry.select(patterns, tags)
+    selected.register_all(exporter)
 
     # Export
     print("\nExporting to MADiE format...")
@@ -1446,7 +1437,7 @@ def main():
 
     print(f"\n{'='*70}")
     print(f"Output: {output_path}")
-    print(f"Total test cases: 17 (7 AU + 10 AR)")
+    print(f"Total test cases: {len(selected)}")
     print(f"{'='*70}")
     print("\nNext steps:")
     print("1. Import ZIP into MADiE")
@@ -1455,4 +1446,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(**parse_test_case_selection(description="Generate AUR test cases"))
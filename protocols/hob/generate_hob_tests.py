@@ -44,9 +44,12 @@ import os
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.insert(0, root_dir)
 
-from fhir_test_utils import FHIRBundleGenerator, MADiEExporter
+from fhir_test_utils import FHIRBundleGenerator, MADiEExporter, TestCaseRegistry, parse_test_case_selection
 from fhir_test_utils.code_systems import CODE_SYSTEMS
 
+# Test cases register themselves with @registry.test_case; main() exports them
+registry = TestCaseRegistry(protocol="hob")
+
 
 # =============================================================================
 # HOB Protocol Constants
@@ -96,6 +99,13 @@ INPATIENT_LOCATION = {
 # Test Case Generator Functions
 # =============================================================================
 
+@registry.test_case(
+    series="HOBPositive",
+    title="Day4SAureus",
+    description="HOB positive event: S. aureus blood culture on hospital day 4",
+    expected_populations={"initialPopulation": 1},
+    tags=["positive", "boundary"]
+)
 def create_hob_positive_day4_saureus():
     """
     Test Case 1: HOB Positive - S. aureus on Day 4
@@ -152,6 +162,13 @@ def create_hob_positive_day4_saureus():
     return gen
 
 
+@registry.test_case(
+    series="HOBPositive",
+    title="Day5Candida",
+    description="HOB positive event: Candida albicans (fungemia) on hospital day 5",
+    expected_populations={"initialPopulation": 1},
+    tags=["positive", "fungemia"]
+)
 def create_hob_positive_day5_candida():
     """
     Test Case 2: HOB Positive - Candida on Day 5 (Fungemia)
@@ -208,6 +225,13 @@ def create_hob_positive_day5_candida():
     return gen
 
 
+@registry.test_case(
+    series="HOBExcluded",
+    title="MatchingCOB",
+    description="HOB excluded: Same E. coli organism on day 2 (COB) and day 5",
+    expected_populations={"initialPopulation": 1},
+    tags=["excluded", "cob"]
+)
 def create_hob_excluded_matching_cob():
     """
     Test Case 3: HOB Excluded - Matching COB Organism
@@ -273,6 +297,13 @@ def create_hob_excluded_matching_cob():
     return gen
 
 
+@registry.test_case(
+    series="HOBPositive",
+    title="NonMatchingCOB",
+    description="HOB positive: E. coli on day 2 (COB), S. aureus on day 5 (HOB)",
+    expected_populations={"initialPopulation": 1},
+    tags=["positive", "cob"]
+)
 def create_hob_positive_nonmatching_cob():
     """
     Test Case 4: HOB Positive - Non-matching Prior COB
@@ -343,6 +374,13 @@ def create_hob_positive_nonmatching_cob():
 # Test Case 5: Blood Culture Contamination - 1 of 2 Positive
 # =============================================================================
 
+@registry.test_case(
+    series="HOBContamination",
+    title="1of2Positive",
+    description="Blood culture contamination: 1 of 2 paired sets positive for S. epidermidis",
+    expected_populations={"initialPopulation": 1},
+    tags=["contamination"]
+)
 def create_contamination_1of2_positive():
     """
     Test Case 5: Blood Culture Contamination - 1 of 2 Positive
@@ -406,6 +444,13 @@ def create_contamination_1of2_positive():
 # Test Case 6: Blood Culture Contamination - 2 of 2 Positive (NOT Contamination)
 # =============================================================================
 
+@registry.test_case(
+    series="HOBContamination",
+    title="2of2Positive",
+    description="NOT contamination: Both paired sets positive for S. epidermidis (true bacteremia)",
+    expected_populations={"initialPopulation": 1},
+    tags=["contamination", "positive"]
+)
 def create_contamination_2of2_positive():
     """
     Test Case 6: Blood Culture - 2 of 2 Positive (NOT Contamination)
@@ -469,6 +514,13 @@ def create_contamination_2of2_positive():
 # Test Case 7: Matching Commensal HOB - Positive (≥4 days antibiotics)
 # =============================================================================
 
+@registry.test_case(
+    series="HOBMatchingCommensal",
+    title="Positive",
+    description="Matching Commensal HOB: S. epidermidis from 2 cultures + 4 days Vancomycin",
+    expected_populations={"initialPopulation": 1},
+    tags=["commensal", "positive"]
+)
 def create_matching_commensal_positive():
     """
     Test Case 7: Matching Commensal HOB - Positive
@@ -543,6 +595,13 @@ def create_matching_commensal_positive():
 # Test Case 8: Matching Commensal HOB - Excluded (Insufficient Antibiotics)
 # =============================================================================
 
+@registry.test_case(
+    series="HOBMatchingCommensal",
+    title="InsufficientAbx",
+    description="Matching Commensal excluded: S. epidermidis from 2 cultures but only 2 days antibiotics",
+    expected_populations={"initialPopulation": 1},
+    tags=["commensal", "excluded"]
+)
 def create_matching_commensal_insufficient_abx():
     """
     Test Case 8: Matching Commensal HOB - Excluded (Insufficient Antibiotics)
@@ -617,6 +676,13 @@ def create_matching_commensal_insufficient_abx():
 # Test Case 9: Non-Measure HOB Event - High Risk (Non-Preventability)
 # =============================================================================
 
+@registry.test_case(
+    series="HOBNonMeasure",
+    title="HighRisk",
+    description="Non-Measure HOB: E. coli bacteremia in patient with AML and neutropenia",
+    expected_populations={"initialPopulation": 1},
+    tags=["non-measure"]
+)
 def create_non_measure_high_risk():
     """
     Test Case 9: Non-Measure HOB Event - High Risk
@@ -693,6 +759,13 @@ def create_non_measure_high_risk():
 # Test Case 10: Measurable HOB Event - No Risk Factors
 # =============================================================================
 
+@registry.test_case(
+    series="HOBMeasurable",
+    title="NoRiskFactors",
+    description="Measurable HOB: S. aureus bacteremia in patient with diabetes/HTN (no non-preventability)",
+    expected_populations={"initialPopulation": 1},
+    tags=["measurable", "positive"]
+)
 def create_measurable_no_risk_factors():
     """
     Test Case 10: Measurable HOB Event - No Non-Preventability Risk Factors
@@ -769,6 +842,13 @@ def create_measurable_no_risk_factors():
 # Test Case 11: HOB Excluded - Same Species, Different SNOMED Codes
 # =============================================================================
 
+@registry.test_case(
+    series="HOBExcluded",
+    title="SameSpeciesDiffCodes",
+    description="HOB excluded: P. aeruginosa (day 2) and CR P. aeruginosa (day 6) - same species, different codes",
+    expected_populations={"initialPopulation": 1},
+    tags=["excluded", "cob"]
+)
 def create_hob_excluded_same_species_different_codes():
     """
     Test Case 11: HOB Excluded - Same Species with Different SNOMED Codes
@@ -902,8 +982,14 @@ def create_hob_excluded_same_species_different_codes():
 # Main Execution
 # =============================================================================
 
-def main():
-    """Generate all HOB test cases and export to MADiE-compatible format."""
+def main(patterns=None, tags=None):
+    """
+    Generate all HOB test cases and export to MADiE-compatible format.
+
+    Args:
+        patterns: Only export test cases matching these glob patterns
+        tags: Only export test cases with one of these tags
+    """
 
     print("=" * 70)
     print("HOB (Hospital-Onset Bacteremia & Fungemia) Test Case Generator")
@@ -921,103 +1007,10 @@ def main():
         measurement_period_end=MEASUREMENT_PERIOD_END
     )
 
-    # Add test cases
-    # All test cases should have initialPopulation: 1 (qualifying encounter during MP)
-
-    exporter.add_test_case(
-        generator_func=create_hob_positive_day4_saureus,
-        series="HOBPositive",
-        title="Day4SAureus",
-        description="HOB positive event: S. aureus blood culture on hospital day 4",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_hob_positive_day5_candida,
-        series="HOBPositive",
-        title="Day5Candida",
-        description="HOB positive event: Candida albicans (fungemia) on hospital day 5",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_hob_excluded_matching_cob,
-        series="HOBExcluded",
-        title="MatchingCOB",
-        description="HOB excluded: Same E. coli organism on day 2 (COB) and day 5",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_hob_positive_nonmatching_cob,
-        series="HOBPositive",
-        title="NonMatchingCOB",
-        description="HOB positive: E. coli on day 2 (COB), S. aureus on day 5 (HOB)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # Test Case 5: Blood Culture Contamination - 1 of 2 Positive
-    exporter.add_test_case(
-        generator_func=create_contamination_1of2_positive,
-        series="HOBContamination",
-        title="1of2Positive",
-        description="Blood culture contamination: 1 of 2 paired sets positive for S. epidermidis",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # Test Case 6: Blood Culture - 2 of 2 Positive (NOT Contamination)
-    exporter.add_test_case(
-        generator_func=create_contamination_2of2_positive,
-        series="HOBContamination",
-        title="2of2Positive",
-        description="NOT contamination: Both paired sets positive for S. epidermidis (true bacteremia)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # Test Case 7: Matching Commensal HOB - Positive
-    exporter.add_test_case(
-        generator_func=create_matching_commensal_positive,
-        series="HOBMatchingCommensal",
-        title="Positive",
-        description="Matching Commensal HOB: S. epidermidis from 2 cultures + 4 days Vancomycin",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # Test Case 8: Matching Commensal HOB - Excluded (Insufficient Antibiotics)
-    exporter.add_test_case(
-        generator_func=create_matching_commensal_insufficient_abx,
-        series="HOBMatchingCommensal",
-        title="InsufficientAbx",
-        description="Matching Commensal excluded: S. epidermidis from 2 cultures but only 2 days antibiotics",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # Test Case 9: Non-Measure HOB Event - High Risk
-    exporter.add_test_case(
-        generator_func=create_non_measure_high_risk,
-        series="HOBNonMeasure",
-        title="HighRisk",
-        description="Non-Measure HOB: E. coli bacteremia in patient with AML and neutropenia",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # Test Case 10: Measurable HOB Event - No Risk Factors
-    exporter.add_test_case(
-        generator_func=create_measurable_no_risk_factors,
-        series="HOBMeasurable",
-        title="NoRiskFactors",
-        description="Measurable HOB: S. aureus bacteremia in patient with diabetes/HTN (no non-preventability)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # Test Case 11: HOB Excluded - Same Species, Different SNOMED Codes
-    exporter.add_test_case(
-        generator_func=create_hob_excluded_same_species_different_codes,
-        series="HOBExcluded",
-        title="SameSpeciesDiffCodes",
-        description="HOB excluded: P. aeruginosa (day 2) and CR P. aeruginosa (day 6) - same species, different codes",
-        expected_populations={"initialPopulation": 1}
-    )
+    # Register the selected test cases (all of them by default); only
+    # their generator functions run during export
+    selected = registry.select(patterns, tags)
+    selected.register_all(exporter)
 
     # Export test cases
     output_path = exporter.export(create_zip=True)
@@ -1036,4 +1029,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(**parse_test_case_selection(description="Generate HOB test cases"))
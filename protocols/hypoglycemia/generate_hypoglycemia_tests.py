@@ -38,9 +38,12 @@ import os
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.insert(0, root_dir)
 
-from fhir_test_utils import FHIRBundleGenerator, MADiEExporter
+from fhir_test_utils import FHIRBundleGenerator, MADiEExporter, TestCaseRegistry, parse_test_case_selection
 from fhir_test_utils.code_systems import CODE_SYSTEMS
 
+# Test cases register themselves with @registry.test_case; main() exports them
+registry = TestCaseRegistry(protocol="hypoglycemia")
+
 
 # =============================================================================
 # Hypoglycemia Protocol Constants
@@ -151,6 +154,13 @@ LOCATIONS = {
 # Test Case Generator Functions
 # =============================================================================
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="SevereHypoWithInsulin",
+    description="Severe hypoglycemia (35 mg/dL) after insulin administration on day 2",
+    expected_populations={"initialPopulation": 1},
+    tags=["positive"]
+)
 def create_severe_hypo_with_insulin():
     """
     Test Case 1: SevereHypoWithInsulin
@@ -216,6 +226,13 @@ def create_severe_hypo_with_insulin():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="SevereHypoWithOralAgent",
+    description="Severe hypoglycemia (38 mg/dL) after oral sulfonylurea (glipizide)",
+    expected_populations={"initialPopulation": 1},
+    tags=["positive"]
+)
 def create_severe_hypo_with_oral_agent():
     """
     Test Case 2: SevereHypoWithOralAgent
@@ -279,6 +296,13 @@ def create_severe_hypo_with_oral_agent():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="SevereHypoDay1",
+    description="Severe hypoglycemia (32 mg/dL) on admission day (day 1)",
+    expected_populations={"initialPopulation": 1},
+    tags=["positive", "boundary"]
+)
 def create_severe_hypo_day1():
     """
     Test Case 3: SevereHypoDay1
@@ -342,6 +366,13 @@ def create_severe_hypo_day1():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="MultipleHypoEvents",
+    description="Two severe hypoglycemia events (36 mg/dL and 28 mg/dL) during same encounter",
+    expected_populations={"initialPopulation": 1},
+    tags=["positive"]
+)
 def create_multiple_hypo_events():
     """
     Test Case 4: MultipleHypoEvents
@@ -417,6 +448,13 @@ def create_multiple_hypo_events():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="ModerateHypoExcluded",
+    description="Moderate hypoglycemia (45 mg/dL) - above severe threshold, excluded",
+    expected_populations={"initialPopulation": 1},
+    tags=["exclusion"]
+)
 def create_moderate_hypo_excluded():
     """
     Test Case 5: ModerateHypoExcluded
@@ -473,6 +511,13 @@ def create_moderate_hypo_excluded():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="HypoWithoutMedication",
+    description="Severe hypoglycemia (35 mg/dL) without antidiabetic medication (sepsis)",
+    expected_populations={"initialPopulation": 1},
+    tags=["exclusion"]
+)
 def create_hypo_without_medication():
     """
     Test Case 6: HypoWithoutMedication
@@ -529,6 +574,13 @@ def create_hypo_without_medication():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="PreAdmissionHypo",
+    description="Pre-admission hypoglycemia (32 mg/dL) - glucose before encounter start",
+    expected_populations={"initialPopulation": 1},
+    tags=["exclusion"]
+)
 def create_pre_admission_hypo():
     """
     Test Case 7: PreAdmissionHypo
@@ -578,6 +630,13 @@ def create_pre_admission_hypo():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="OutpatientEncounter",
+    description="ED-only encounter with severe hypoglycemia - included due to CQL location value set (potential CQL flaw)",
+    expected_populations={"initialPopulation": 1},
+    tags=["exclusion", "ed"]
+)
 def create_outpatient_encounter():
     """
     Test Case 8: OutpatientEncounter
@@ -633,12 +692,27 @@ def create_outpatient_encounter():
     return gen
 
 
-def create_glucose_at_threshold():
+@registry.test_case(
+    series="Hypoglycemia",
+    title="GlucoseAtThreshold",
+    description="Glucose exactly at 40 mg/dL - boundary condition (NOT < 40)",
+    expected_populations={"initialPopulation": 1},
+    tags=["edge", "boundary"]
+)
+def create_glucose_at_threshold(glucose_value=40,
+                                glucose_time="2025-01-21T12:00:00.000Z"):
     """
     Test Case 9: GlucoseAtThreshold
 
     Glucose exactly at 40 mg/dL (boundary condition).
 
+    The glucose value and time are parameters so the boundary can be swept
+    with ParameterSweep (e.g., 38-42 mg/dL across the encounter days).
+
+    Args:
+        glucose_value: Blood glucose result in mg/dL
+        glucose_time: Effective datetime of the glucose result
+
     Expected:
     - Initial Population: 1
     - Hypoglycemia Event: Excluded (40 is NOT < 40)
@@ -681,14 +755,21 @@ def create_glucose_at_threshold():
         encounter_id=enc_id,
         category="laboratory",
         code=GLUCOSE_CODES["blood_glucose"],
-        value=40,
+        value=glucose_value,
         unit="mg/dL",
-        effective_datetime="2025-01-21T12:00:00.000Z"
+        effective_datetime=glucose_time
     )
 
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="ICUHypoglycemia",
+    description="ICU patient with DKA on insulin drip, severe hypoglycemia (25 mg/dL)",
+    expected_populations={"initialPopulation": 1},
+    tags=["edge"]
+)
 def create_icu_hypoglycemia():
     """
     Test Case 10: ICUHypoglycemia
@@ -757,6 +838,13 @@ def create_icu_hypoglycemia():
 # New Test Cases for Surveillance Metric Coverage
 # =============================================================================
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="HypoWithResolution",
+    description="Metric 4: Severe hypo (32 mg/dL) with resolution (85 mg/dL) 2 hours later",
+    expected_populations={"initialPopulation": 1},
+    tags=["metric"]
+)
 def create_hypo_with_resolution():
     """
     Test Case 11: HypoWithResolution (Metric 4)
@@ -832,6 +920,13 @@ def create_hypo_with_resolution():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="DenominatorOnlyNoHypo",
+    description="Metric 1/2 Denominator: ADD given but no hypoglycemia (glucose 120 mg/dL)",
+    expected_populations={"initialPopulation": 1},
+    tags=["metric"]
+)
 def create_denominator_only_no_hypo():
     """
     Test Case 12: DenominatorOnlyNoHypo (Metric 1,2 Denominator)
@@ -896,6 +991,13 @@ def create_denominator_only_no_hypo():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="EDAddWithin1Hour",
+    description="Footnote**: ED insulin 30 min before admission, severe hypo after",
+    expected_populations={"initialPopulation": 1},
+    tags=["metric", "ed"]
+)
 def create_ed_add_within_1_hour():
     """
     Test Case 13: EDAddWithin1Hour (Metric 1 Footnote)
@@ -955,6 +1057,13 @@ def create_ed_add_within_1_hour():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="RepeatBGExclusion",
+    description="Footnote*: Initial BG 35, repeat BG 95 within 5 min (erroneous reading)",
+    expected_populations={"initialPopulation": 1},
+    tags=["metric"]
+)
 def create_repeat_bg_exclusion():
     """
     Test Case 14: RepeatBGExclusion (Metric 1 Footnote)
@@ -1023,6 +1132,13 @@ def create_repeat_bg_exclusion():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="ModerateHypoMetric2",
+    description="Footnote***: Moderate hypoglycemia (47 mg/dL) in 40-53 range",
+    expected_populations={"initialPopulation": 1},
+    tags=["metric"]
+)
 def create_moderate_hypo_metric2():
     """
     Test Case 15: ModerateHypoMetric2 (Metric 2 Footnote***)
@@ -1081,6 +1197,13 @@ def create_moderate_hypo_metric2():
     return gen
 
 
+@registry.test_case(
+    series="Hypoglycemia",
+    title="MildHypoMetric2",
+    description="Footnote***: Mild hypoglycemia (62 mg/dL) in 54-70 range",
+    expected_populations={"initialPopulation": 1},
+    tags=["metric"]
+)
 def create_mild_hypo_metric2():
     """
     Test Case 16: MildHypoMetric2 (Metric 2 Footnote***)
@@ -1143,8 +1266,14 @@ def create_mild_hypo_metric2():
 # Main Execution
 # =============================================================================
 
-def main():
-    """Generate all hypoglycemia test cases and export to MADiE format."""
+def main(patterns=None, tags=None):
+    """
+    Generate all hypoglycemia test cases and export to MADiE format.
+
+    Args:
+        patterns: Only export test cases matching these glob patterns
+        tags: Only export test cases with one of these tags
+    """
 
     print("=" * 70)
     print("Hypoglycemia (Hospital-Acquired Hypoglycemia) Test Case Generator")
@@ -1162,149 +1291,10 @@ def main():
         measurement_period_end=MEASUREMENT_PERIOD_END
     )
 
-    # =========================================================================
-    # Positive Cases
-    # =========================================================================
-
-    exporter.add_test_case(
-        generator_func=create_severe_hypo_with_insulin,
-        series="Hypoglycemia",
-        title="SevereHypoWithInsulin",
-        description="Severe hypoglycemia (35 mg/dL) after insulin administration on day 2",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_severe_hypo_with_oral_agent,
-        series="Hypoglycemia",
-        title="SevereHypoWithOralAgent",
-        description="Severe hypoglycemia (38 mg/dL) after oral sulfonylurea (glipizide)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_severe_hypo_day1,
-        series="Hypoglycemia",
-        title="SevereHypoDay1",
-        description="Severe hypoglycemia (32 mg/dL) on admission day (day 1)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_multiple_hypo_events,
-        series="Hypoglycemia",
-        title="MultipleHypoEvents",
-        description="Two severe hypoglycemia events (36 mg/dL and 28 mg/dL) during same encounter",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # =========================================================================
-    # Exclusion Cases
-    # =========================================================================
-
-    exporter.add_test_case(
-        generator_func=create_moderate_hypo_excluded,
-        series="Hypoglycemia",
-        title="ModerateHypoExcluded",
-        description="Moderate hypoglycemia (45 mg/dL) - above severe threshold, excluded",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_hypo_without_medication,
-        series="Hypoglycemia",
-        title="HypoWithoutMedication",
-        description="Severe hypoglycemia (35 mg/dL) without antidiabetic medication (sepsis)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_pre_admission_hypo,
-        series="Hypoglycemia",
-        title="PreAdmissionHypo",
-        description="Pre-admission hypoglycemia (32 mg/dL) - glucose before encounter start",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_outpatient_encounter,
-        series="Hypoglycemia",
-        title="OutpatientEncounter",
-        description="ED-only encounter with severe hypoglycemia - included due to CQL location value set (potential CQL flaw)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # =========================================================================
-    # Edge Cases
-    # =========================================================================
-
-    exporter.add_test_case(
-        generator_func=create_glucose_at_threshold,
-        series="Hypoglycemia",
-        title="GlucoseAtThreshold",
-        description="Glucose exactly at 40 mg/dL - boundary condition (NOT < 40)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_icu_hypoglycemia,
-        series="Hypoglycemia",
-        title="ICUHypoglycemia",
-        description="ICU patient with DKA on insulin drip, severe hypoglycemia (25 mg/dL)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    # =========================================================================
-    # Surveillance Metric Coverage Cases
-    # =========================================================================
-
-    exporter.add_test_case(
-        generator_func=create_hypo_with_resolution,
-        series="Hypoglycemia",
-        title="HypoWithResolution",
-        description="Metric 4: Severe hypo (32 mg/dL) with resolution (85 mg/dL) 2 hours later",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_denominator_only_no_hypo,
-        series="Hypoglycemia",
-        title="DenominatorOnlyNoHypo",
-        description="Metric 1/2 Denominator: ADD given but no hypoglycemia (glucose 120 mg/dL)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_ed_add_within_1_hour,
-        series="Hypoglycemia",
-        title="EDAddWithin1Hour",
-        description="Footnote**: ED insulin 30 min before admission, severe hypo after",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_repeat_bg_exclusion,
-        series="Hypoglycemia",
-        title="RepeatBGExclusion",
-        description="Footnote*: Initial BG 35, repeat BG 95 within 5 min (erroneous reading)",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_moderate_hypo_metric2,
-        series="Hypoglycemia",
-        title="ModerateHypoMetric2",
-        description="Footnote***: Moderate hypoglycemia (47 mg/dL) in 40-53 range",
-        expected_populations={"initialPopulation": 1}
-    )
-
-    exporter.add_test_case(
-        generator_func=create_mild_hypo_metric2,
-        series="Hypoglycemia",
-        title="MildHypoMetric2",
-        description="Footnote***: Mild hypoglycemia (62 mg/dL) in 54-70 range",
-        expected_populations={"initialPopulation": 1}
-    )
+    # Register the selected test cases (all of them by default); only
+    # their generator functions run during export
+    selected = registry.select(patterns, tags)
+    selected.register_all(exporter)
 
     # Export
     output_path = exporter.export(create_zip=True)
@@ -1322,4 +1312,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(**parse_test_case_selection(description="Generate hypoglycemia test cases"))
@@ -16,9 +16,12 @@ import os
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.insert(0, root_dir)
 
-from fhir_test_utils import FHIRBundleGenerator, MADiEExporter
+from fhir_test_utils import FHIRBundleGenerator, MADiEExporter, TestCaseRegistry, parse_test_case_selection
 from fhir_test_utils.code_systems import CODE_SYSTEMS
 
+# Test cases register themselves with @registry.test_case; main() exports them
+registry = TestCaseRegistry(protocol="sepsis")
+
 
 # =============================================================================
 # Protocol Constants
@@ -204,6 +207,13 @@ ORGANISMS = {
 # Test Case Generator Functions
 # =============================================================================
 
+@registry.test_case(
+    series="SCO",
+    title="SCOPositiveBasicLactate",
+    description="Community-onset sepsis with blood culture, 4 QADs, and elevated lactate (day 2)",
+    expected_populations={"initialPopulation": 1},
+    tags=["sco", "metabolic"]
+)
 def create_sco_positive_basic_lactate():
     """
     Test Case 1: SCO Positive - Basic Metabolic Dysfunction (Lactate)
@@ -263,17 +273,24 @@ def create_sco_positive_basic_lactate():
     )
 
     # Antibiotic - 4 QADs starting Day 2
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["piperacillin_tazobactam"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["piperacillin_tazobactam"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="SCO",
+    title="SCOPositiveMultipleOrgan",
+    description="Community-onset sepsis with hypotension AND renal dysfunction",
+    expected_populations={"initialPopulation": 1},
+    tags=["sco", "cardiovascular", "renal"]
+)
 def create_sco_positive_multiple_organ_dysfunction():
     """
     Test Case 2: SCO Positive - Multiple Organ Dysfunction
@@ -351,17 +368,24 @@ def create_sco_positive_multiple_organ_dysfunction():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["vancomycin"],
-            effective_start=f"2025-01-0{4+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{4+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["vancomycin"],
+        start="2025-01-04T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="SCO",
+    title="SCOPositiveDay3Boundary",
+    description="Community-onset sepsis with onset on day 3 (boundary case)",
+    expected_populations={"initialPopulation": 1},
+    tags=["sco", "boundary"]
+)
 def create_sco_positive_day3_boundary():
     """
     Test Case 3: SCO Positive - Day 3 Onset (Boundary)
@@ -417,17 +441,24 @@ def create_sco_positive_day3_boundary():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["ceftriaxone"],
-            effective_start=f"2025-01-0{4+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{4+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["ceftriaxone"],
+        start="2025-01-04T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="SCO",
+    title="SCOPositivePrincipalDxInfection",
+    description="Community-onset sepsis via principal diagnosis infection (no blood culture)",
+    expected_populations={"initialPopulation": 1},
+    tags=["sco"]
+)
 def create_sco_positive_principal_dx_infection():
     """
     Test Case 4: SCO Positive - Principal Diagnosis Infection (No Blood Culture)
@@ -485,17 +516,24 @@ def create_sco_positive_principal_dx_infection():
     )
 
     # Antibiotic - 4 QADs starting Day 1
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["levofloxacin_iv"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["levofloxacin_iv"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="SHO",
+    title="SHOPositiveDay5Onset",
+    description="Hospital-onset sepsis with onset on day 5",
+    expected_populations={"initialPopulation": 1},
+    tags=["sho"]
+)
 def create_sho_positive_day5_onset():
     """
     Test Case 5: SHO Positive - Day 5 Onset
@@ -551,17 +589,24 @@ def create_sho_positive_day5_onset():
     )
 
     # Antibiotic - 4 QADs starting Day 5
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["meropenem"],
-            effective_start=f"2025-01-0{6+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{6+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["meropenem"],
+        start="2025-01-06T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="SHO",
+    title="SHOPositiveEscalatingCardiovascular",
+    description="Hospital-onset sepsis with escalating cardiovascular dysfunction",
+    expected_populations={"initialPopulation": 1},
+    tags=["sho", "cardiovascular"]
+)
 def create_sho_positive_escalating_cardiovascular():
     """
     Test Case 6: SHO Positive - Escalating Cardiovascular Dysfunction
@@ -631,17 +676,24 @@ def create_sho_positive_escalating_cardiovascular():
     )
 
     # Antibiotic - 4 QADs starting Day 4
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["vancomycin"],
-            effective_start=f"2025-01-0{5+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{5+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["vancomycin"],
+        start="2025-01-05T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="CardiovascularHypotension",
+    description="Sepsis with hypotension (>=2 SBP readings <90 within 3h)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "cardiovascular"]
+)
 def create_cardiovascular_hypotension():
     """
     Test Case 7: Cardiovascular Dysfunction - Hypotension Only
@@ -709,17 +761,24 @@ def create_cardiovascular_hypotension():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["piperacillin_tazobactam"],
-            effective_start=f"2025-01-0{4+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{4+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["piperacillin_tazobactam"],
+        start="2025-01-04T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="CardiovascularVasopressor",
+    description="Sepsis with new vasopressor initiation (cardiovascular dysfunction)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "cardiovascular"]
+)
 def create_cardiovascular_vasopressor():
     """
     Test Case 8: Cardiovascular Dysfunction - Vasopressor Initiation
@@ -774,17 +833,24 @@ def create_cardiovascular_vasopressor():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["ceftriaxone"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["ceftriaxone"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="RespiratoryInvasiveVent",
+    description="Sepsis with invasive mechanical ventilation (respiratory dysfunction)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "respiratory"]
+)
 def create_respiratory_invasive_vent():
     """
     Test Case 9: Respiratory Dysfunction - Invasive Ventilation
@@ -839,17 +905,24 @@ def create_respiratory_invasive_vent():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["meropenem"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["meropenem"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="RespiratoryNIVHFNC",
+    description="Sepsis with NIV/HFNC for 2+ calendar days (respiratory dysfunction)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "respiratory"]
+)
 def create_respiratory_niv_hfnc():
     """
     Test Case 10: Respiratory Dysfunction - NIV/HFNC 2+ Days
@@ -904,17 +977,24 @@ def create_respiratory_niv_hfnc():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["vancomycin"],
-            effective_start=f"2025-01-0{4+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{4+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["vancomycin"],
+        start="2025-01-04T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="MetabolicLactateElevated",
+    description="Sepsis with lactate >2.0 mmol/L (metabolic dysfunction)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "metabolic"]
+)
 def create_metabolic_lactate_elevated():
     """
     Test Case 11: Metabolic Dysfunction - Lactate Elevated
@@ -971,17 +1051,24 @@ def create_metabolic_lactate_elevated():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["levofloxacin_iv"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["levofloxacin_iv"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="RenalCreatinine2xIncrease",
+    description="Sepsis with creatinine 2x increase (renal dysfunction)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "renal"]
+)
 def create_renal_creatinine_increase():
     """
     Test Case 12: Renal Dysfunction - Creatinine 2x Increase
@@ -1048,17 +1135,24 @@ def create_renal_creatinine_increase():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["ceftriaxone"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["ceftriaxone"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="Exclusions",
+    title="RenalExcludedESRD",
+    description="ESRD patient - renal dysfunction excluded, qualifies via lactate",
+    expected_populations={"initialPopulation": 1},
+    tags=["exclusion", "renal"]
+)
 def create_renal_excluded_esrd():
     """
     Test Case 13: Renal Dysfunction Excluded - ESRD Diagnosis
@@ -1143,17 +1237,24 @@ def create_renal_excluded_esrd():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["vancomycin"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["vancomycin"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="HepaticBilirubin2xIncrease",
+    description="Sepsis with bilirubin 2x increase (hepatic dysfunction)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "hepatic"]
+)
 def create_hepatic_bilirubin_increase():
     """
     Test Case 14: Hepatic Dysfunction - Bilirubin 2x Increase
@@ -1220,17 +1321,24 @@ def create_hepatic_bilirubin_increase():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["piperacillin_tazobactam"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["piperacillin_tazobactam"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="Exclusions",
+    title="HepaticExcludedLiverDisease",
+    description="Liver disease patient - hepatic dysfunction excluded, qualifies via lactate",
+    expected_populations={"initialPopulation": 1},
+    tags=["exclusion", "hepatic"]
+)
 def create_hepatic_excluded_liver_disease():
     """
     Test Case 15: Hepatic Dysfunction Excluded - Liver Disease
@@ -1315,17 +1423,24 @@ def create_hepatic_excluded_liver_disease():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["ceftriaxone"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["ceftriaxone"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="OrganDysfunction",
+    title="CoagulationPlatelet50Decrease",
+    description="Sepsis with platelets 50% decrease (coagulation dysfunction)",
+    expected_populations={"initialPopulation": 1},
+    tags=["organ-dysfunction", "coagulation"]
+)
 def create_coagulation_platelet_decrease():
     """
     Test Case 16: Coagulation Dysfunction - Platelets 50% Decrease
@@ -1392,17 +1507,24 @@ def create_coagulation_platelet_decrease():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["meropenem"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["meropenem"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="Exclusions",
+    title="CoagulationExcludedMalignancy",
+    description="Malignancy patient - coagulation dysfunction excluded, qualifies via lactate",
+    expected_populations={"initialPopulation": 1},
+    tags=["exclusion", "coagulation"]
+)
 def create_coagulation_excluded_malignancy():
     """
     Test Case 17: Coagulation Dysfunction Excluded - Malignancy
@@ -1487,17 +1609,24 @@ def create_coagulation_excluded_malignancy():
     )
 
     # Antibiotic - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["vancomycin"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["vancomycin"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="QADException",
+    title="QADExceptionDeathBefore4",
+    description="Patient death before 4 QADs - qualifies due to death exception",
+    expected_populations={"initialPopulation": 1},
+    tags=["qad"]
+)
 def create_qad_exception_death():
     """
     Test Case 18: QAD Exception - Death Before 4 QADs
@@ -1578,6 +1707,13 @@ def create_qad_exception_death():
     return gen
 
 
+@registry.test_case(
+    series="RET",
+    title="RepeatEventTimeframeExcluded",
+    description="Second ASE within 7-day RET of first event - excluded",
+    expected_populations={"initialPopulation": 1},
+    tags=["ret"]
+)
 def create_repeat_event_timeframe_excluded():
     """
     Test Case 19: Repeat Event Timeframe - Second Event Excluded
@@ -1634,13 +1770,13 @@ def create_repeat_event_timeframe_excluded():
     )
 
     # First Event - 4 QADs
-    for day in range(4):
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["vancomycin"],
-            effective_start=f"2025-01-0{3+day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{3+day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["vancomycin"],
+        start="2025-01-03T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     # Second Event (within RET) - Blood Culture Day 7
     gen.add_blood_culture(
@@ -1661,18 +1797,24 @@ def create_repeat_event_timeframe_excluded():
     )
 
     # Second Event - 4 QADs (Jan 8, 9, 10, 11)
-    for day in range(4):
-        day_num = 8 + day
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["ceftriaxone"],
-            effective_start=f"2025-01-{day_num:02d}T08:00:00.000Z",
-            effective_end=f"2025-01-{day_num:02d}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["ceftriaxone"],
+        start="2025-01-08T08:00:00.000Z",
+        days=4,
+        share_support=False
+    )
 
     return gen
 
 
+@registry.test_case(
+    series="QADGap",
+    title="QADWith1DayGap",
+    description="Antibiotic with 1-day gaps still counts as consecutive QADs",
+    expected_populations={"initialPopulation": 1},
+    tags=["qad"]
+)
 def create_qad_with_1day_gap():
     """
     Test Case 20: QAD With 1-Day Gap - Qualifies
@@ -1729,14 +1871,14 @@ def create_qad_with_1day_gap():
 
     # Antibiotic - 4 QADs with gaps (every other day)
     # Jan 3, Jan 5, Jan 7, Jan 9
-    gap_days = [3, 5, 7, 9]
-    for day in gap_days:
-        gen.add_medication_administration(
-            encounter_id=enc_id,
-            medication_code=ANTIBIOTICS["levofloxacin_iv"],
-            effective_start=f"2025-01-0{day}T08:00:00.000Z",
-            effective_end=f"2025-01-0{day}T09:00:00.000Z"
-        )
+    gen.add_medication_course(
+        encounter_id=enc_id,
+        medication_code=ANTIBIOTICS["levofloxacin_iv"],
+        start="2025-01-03T08:00:00.000Z",
+        days=7,
+        gaps=[1, 3, 5],
+        share_support=False
+    )
 
     return gen
 
@@ -1745,8 +1887,14 @@ def create_qad_with_1day_gap():
 # Main Execution
 # =============================================================================
 
-def main():
-    """Generate all test cases and export to MADiE format."""
+def main(patterns=None, tags=None):
+    """
+    Generate all test cases and export to MADiE format.
+
+    Args:
+        patterns: Only export test cases matching these glob patterns
+        tags: Only export test cases with one of these tags
+    """
 
     print("=" * 70)
     print("Adult Sepsis Event (ASE) Test Case Generator")
@@ -1761,115 +1909,18 @@ def main():
         measurement_period_end=MEASUREMENT_PERIOD_END
     )
 
-    # Add test cases
-    test_cases = [
-        # SCO Basic Cases (1-4)
-        (create_sco_positive_basic_lactate, "SCO", "SCOPositiveBasicLactate",
-         "Community-onset sepsis with blood culture, 4 QADs, and elevated lactate (day 2)",
-         {"initialPopulation": 1}),
-
-        (create_sco_positive_multiple_organ_dysfunction, "SCO", "SCOPositiveMultipleOrgan",
-         "Community-onset sepsis with hypotension AND renal dysfunction",
-         {"initialPopulation": 1}),
-
-        (create_sco_positive_day3_boundary, "SCO", "SCOPositiveDay3Boundary",
-         "Community-onset sepsis with onset on day 3 (boundary case)",
-         {"initialPopulation": 1}),
-
-        (create_sco_positive_principal_dx_infection, "SCO", "SCOPositivePrincipalDxInfection",
-         "Community-onset sepsis via principal diagnosis infection (no blood culture)",
-         {"initialPopulation": 1}),
-
-        # SHO Cases (5-6)
-        (create_sho_positive_day5_onset, "SHO", "SHOPositiveDay5Onset",
-         "Hospital-onset sepsis with onset on day 5",
-         {"initialPopulation": 1}),
-
-        (create_sho_positive_escalating_cardiovascular, "SHO", "SHOPositiveEscalatingCardiovascular",
-         "Hospital-onset sepsis with escalating cardiovascular dysfunction",
-         {"initialPopulation": 1}),
-
-        # Cardiovascular Dysfunction Cases (7-8)
-        (create_cardiovascular_hypotension, "OrganDysfunction", "CardiovascularHypotension",
-         "Sepsis with hypotension (>=2 SBP readings <90 within 3h)",
-         {"initialPopulation": 1}),
-
-        (create_cardiovascular_vasopressor, "OrganDysfunction", "CardiovascularVasopressor",
-         "Sepsis with new vasopressor initiation (cardiovascular dysfunction)",
-         {"initialPopulation": 1}),
-
-        # Respiratory Dysfunction Cases (9-10)
-        (create_respiratory_invasive_vent, "OrganDysfunction", "RespiratoryInvasiveVent",
-         "Sepsis with invasive mechanical ventilation (respiratory dysfunction)",
-         {"initialPopulation": 1}),
-
-        (create_respiratory_niv_hfnc, "OrganDysfunction", "RespiratoryNIVHFNC",
-         "Sepsis with NIV/HFNC for 2+ calendar days (respiratory dysfunction)",
-         {"initialPopulation": 1}),
-
-        # Metabolic Dysfunction Case (11)
-        (create_metabolic_lactate_elevated, "OrganDysfunction", "MetabolicLactateElevated",
-         "Sepsis with lactate >2.0 mmol/L (metabolic dysfunction)",
-         {"initialPopulation": 1}),
-
-        # Renal Dysfunction Cases (12-13)
-        (create_renal_creatinine_increase, "OrganDysfunction", "RenalCreatinine2xIncrease",
-         "Sepsis with creatinine 2x increase (renal dysfunction)",
-         {"initialPopulation": 1}),
-
-        (create_renal_excluded_esrd, "Exclusions", "RenalExcludedESRD",
-         "ESRD patient - renal dysfunction excluded, qualifies via lactate",
-         {"initialPopulation": 1}),
-
-        # Hepatic Dysfunction Cases (14-15)
-        (create_hepatic_bilirubin_increase, "OrganDysfunction", "HepaticBilirubin2xIncrease",
-         "Sepsis with bilirubin 2x increase (hepatic dysfunction)",
-         {"initialPopulation": 1}),
-
-        (create_hepatic_excluded_liver_disease, "Exclusions", "HepaticExcludedLiverDisease",
-         "Liver disease patient - hepatic dysfunction excluded, qualifies via lactate",
-         {"initialPopulation": 1}),
-
-        # Coagulation Dysfunction Cases (16-17)
-        (create_coagulation_platelet_decrease, "OrganDysfunction", "CoagulationPlatelet50Decrease",
-         "Sepsis with platelets 50% decrease (coagulation dysfunction)",
-         {"initialPopulation": 1}),
-
-        (create_coagulation_excluded_malignancy, "Exclusions", "CoagulationExcludedMalignancy",
-         "Malignancy patient - coagulation dysfunction excluded, qualifies via lactate",
-         {"initialPopulation": 1}),
-
-        # QAD Exception Cases (18, 20)
-        (create_qad_exception_death, "QADException", "QADExceptionDeathBefore4",
-         "Patient death before 4 QADs - qualifies due to death exception",
-         {"initialPopulation": 1}),
-
-        # Repeat Event Timeframe Case (19)
-        (create_repeat_event_timeframe_excluded, "RET", "RepeatEventTimeframeExcluded",
-         "Second ASE within 7-day RET of first event - excluded",
-         {"initialPopulation": 1}),
-
-        # QAD Gap Case (20)
-        (create_qad_with_1day_gap, "QADGap", "QADWith1DayGap",
-         "Antibiotic with 1-day gaps still counts as consecutive QADs",
-         {"initialPopulation": 1}),
-    ]
-
-    for func, series, title, desc, expected in test_cases:
-        exporter.add_test_case(
-            generator_func=func,
-            series=series,
-            title=title,
-            description=desc,
-            expected_populations=expected
-        )
-        print(f"  Added: {title}")
+    # Register the selected test cases (all of them by default); only
+    # their generator functions run during export
+    selected = registry.select(patterns, tags)
+    for tc in selected:
+        print(f"  Added: {tc['title']}")
+    selected.register_all(exporter)
 
     # Export
     output_path = exporter.export(create_zip=True)
 
     print("\n" + "=" * 70)
-    print(f"Generated {len(test_cases)} test cases")
+    print(f"Generated {len(selected)} test cases")
     print(f"Output: {output_path}")
     print("=" * 70)
     print("\nNext steps:")
@@ -1879,4 +1930,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(**parse_test_case_selection(description="Generate sepsis test cases"))
@@ -173,6 +173,87 @@ FHIR_EXTENSIONS = {
     "cqfm-isTestCase": "http://hl7.org/fhir/us/cqfmeasures/StructureDefinition/cqfm-isTestCase",
 }
 
+# =============================================================================
+# REFERENCE PATHS
+# =============================================================================
+
+# Elements that hold a Reference, per FHIR R4 resource type, as dotted paths
+# (lists are traversed at every step). Covers the base resource type of every
+# profile in QICORE_PROFILES, plus resources the bundle generator adds
+# (Specimen, MeasureReport). Contained resources, Bundle entries and
+# Parameters are handled structurally by the reference rewriter.
+REFERENCE_PATHS = {
+    "Patient": ("generalPractitioner", "managingOrganization", "link.other", "contact.organization"),
+    "Encounter": ("subject", "episodeOfCare", "basedOn", "participant.individual", "appointment",
+                  "reasonReference", "diagnosis.condition", "account", "hospitalization.origin",
+                  "hospitalization.destination", "location.location", "serviceProvider", "partOf"),
+    "Condition": ("subject", "encounter", "recorder", "asserter", "stage.assessment", "evidence.detail"),
+    "Coverage": ("policyHolder", "subscriber", "beneficiary", "payor", "contract"),
+    "Location": ("managingOrganization", "partOf", "endpoint"),
+    "Observation": ("basedOn", "partOf", "subject", "focus", "encounter", "performer", "specimen",
+                    "device", "hasMember", "derivedFrom"),
+    "Medication": ("manufacturer", "ingredient.itemReference"),
+    "MedicationRequest": ("reportedReference", "medicationReference", "subject", "encounter",
+                          "supportingInformation", "requester", "performer", "recorder",
+                          "reasonReference", "basedOn", "insurance", "priorPrescription",
+                          "detectedIssue", "eventHistory", "dispenseRequest.performer"),
+    "MedicationAdministration": ("partOf", "medicationReference", "subject", "context",
+                                 "supportingInformation", "performer.actor", "reasonReference",
+                                 "request", "device", "eventHistory"),
+    "MedicationDispense": ("partOf", "statusReasonReference", "medicationReference", "subject", "context",
+                           "supportingInformation", "performer.actor", "location",
+                           "authorizingPrescription", "destination", "receiver",
+                           "substitution.responsibleParty", "detectedIssue", "eventHistory"),
+    "MedicationStatement": ("basedOn", "partOf", "medicationReference", "subject", "context",
+                            "informationSource", "derivedFrom", "reasonReference"),
+    "Procedure": ("basedOn", "partOf", "subject", "encounter", "recorder", "asserter",
+                  "performer.actor", "performer.onBehalfOf", "location", "reasonReference",
+                  "report", "complicationDetail", "focalDevice.manipulated", "usedReference"),
+    "DiagnosticReport": ("basedOn", "subject", "encounter", "performer", "resultsInterpreter",
+                         "specimen", "result", "imagingStudy", "media.link"),
+    "ServiceRequest": ("replaces", "basedOn", "subject", "encounter", "requester", "performer",
+                       "locationReference", "reasonReference", "insurance", "supportingInfo",
+                       "specimen", "relevantHistory"),
+    "Device": ("patient", "owner", "location", "parent", "definition"),
+    "DeviceRequest": ("basedOn", "priorRequest", "codeReference", "subject", "encounter", "requester",
+                      "performer", "reasonReference", "insurance", "supportingInfo", "relevantHistory"),
+    "DeviceUseStatement": ("basedOn", "subject", "derivedFrom", "source", "device", "reasonReference"),
+    "Practitioner": ("qualification.issuer",),
+    "PractitionerRole": ("practitioner", "organization", "location", "healthcareService", "endpoint"),
+    "Organization": ("partOf", "endpoint"),
+    "CarePlan": ("basedOn", "replaces", "partOf", "subject", "encounter", "author", "contributor",
+                 "careTeam", "addresses", "supportingInfo", "goal", "activity.outcomeReference",
+                 "activity.reference", "activity.detail.reasonReference", "activity.detail.goal",
+                 "activity.detail.location", "activity.detail.performer",
+                 "activity.detail.productReference"),
+    "Goal": ("subject", "expressedBy", "addresses", "outcomeReference"),
+    "NutritionOrder": ("patient", "encounter", "orderer", "allergyIntolerance"),
+    "Immunization": ("patient", "encounter", "location", "manufacturer", "performer.actor",
+                     "reasonReference", "reaction.detail"),
+    "ImmunizationEvaluation": ("patient", "authority", "immunizationEvent"),
+    "ImmunizationRecommendation": ("patient", "authority", "recommendation.supportingImmunization",
+                                   "recommendation.supportingPatientInformation"),
+    "AllergyIntolerance": ("patient", "encounter", "recorder", "asserter"),
+    "AdverseEvent": ("subject", "encounter", "location", "recorder", "contributor",
+                     "resultingCondition", "subjectMedicalHistory", "referenceDocument", "study",
+                     "suspectEntity.instance", "suspectEntity.causality.author"),
+    "Communication": ("basedOn", "partOf", "inResponseTo", "subject", "about", "encounter",
+                      "recipient", "sender", "reasonReference", "payload.contentReference"),
+    "CommunicationRequest": ("basedOn", "replaces", "subject", "about", "encounter", "requester",
+                             "recipient", "sender", "reasonReference", "payload.contentReference"),
+    "Specimen": ("subject", "parent", "request", "collection.collector", "processing.additive",
+                 "container.additiveReference"),
+    "MeasureReport": ("subject", "reporter", "evaluatedResource", "group.population.subjectResults",
+                      "group.stratifier.stratum.population.subjectResults"),
+}
+
+# Reference-bearing elements every resource may have
+COMMON_REFERENCE_PATHS = (
+    "extension.valueReference",
+    "extension.extension.valueReference",
+    "modifierExtension.valueReference",
+)
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -199,3 +280,16 @@ def get_meta_with_profile(resource_type: str) -> dict:
     if profile_url:
         return {"profile": [profile_url]}
     return {}
+
+
+def get_reference_paths(resource_type: str) -> tuple:
+    """
+    Get the reference-bearing element paths for a resource type.
+
+    Returns:
+        Tuple of dotted paths, or None if the resource type is not in REFERENCE_PATHS
+    """
+    paths = REFERENCE_PATHS.get(resource_type)
+    if paths is None:
+        return None
+    return paths + COMMON_REFERENCE_PATHS
@@ -0,0 +1,69 @@
+"""
+Make the repository importable as the fhir_test_utils package for the tests
+(the checkout directory may have any name), and provide the generator,
+registry and exporter factories the tests share.
+"""
+
+import os
+import sys
+import importlib.util
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "fhir_test_utils" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "fhir_test_utils", os.path.join(ROOT, "__init__.py"), submodule_search_locations=[ROOT]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["fhir_test_utils"] = module
+    spec.loader.exec_module(module)
+
+# Imported once the package is registered above
+from fhir_test_utils import FHIRBundleGenerator, MADiEExporter
+from fhir_test_utils import TestCaseRegistry as CaseRegistry
+
+
+@pytest.fixture
+def make_generator():
+    """Factory for generators holding a single Patient"""
+    def make(name, gender="female", birth_date="1980-01-01"):
+        gen = FHIRBundleGenerator(name)
+        gen.add_patient(gender=gender, birth_date=birth_date)
+        return gen
+    return make
+
+
+@pytest.fixture
+def make_registry(make_generator):
+    """
+    Factory for test case registries: count single-patient cases "Case0",
+    "Case1", ... in series "Series" (birth_dates overrides the birth date of
+    a case by index), followed by any (title, generator function) cases.
+    """
+    def make(count=0, birth_dates=None, cases=()):
+        registry = CaseRegistry()
+        for i in range(count):
+            def create(i=i):
+                return make_generator(f"Case{i}", birth_date=(birth_dates or {}).get(i, "1980-01-01"))
+            registry.add("Series", f"Case{i}", f"Test case {i}", create, {"initialPopulation": 1})
+        for title, generator_func in cases:
+            registry.add("Series", title, title, generator_func, {"initialPopulation": 1})
+        return registry
+    return make
+
+
+@pytest.fixture
+def make_exporter(make_registry):
+    """
+    Factory for exporters of a registry (or of that many single-patient
+    cases); keyword arguments go to the exporter.
+    """
+    def make(registry=0, exporter_class=MADiEExporter, **kwargs):
+        if not isinstance(registry, CaseRegistry):
+            registry = make_registry(registry)
+        exporter = exporter_class("TestMeasure", "0.0.000", **kwargs)
+        registry.register_all(exporter)
+        return exporter
+    return make
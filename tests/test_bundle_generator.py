@@ -0,0 +1,81 @@
+"""FHIRBundleGenerator: shared fragments, the referrer index and medication courses"""
+
+import json
+
+from fhir_test_utils import DeterministicIdStrategy, FHIRBundleGenerator, use_id_strategy
+
+
+def test_observation_series_edits_stay_local(make_generator):
+    gen = make_generator("SharedFragments")
+    observation_ids = gen.add_observation_series(
+        "enc-1", ["2024-01-01T08:00:00Z", "2024-01-01T09:00:00Z"], [95, 110]
+    )
+
+    edited = gen.edit_resource("Observation", observation_ids[0])
+    edited["meta"]["profile"].append("http://example.org/profile")
+    edited["code"]["coding"][0]["code"] = "EDITED"
+    edited["referenceRange"][0]["low"]["value"] = 0
+
+    sibling = gen.get_by_id("Observation", observation_ids[1])
+    assert len(sibling["meta"]["profile"]) == 1
+    assert sibling["code"]["coding"][0]["code"] == "2339-0"
+    assert sibling["referenceRange"][0]["low"]["value"] == 70
+
+
+def test_medication_course_edits_stay_local(make_generator):
+    gen = make_generator("SharedFragments")
+    default_code = dict(FHIRBundleGenerator.DEFAULT_ADMINISTERED_MEDICATION)
+    med_admin_ids = gen.add_medication_course("enc-1", "2024-01-01T08:00:00Z", days=2)
+
+    edited = gen.edit_resource("MedicationAdministration", med_admin_ids[0])
+    edited["medicationCodeableConcept"]["coding"][0]["code"] = "EDITED"
+
+    sibling = gen.get_by_id("MedicationAdministration", med_admin_ids[1])
+    assert sibling["medicationCodeableConcept"]["coding"][0]["code"] == default_code["code"]
+    assert FHIRBundleGenerator.DEFAULT_ADMINISTERED_MEDICATION == default_code
+
+
+def test_medication_administration_does_not_alias_default_code(make_generator):
+    gen = make_generator("SharedFragments")
+    med_admin_id = gen.add_medication_administration("enc-1", "2024-01-01T08:00:00Z", "2024-01-01T09:00:00Z")
+
+    edited = gen.edit_resource("MedicationAdministration", med_admin_id)
+    edited["medicationCodeableConcept"]["coding"][0]["code"] = "EDITED"
+
+    assert FHIRBundleGenerator.DEFAULT_ADMINISTERED_MEDICATION["code"] != "EDITED"
+
+
+def test_referrer_index_keeps_entries_with_duplicate_ids(make_generator):
+    gen = make_generator("SharedFragments")
+    gen.bundle = {
+        "resourceType": "Bundle",
+        "type": "transaction",
+        "entry": [
+            {"resource": {"resourceType": "Observation", "id": "obs-dup",
+                          "encounter": {"reference": f"Encounter/{encounter_id}"}}}
+            for encounter_id in ("enc-a", "enc-b")
+        ]
+    }
+
+    for encounter_id in ("enc-a", "enc-b"):
+        referrers = gen.referrers_of("Encounter", encounter_id)
+        assert [r["encounter"]["reference"] for r in referrers] == [f"Encounter/{encounter_id}"]
+
+
+def test_unshared_medication_course_matches_single_administrations(make_generator):
+    def build(add_doses):
+        with use_id_strategy(DeterministicIdStrategy(seed=7)):
+            gen = make_generator("Course")
+            add_doses(gen)
+        return json.dumps(gen.bundle)
+
+    def single_doses(gen):
+        for day in (3, 5, 7, 9):
+            gen.add_medication_administration("enc-1", f"2025-01-0{day}T08:00:00.000Z",
+                                              f"2025-01-0{day}T09:00:00.000Z")
+
+    def course(gen):
+        gen.add_medication_course("enc-1", "2025-01-03T08:00:00.000Z", days=7, gaps=[1, 3, 5],
+                                  share_support=False)
+
+    assert build(course) == build(single_doses)
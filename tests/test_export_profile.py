@@ -0,0 +1,70 @@
+"""Profiled MADiE exports"""
+
+import json
+import time
+
+import pytest
+
+from fhir_test_utils import FHIRBundleGenerator, MADiEExporter
+
+
+BUFFER_SIZE = 32 * 1024 * 1024
+
+
+def _allocating_case():
+    buffer = bytearray(BUFFER_SIZE)
+    gen = FHIRBundleGenerator("Allocating")
+    gen.add_patient(gender="female", birth_date="1980-01-01")
+    del buffer
+    return gen
+
+
+def _slow_small_case():
+    # Slow enough to still be running while the previous case is written
+    time.sleep(0.3)
+    gen = FHIRBundleGenerator("Small")
+    gen.add_patient(gender="male", birth_date="1975-06-01")
+    return gen
+
+
+class _AllocatingWriterExporter(MADiEExporter):
+    """Briefly holds a large buffer while writing each test case"""
+
+    def _write_test_case(self, *args, **kwargs):
+        time.sleep(0.1)
+        buffer = bytearray(BUFFER_SIZE)
+        time.sleep(0.1)
+        del buffer
+        return super()._write_test_case(*args, **kwargs)
+
+
+@pytest.fixture
+def profile(tmp_path, make_exporter, make_registry):
+    """Export (title, generator function) cases with profiling; return the generator peaks by title"""
+    def run(cases, exporter_class=MADiEExporter, **kwargs):
+        exporter = make_exporter(make_registry(cases=cases), exporter_class=exporter_class)
+        output_dir = tmp_path / "export"
+        exporter.export(output_dir=str(output_dir), profile=True, **kwargs)
+
+        profile_path = output_dir / MADiEExporter.EXPORT_PROFILE
+        if not profile_path.exists():
+            profile_path = tmp_path / f"export.{MADiEExporter.EXPORT_PROFILE}"
+        with open(profile_path) as f:
+            return {record["title"]: record["generator_peak_bytes"] for record in json.load(f)["test_cases"]}
+    return run
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generator_peak_matches_its_allocation(profile, jobs):
+    peaks = profile([("Small", _slow_small_case), ("Allocating", _allocating_case)],
+                    create_zip=False, jobs=jobs)
+    assert BUFFER_SIZE <= peaks["SeriesAllocating"] < BUFFER_SIZE * 1.1
+    assert peaks["SeriesSmall"] < BUFFER_SIZE / 10
+
+
+def test_generator_peak_excludes_concurrent_writes(profile):
+    # The second case would otherwise build while the first one is written
+    peaks = profile([("First", _slow_small_case), ("Second", _slow_small_case)],
+                    exporter_class=_AllocatingWriterExporter, create_zip=False)
+    assert peaks["SeriesFirst"] < BUFFER_SIZE / 10
+    assert peaks["SeriesSecond"] < BUFFER_SIZE / 10
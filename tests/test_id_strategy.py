@@ -0,0 +1,23 @@
+"""Deterministic resource IDs"""
+
+import uuid
+import pickle
+
+from fhir_test_utils import DeterministicIdStrategy
+
+
+def test_same_seed_same_ids():
+    first, second = DeterministicIdStrategy(seed=42), DeterministicIdStrategy(seed=42)
+    assert [first.generate_id() for _ in range(5)] == [second.generate_id() for _ in range(5)]
+
+    restored = pickle.loads(pickle.dumps(first))
+    assert restored.generate_id() == first.generate_id()
+
+
+def test_ids_are_uuid4_spread_over_all_groups():
+    ids = DeterministicIdStrategy(seed=1).derive("Series", "Case")
+    generated = [ids.generate_id() for _ in range(1000)]
+
+    assert all(uuid.UUID(value).version == 4 for value in generated)
+    assert len({value[:8] for value in generated}) == len(generated)
+    assert len({value.split("-")[-1] for value in generated}) == len(generated)
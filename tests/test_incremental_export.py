@@ -0,0 +1,113 @@
+"""Incremental MADiE exports"""
+
+import os
+import json
+import hashlib
+
+import pytest
+
+from fhir_test_utils import MADiEExporter
+
+
+@pytest.fixture
+def export(make_exporter):
+    """Export a registry to a directory"""
+    def run(registry, output_dir, **kwargs):
+        make_exporter(registry).export(output_dir=output_dir, create_zip=False, **kwargs)
+    return run
+
+
+def _case_dirs(output_dir):
+    return sorted(name for name in os.listdir(output_dir)
+                  if os.path.isdir(os.path.join(output_dir, name)))
+
+
+def _bundle_files(output_dir):
+    """{case title: (bundle path, content)} of an export"""
+    files = {}
+    for case_dir in _case_dirs(output_dir):
+        for name in os.listdir(os.path.join(output_dir, case_dir)):
+            path = os.path.join(output_dir, case_dir, name)
+            with open(path) as f:
+                files[name] = (path, f.read())
+    return files
+
+
+def _age_files(files):
+    """Set bundle mtimes a day back, so rewrites show up as newer mtimes"""
+    for path, _ in files.values():
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 86400 * 10 ** 9))
+    return {name: os.stat(path).st_mtime_ns for name, (path, _) in files.items()}
+
+
+def _manifest_hashes(output_dir):
+    with open(os.path.join(output_dir, MADiEExporter.EXPORT_MANIFEST)) as f:
+        return {record["title"]: record["hash"] for record in json.load(f)["cases"]}
+
+
+def _madie_ids(output_dir):
+    with open(os.path.join(output_dir, ".madie")) as f:
+        return sorted(case["patientId"] for case in json.load(f))
+
+
+def test_incremental_over_plain_export_replaces_old_cases(tmp_path, export, make_registry):
+    output_dir = str(tmp_path / "export")
+    registry = make_registry(5)
+
+    export(registry, output_dir)
+    old_dirs = _case_dirs(output_dir)
+    export(registry, output_dir, incremental=True)
+
+    new_dirs = _case_dirs(output_dir)
+    assert len(new_dirs) == 5
+    assert not set(old_dirs) & set(new_dirs)
+    assert new_dirs == _madie_ids(output_dir)
+
+
+def test_incremental_export_of_selection_removes_unselected_cases(tmp_path, export, make_registry):
+    output_dir = str(tmp_path / "export")
+    registry = make_registry(5)
+
+    export(registry, output_dir, incremental=True)
+    export(registry.select(["Case1", "Case3"]), output_dir, incremental=True)
+
+    assert len(_case_dirs(output_dir)) == 2
+    assert _case_dirs(output_dir) == _madie_ids(output_dir)
+
+
+def test_identical_rerun_rewrites_nothing(tmp_path, capsys, export, make_registry):
+    output_dir = str(tmp_path / "export")
+    registry = make_registry(5)
+
+    export(registry, output_dir, incremental=True)
+    first = _bundle_files(output_dir)
+    mtimes = _age_files(first)
+    export(registry, output_dir, incremental=True)
+
+    assert "Incremental export: 0 of 5 test cases rewritten" in capsys.readouterr().out
+    second = _bundle_files(output_dir)
+    # Same patient IDs (directories and file names) and byte-identical bundles
+    assert second == first
+    assert {name: os.stat(path).st_mtime_ns for name, (path, _) in second.items()} == mtimes
+
+
+def test_edited_case_is_the_only_one_rewritten(tmp_path, capsys, export, make_registry):
+    output_dir = str(tmp_path / "export")
+
+    export(make_registry(5), output_dir, incremental=True)
+    first = _bundle_files(output_dir)
+    hashes = _manifest_hashes(output_dir)
+    mtimes = _age_files(first)
+    export(make_registry(5, birth_dates={2: "1990-05-05"}), output_dir, incremental=True)
+
+    assert "Incremental export: 1 of 5 test cases rewritten" in capsys.readouterr().out
+    second = _bundle_files(output_dir)
+    assert second.keys() == first.keys()
+    changed = [name for name, (path, _) in second.items() if os.stat(path).st_mtime_ns != mtimes[name]]
+    assert changed == [name for name in second if second[name][1] != first[name][1]]
+    assert len(changed) == 1 and "1990-05-05" in second[changed[0]][1]
+
+    new_hashes = _manifest_hashes(output_dir)
+    assert {title for title in hashes if new_hashes[title] != hashes[title]} == {"Case2"}
+    assert hashlib.sha256(second[changed[0]][1].encode("utf-8")).hexdigest() == new_hashes["Case2"]
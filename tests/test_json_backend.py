@@ -0,0 +1,112 @@
+"""The orjson backend must produce the same text as the stdlib json module"""
+
+import json
+import uuid
+import enum
+import random
+import datetime
+import dataclasses
+
+import pytest
+
+from fhir_test_utils import json_backend, FHIRBundleGenerator
+
+
+pytestmark = pytest.mark.skipif(not json_backend.ORJSON_AVAILABLE, reason="orjson is not installed")
+
+EDGE_STRINGS = [
+    "plain",
+    "".join(chr(c) for c in range(0x20)),
+    "del\x7fchar",
+    "quote\" backslash\\ slash/",
+    "café ☃ \U0001f600",
+    "",
+]
+
+EDGE_NUMBERS = [0, -1, 2 ** 63 - 1, 2 ** 64, 0.1, -0.0, 1.5, 1e16, 1e-05, 0.00001234, 123456789.123, 1e300]
+
+
+@pytest.fixture
+def orjson_backend():
+    previous = json_backend.get_json_backend()
+    json_backend.set_json_backend("orjson")
+    yield
+    json_backend.set_json_backend(previous)
+
+
+def _assert_same(obj):
+    assert json_backend.dumps(obj, indent=2) == json.dumps(obj, indent=2)
+    assert json_backend.dumps(obj, separators=(",", ":")) == json.dumps(obj, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("value", EDGE_STRINGS)
+def test_strings(orjson_backend, value):
+    _assert_same({"text": value, "list": [value], value: 1})
+
+
+@pytest.mark.parametrize("value", EDGE_NUMBERS)
+def test_numbers(orjson_backend, value):
+    _assert_same({"value": value, "values": [value, {"nested": value}]})
+
+
+def test_literals_and_empty_containers(orjson_backend):
+    _assert_same({"t": True, "f": False, "n": None, "a": [], "o": {}, "nan": float("nan")})
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class _Level(enum.IntEnum):
+    HIGH = 3
+
+
+class _Text(str):
+    pass
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int = 1
+
+
+NON_JSON_VALUES = [
+    datetime.datetime(2024, 1, 1, 8, 30),
+    datetime.date(2024, 1, 1),
+    uuid.UUID(int=1),
+    _Color.RED,
+    _Point(),
+    {1, 2},
+    b"bytes",
+    (uuid.UUID(int=2),),
+]
+
+
+@pytest.mark.parametrize("value", NON_JSON_VALUES, ids=lambda value: type(value).__name__)
+def test_non_json_values_raise_like_stdlib(orjson_backend, value):
+    for kwargs in ({"indent": 2}, {"separators": (",", ":")}):
+        with pytest.raises(TypeError) as expected:
+            json.dumps({"a": [value]}, **kwargs)
+        with pytest.raises(TypeError) as actual:
+            json_backend.dumps({"a": [value]}, **kwargs)
+        assert str(actual.value) == str(expected.value)
+
+
+@pytest.mark.parametrize("value", [_Level.HIGH, _Text("text")], ids=lambda value: type(value).__name__)
+def test_str_and_int_subclasses(orjson_backend, value):
+    _assert_same({"value": value, "values": [value]})
+
+
+def test_random_strings(orjson_backend):
+    rng = random.Random(0)
+    alphabet = [chr(c) for c in range(0x80)] + ["é", " ", "\U0001f600"]
+    for _ in range(2000):
+        value = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        _assert_same({"value": value})
+
+
+def test_bundle(orjson_backend):
+    gen = FHIRBundleGenerator("JsonBackendCase")
+    gen.add_patient(gender="male", birth_date="1970-01-01")
+    bundle = gen.get_bundle()
+    assert json_backend.dumps(bundle, indent=2) == json.dumps(bundle, indent=2)
@@ -0,0 +1,79 @@
+"""Reading and diffing MADiE exports"""
+
+import pytest
+
+from fhir_test_utils import DeterministicIdStrategy, MADiEExportReader, diff_exports
+
+
+@pytest.fixture
+def suite(make_generator, make_registry):
+    """Registry of lab test cases; glucose overrides a case's reading by title"""
+    def make(titles=("Normal", "High", "Low"), glucose=None):
+        readings = {"Normal": 100, "High": 250, "Low": 50}
+        readings.update(glucose or {})
+
+        def lab_case(title):
+            def create():
+                gen = make_generator(title)
+                enc_id = gen.add_encounter(start="2025-01-10T08:00:00.000Z", end="2025-01-12T08:00:00.000Z")
+                gen.add_observation(enc_id, value=readings[title], effective_datetime="2025-01-10T09:00:00.000Z")
+                return gen
+            return create
+
+        return make_registry(cases=[(title, lab_case(title)) for title in titles])
+    return make
+
+
+@pytest.fixture
+def export(tmp_path, make_exporter):
+    """Export a registry; returns the export ZIP path"""
+    def run(name, registry, seed=0):
+        exporter = make_exporter(registry, id_strategy=DeterministicIdStrategy(seed=seed))
+        return exporter.export(output_dir=str(tmp_path / name))
+    return run
+
+
+def test_reader_yields_test_cases_with_bundles(export, suite):
+    with MADiEExportReader(export("export", suite())) as reader:
+        assert len(reader) == 3
+        cases = [(test_case["key"], bundle["resourceType"]) for test_case, bundle in reader.bundles()]
+        assert [case["patientId"] for case in reader.readme] == [case["patientId"] for case in reader.metadata]
+    assert cases == [("SeriesNormal", "Bundle"), ("SeriesHigh", "Bundle"), ("SeriesLow", "Bundle")]
+
+
+def test_exports_with_different_ids_do_not_differ(export, suite):
+    old, new = export("old", suite(), seed=1), export("new", suite(), seed=2)
+
+    diff = diff_exports(old, new)
+    assert not diff
+    assert diff.unchanged == ["SeriesNormal", "SeriesHigh", "SeriesLow"]
+
+
+def test_changed_observation_value_is_a_field_change(export, suite):
+    diff = diff_exports(export("old", suite(), seed=1), export("new", suite(glucose={"High": 260}), seed=2))
+
+    assert list(diff.changed) == ["SeriesHigh"]
+    modified = {change["resourceType"]: change["changes"] for change in diff.changed["SeriesHigh"]["modified"]}
+    assert modified["Observation"] == [("valueQuantity.value", 250, 260)]
+    # Only references to the changed Observation differ elsewhere
+    assert all(new.startswith("Observation/") for resource_type, changes in modified.items()
+               if resource_type != "Observation" for _, _, new in changes)
+
+
+def test_added_and_removed_cases(export, suite):
+    diff = diff_exports(export("old", suite(("Normal", "High"))), export("new", suite(("Normal", "Low"))))
+
+    assert diff.added == ["SeriesLow"]
+    assert diff.removed == ["SeriesHigh"]
+    assert diff.unchanged == ["SeriesNormal"]
+    assert not diff.changed
+
+
+def test_directory_diff_matches_zip_diff(tmp_path, export, suite):
+    old = export("old", suite(("Normal", "High")), seed=1)
+    new = export("new", suite(("High", "Low"), {"High": 260}), seed=2)
+
+    from_zips = diff_exports(old, new)
+    from_directories = diff_exports(str(tmp_path / "old"), str(tmp_path / "new"))
+    assert from_zips
+    assert from_directories == from_zips
@@ -0,0 +1,18 @@
+"""Saving parameter sweeps as bundle files"""
+
+from fhir_test_utils import ParameterGrid, ParameterSweep
+
+
+def test_save_sanitizes_and_deduplicates_file_names(tmp_path, make_generator):
+    sweep = ParameterSweep(
+        factory=lambda value, unit: make_generator(f"Glucose{value}"),
+        parameters=ParameterGrid(value=[39, 40], unit=["mg/dL", "mmol/L", "MG/DL"]),
+        series="Hypo/",
+        title="Glucose{value}{unit}"
+    )
+
+    assert sweep.save(str(tmp_path)) == 6
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "Hypo_Glucose39MG_DL-2.json", "Hypo_Glucose39mg_dL.json", "Hypo_Glucose39mmol_L.json",
+        "Hypo_Glucose40MG_DL-2.json", "Hypo_Glucose40mg_dL.json", "Hypo_Glucose40mmol_L.json",
+    ]
@@ -0,0 +1,37 @@
+"""Synthetic population NDJSON output"""
+
+import os
+import json
+
+import pytest
+
+from fhir_test_utils.population import PopulationGenerator
+
+
+def _read_ndjson(output_dir):
+    resources = {}
+    for name in sorted(os.listdir(output_dir)):
+        if name.endswith(".ndjson"):
+            with open(os.path.join(output_dir, name)) as f:
+                resources[name] = [json.loads(line) for line in f]
+    return resources
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_resources_are_written_once(tmp_path, workers):
+    manifest = PopulationGenerator(seed=3).generate(str(tmp_path), 12, workers=workers)
+
+    resources = _read_ndjson(str(tmp_path))
+    for name, items in resources.items():
+        ids = [resource["id"] for resource in items]
+        assert len(ids) == len(set(ids)), name
+    counts = {output["type"]: output["count"] for output in manifest["output"]}
+    assert counts["Patient"] == 12
+    assert counts["Practitioner"] == len(resources["Practitioner.ndjson"])
+
+
+def test_output_does_not_depend_on_workers(tmp_path):
+    PopulationGenerator(seed=3).generate(str(tmp_path / "serial"), 12, workers=1)
+    PopulationGenerator(seed=3).generate(str(tmp_path / "sharded"), 12, workers=3)
+
+    assert _read_ndjson(str(tmp_path / "serial")) == _read_ndjson(str(tmp_path / "sharded"))
@@ -0,0 +1,168 @@
+"""VSACClient against a local $expand server"""
+
+import json
+import asyncio
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+from fhir_test_utils.vsac_client import (
+    AsyncVSACClient, RateLimiter, VSACClient, VSACNotFoundError
+)
+
+
+MISSING_OID = "9.9.9"
+
+
+class ExpandHandler(BaseHTTPRequestHandler):
+    """Serves one concept per OID (20 for OIDs starting with 7.); 404 for MISSING_OID"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        oid = url.path.split("/")[-2]
+        query = parse_qs(url.query)
+        self.server.requests.append((oid, self.headers.get("If-None-Match")))
+
+        etag = f'"{oid}"'
+        if oid == MISSING_OID:
+            status, body = 404, {"resourceType": "OperationOutcome", "issue": [{"diagnostics": "missing"}]}
+        elif self.headers.get("If-None-Match") == etag:
+            status, body = 304, None
+        else:
+            total = 20 if oid.startswith("7.") else 1
+            offset = int(query.get("offset", [0])[0])
+            count = int(query.get("count", [total])[0])
+            contains = [{"system": "http://example.org", "code": f"{oid}-{i}", "display": "Code"}
+                        for i in range(offset, min(total, offset + count))]
+            status, body = 200, {"resourceType": "ValueSet", "version": "1",
+                                 "expansion": {"total": total, "contains": contains}}
+
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ExpandHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+
+
+@pytest.fixture
+def make_client(server, tmp_path):
+    clients = []
+
+    def make(**kwargs):
+        client = VSACClient("key", verbose=False, cache_dir=str(tmp_path / "cache"), **kwargs)
+        client.VSAC_FHIR_URL = f"http://127.0.0.1:{server.server_port}/ValueSet"
+        clients.append(client)
+        return client
+
+    server.requests.clear()
+    yield make
+    for client in clients:
+        client.close()
+
+
+OIDS = {"a": "1.1", "b": "1.2", "a_again": "1.1", "missing": MISSING_OID, "missing_again": MISSING_OID}
+
+
+@pytest.mark.parametrize("force_refresh", [False, True])
+def test_download_multiple_matches_serial(make_client, force_refresh):
+    serial = make_client()
+    serial_results = serial.download_multiple(OIDS, force_refresh=force_refresh)
+    serial.clear_cache()
+
+    parallel = make_client()
+    parallel_results = parallel.download_multiple(OIDS, force_refresh=force_refresh, max_workers=4)
+
+    assert list(parallel_results) == list(OIDS)
+    assert parallel_results == serial_results
+    assert parallel.get_statistics() == serial.get_statistics()
+
+
+def test_download_multiple_raises_first_error(make_client):
+    with pytest.raises(VSACNotFoundError):
+        make_client().download_multiple(OIDS, continue_on_error=False, max_workers=4)
+
+
+def test_concurrent_streams_of_one_valueset(make_client, tmp_path):
+    client = make_client()
+    first = client.iter_codes("7.1", page_size=5)
+    second = client.iter_codes("7.1", page_size=5)
+
+    # Interleave the two streams page by page
+    codes_first, codes_second = [], []
+    for _ in range(20):
+        codes_first.append(next(first))
+        codes_second.append(next(second))
+    assert list(first) == [] and list(second) == []
+
+    assert codes_first == codes_second
+    assert len(codes_first) == 20
+    cache_files = sorted(path.name for path in (tmp_path / "cache").iterdir())
+    assert not [name for name in cache_files if name.endswith(".part")]
+    assert list(client.iter_codes("7.1")) == codes_first
+
+
+def test_not_modified_counts_as_revalidated_only(make_client, tmp_path):
+    codes = make_client().get_codes("1.5")
+
+    client = make_client(cache_ttl=0)
+    assert client.get_codes("1.5") == codes
+    stats = client.get_statistics()
+    assert stats["revalidated"] == 1
+    assert stats["cache_hits"] == 0
+    assert not [path for path in (tmp_path / "cache").iterdir() if path.name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("force_refresh", [False, True])
+def test_async_download_many_matches_serial(make_client, server, force_refresh):
+    serial = make_client()
+    serial_results = serial.download_multiple(OIDS, force_refresh=force_refresh)
+    serial.clear_cache()
+    serial_requests = list(server.requests)
+    server.requests.clear()
+
+    async def download():
+        async with AsyncVSACClient(client=make_client(), use_aiohttp=False) as client:
+            results = await client.download_many(OIDS, force_refresh=force_refresh, concurrency=4)
+            return results, client.get_statistics()
+
+    results, stats = asyncio.run(download())
+    assert list(results) == list(OIDS)
+    assert results == serial_results
+    assert stats == serial.get_statistics()
+    assert sorted(server.requests) == sorted(serial_requests)
+
+
+def test_per_host_cap_is_shared_with_event_loops():
+    limiter = RateLimiter(max_per_host=1)
+
+    async def admitted():
+        async with limiter.request_async("host"):
+            return True
+
+    async def try_admission():
+        try:
+            return await asyncio.wait_for(admitted(), timeout=0.1)
+        except asyncio.TimeoutError:
+            return False
+
+    with limiter.request("host"):
+        assert asyncio.run(try_admission()) is False
+    assert asyncio.run(try_admission()) is True
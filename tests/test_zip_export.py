@@ -0,0 +1,65 @@
+"""ZIP creation and sharding of MADiE exports"""
+
+import os
+import json
+import zipfile
+
+import pytest
+
+from fhir_test_utils import madie_exporter
+
+
+@pytest.mark.parametrize("compression_level", [None, 0, 9])
+def test_single_archive(tmp_path, compression_level, make_exporter):
+    zip_path = make_exporter(3).export(output_dir=str(tmp_path / "export"), compression_level=compression_level)
+
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert zipf.testzip() is None
+        names = zipf.namelist()
+        madie = json.loads(zipf.read(".madie"))
+    assert {"README.txt", ".madie"} <= set(names)
+    assert len(names) == 2 + len(madie) == 5
+
+
+def test_parallel_compression_matches_serial(tmp_path, monkeypatch, make_exporter):
+    exporter = make_exporter(4)
+    output_dir = exporter.export(output_dir=str(tmp_path / "export"), create_zip=False)
+    # Send every entry to the worker processes
+    monkeypatch.setattr(madie_exporter, "PARALLEL_COMPRESS_MIN_SIZE", 0)
+
+    serial = exporter._create_zip(output_dir, str(tmp_path / "serial.zip"), jobs=1)
+    parallel = exporter._create_zip(output_dir, str(tmp_path / "parallel.zip"), jobs=3)
+
+    with open(serial[0], 'rb') as f, open(parallel[0], 'rb') as g:
+        assert f.read() == g.read()
+    with zipfile.ZipFile(parallel[0]) as zipf:
+        assert zipf.testzip() is None
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_sharded_archives(tmp_path, jobs, make_exporter):
+    max_archive_size = 12000
+    archives = make_exporter(6).export(output_dir=str(tmp_path / "export"), jobs=jobs,
+                                   max_archive_size=max_archive_size)
+
+    assert len(archives) > 1
+    exported = []
+    for archive in archives:
+        assert os.path.getsize(archive) <= max_archive_size
+        with zipfile.ZipFile(archive) as zipf:
+            assert zipf.testzip() is None
+            madie = json.loads(zipf.read(".madie"))
+            case_dirs = {name.split("/")[0] for name in zipf.namelist() if "/" in name}
+        assert case_dirs == {tc["patientId"] for tc in madie}
+        exported.extend(tc["title"] for tc in madie)
+    assert exported == [f"SeriesCase{i}" for i in range(6)]
+
+
+def test_streamed_export_profile_beside_zip(tmp_path, make_exporter):
+    output_dir = tmp_path / "export"
+    zip_path = make_exporter(2).export(output_dir=str(output_dir), write_directory=False, profile=True)
+
+    assert zip_path == f"{output_dir}.zip"
+    assert not output_dir.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "export.export_profile.json", "export.zip"]
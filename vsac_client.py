@@ -11,9 +11,30 @@ import os
 import re
 import json
 import time
+import asyncio
 import logging
+import tempfile
+import weakref
+import threading
 import requests
-from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from contextlib import contextmanager, asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from . import json_backend
+except ImportError:
+    import json_backend
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -73,6 +94,207 @@ class CacheError(VSACError):
     pass
 
 
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: allows bursts of up to `capacity` requests and
+    refills at `rate` tokens per second.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size; default: max(rate, 1))
+
+        Raises:
+            VSACValidationError: If rate is not positive
+        """
+        if not rate or rate <= 0:
+            raise VSACValidationError(f"Token bucket rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Take a token if one is available; return 0, or the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Take one token, blocking until one is available"""
+        while True:
+            wait_time = self._take()
+            if not wait_time:
+                return
+            time.sleep(wait_time)
+
+    async def acquire_async(self):
+        """Take one token, waiting (without blocking the event loop) until one is available"""
+        while True:
+            wait_time = self._take()
+            if not wait_time:
+                return
+            await asyncio.sleep(wait_time)
+
+
+class RateLimiter:
+    """
+    Request admission shared by all threads (and event loops) of a VSACClient.
+
+    Combines an optional token bucket (overall request rate), a cap on
+    concurrent requests per host, and per-host pauses: after a 429 only new
+    requests to that host wait for Retry-After, while requests already in
+    flight complete normally.
+
+    The per-host slots are threading semaphores, so one cap covers every
+    thread and event loop. Coroutines first queue on a per-loop
+    asyncio.Semaphore of the same size, then wait for a thread slot in a
+    worker thread (asyncio.to_thread), so at most max_per_host worker
+    threads per loop are ever blocked waiting.
+    """
+
+    # How often a worker thread waiting for a slot checks whether its
+    # coroutine was cancelled
+    SLOT_WAIT_CHECK_INTERVAL = 0.1
+
+    def __init__(self, requests_per_second: float = None, burst: float = None,
+                 max_per_host: int = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_second: Overall request rate (None for unlimited)
+            burst: Token bucket capacity (default: max(requests_per_second, 1))
+            max_per_host: Maximum concurrent requests per host (None for unlimited)
+        """
+        self._bucket = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._host_slots = {}
+        self._async_host_slots = weakref.WeakKeyDictionary()  # loop -> {host: asyncio.Semaphore}
+        self._paused_until = {}
+
+    def _slots(self, host: str) -> Optional[threading.Semaphore]:
+        if not self.max_per_host:
+            return None
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def pause(self, host: str, seconds: float):
+        """Hold new requests to a host for the given number of seconds"""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._paused_until[host] = max(self._paused_until.get(host, 0), until)
+
+    def _async_slots(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_host_slots.setdefault(loop, {})
+            if host not in slots:
+                slots[host] = asyncio.Semaphore(self.max_per_host)
+            return slots[host]
+
+    def _pause_remaining(self, host: str) -> float:
+        with self._lock:
+            return self._paused_until.get(host, 0) - time.monotonic()
+
+    def _wait_for_host(self, host: str):
+        while True:
+            remaining = self._pause_remaining(host)
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    @contextmanager
+    def request(self, host: str):
+        """Context manager held for the duration of one request to a host"""
+        slots = self._slots(host)
+        if slots is not None:
+            slots.acquire()
+        try:
+            self._wait_for_host(host)
+            if self._bucket is not None:
+                self._bucket.acquire()
+            yield
+        finally:
+            if slots is not None:
+                slots.release()
+
+    @asynccontextmanager
+    async def request_async(self, host: str):
+        """Async context manager held for the duration of one request to a host"""
+        slots = self._slots(host)
+        if slots is None:
+            await self._admit_async(host)
+            yield
+            return
+
+        async with self._async_slots(host):
+            await self._acquire_slot_async(slots)
+            try:
+                await self._admit_async(host)
+                yield
+            finally:
+                slots.release()
+
+    async def _admit_async(self, host: str):
+        """Wait out any pause of the host, then take a token from the bucket"""
+        while True:
+            remaining = self._pause_remaining(host)
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+        if self._bucket is not None:
+            await self._bucket.acquire_async()
+
+    async def _acquire_slot_async(self, slots: threading.Semaphore):
+        """
+        Take a per-host slot, waiting in a worker thread if none is free.
+
+        If the coroutine is cancelled, the worker stops waiting within
+        SLOT_WAIT_CHECK_INTERVAL seconds, or gives back the slot it took.
+        """
+        if slots.acquire(blocking=False):
+            return
+        lock = threading.Lock()
+        state = {"abandoned": False, "acquired": False}
+
+        def wait():
+            while not slots.acquire(timeout=self.SLOT_WAIT_CHECK_INTERVAL):
+                if state["abandoned"]:
+                    return
+            with lock:
+                if state["abandoned"]:
+                    slots.release()
+                else:
+                    state["acquired"] = True
+
+        try:
+            await asyncio.to_thread(wait)
+        except asyncio.CancelledError:
+            with lock:
+                state["abandoned"] = True
+                if state["acquired"]:
+                    slots.release()
+            raise
+
+
 # =============================================================================
 # VSAC CLIENT
 # =============================================================================
@@ -84,6 +306,11 @@ class VSACClient:
     Features:
     - Automatic retry with exponential backoff
     - In-memory and file-based caching
+    - Concurrent downloads with shared rate limiting (download_multiple)
+    - Pooled keep-alive HTTP session, shareable across threads
+    - Asyncio variant (AsyncVSACClient) sharing the same caches and statistics
+    - Paged $expand streaming for very large valuesets (iter_codes)
+    - File cache revalidation (TTL, ETag/Last-Modified) and version pinning
     - Comprehensive error handling
     - Input validation
 
@@ -92,6 +319,10 @@ class VSACClient:
         codes = client.get_codes("2.16.840.1.113883.3.666.5.307")
         sample = client.get_sample_code("2.16.840.1.113883.3.666.5.307")
 
+        # Close the pooled connections when done
+        with VSACClient(api_key="your-api-key") as client:
+            results = client.download_multiple(oids, max_workers=4)
+
     Error Handling:
         try:
             codes = client.get_codes("invalid-oid")
@@ -108,9 +339,19 @@ class VSACClient:
     DEFAULT_TIMEOUT = 30
     MAX_RETRIES = 3
     RETRY_BACKOFF_FACTOR = 2
+    MAX_CONCURRENT_PER_HOST = 4
+    POOL_CONNECTIONS = 4
+    CONNECT_RETRIES = 0
+    USER_AGENT = "NHSN-FHIR-TestCaseGenerator/1.0"
+    EXPAND_PAGE_SIZE = 1000
+    CACHE_META_SUFFIX = ".meta"
 
     def __init__(self, api_key: str, cache_dir: str = None, timeout: int = None,
-                 max_retries: int = None, verbose: bool = True):
+                 max_retries: int = None, verbose: bool = True,
+                 requests_per_second: float = None, max_concurrent_per_host: int = None,
+                 session: requests.Session = None, pool_maxsize: int = None,
+                 connect_retries: int = None, cache_ttl: float = None,
+                 manifest: str = None, valueset_version: str = None):
         """
         Initialize the VSAC client.
 
@@ -120,6 +361,22 @@ class VSACClient:
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum retry attempts for failed requests (default: 3)
             verbose: Whether to print status messages (default: True)
+            requests_per_second: Overall request rate shared by all threads
+                                 (token bucket; default: unlimited)
+            max_concurrent_per_host: Maximum concurrent requests per host
+                                     (default: MAX_CONCURRENT_PER_HOST)
+            session: Optional requests.Session to use instead of creating one.
+                     A passed-in session is not closed by close().
+            pool_maxsize: Keep-alive connections kept per host
+                          (default: max_concurrent_per_host)
+            connect_retries: Transport-level retries of failed connection
+                             attempts, on top of max_retries (default: 0)
+            cache_ttl: Seconds a cached valueset is served without asking VSAC
+                       (default: None, never expires). Expired entries are
+                       revalidated with If-None-Match/If-Modified-Since, so an
+                       unchanged valueset costs a 304 instead of a download.
+            manifest: Pin expansions to a VSAC expansion manifest (URL)
+            valueset_version: Pin expansions to a valueset version
 
         Raises:
             VSACValidationError: If api_key is empty or invalid
@@ -133,14 +390,29 @@ class VSACClient:
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.max_retries = max_retries if max_retries is not None else self.MAX_RETRIES
         self.verbose = verbose
+        self.cache_ttl = cache_ttl
+        self.manifest = manifest
+        self.valueset_version = valueset_version
+        self._cache_meta = {}  # oid -> metadata of in-memory cache entries
+        self._rate_limiter = RateLimiter(
+            requests_per_second=requests_per_second,
+            max_per_host=max_concurrent_per_host or self.MAX_CONCURRENT_PER_HOST
+        )
+        self._owns_session = session is None
+        self.session = session or self._create_session(
+            pool_maxsize or self._rate_limiter.max_per_host,
+            connect_retries if connect_retries is not None else self.CONNECT_RETRIES
+        )
 
         # Statistics tracking
         self._stats = {
             "downloads": 0,
             "cache_hits": 0,
             "failures": 0,
-            "retries": 0
+            "retries": 0,
+            "revalidated": 0
         }
+        self._stats_lock = threading.Lock()
 
         if cache_dir:
             try:
@@ -148,12 +420,52 @@ class VSACClient:
             except OSError as e:
                 raise CacheError(f"Failed to create cache directory '{cache_dir}': {e}")
 
+    def _create_session(self, pool_maxsize: int, connect_retries: int) -> requests.Session:
+        """
+        Create the keep-alive session used for all requests.
+
+        The adapter keeps up to pool_maxsize connections per host, so
+        concurrent downloads reuse connections instead of paying a TCP+TLS
+        handshake per request. Only connection failures are retried at the
+        transport level; status codes and timeouts are handled by
+        _make_request.
+        """
+        session = requests.Session()
+        session.headers.update({"User-Agent": self.USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=None, connect=connect_retries, read=0, status=0,
+                              other=0, redirect=False, raise_on_status=False),
+            pool_block=False
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Close the pooled connections (if the session was created by the client)"""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
     def _log(self, message: str, level: str = "info"):
         """Log a message if verbose mode is enabled"""
         if self.verbose:
             print(message)
         getattr(logger, level)(message)
 
+    def _record(self, stat: str):
+        """Increment a statistics counter (thread-safe)"""
+        with self._stats_lock:
+            self._stats[stat] += 1
+
     def _validate_oid(self, oid: str) -> str:
         """
         Validate and normalize an OID.
@@ -187,6 +499,112 @@ class VSACClient:
             return os.path.join(self.cache_dir, f"{safe_oid}.json")
         return None
 
+    def _get_stream_cache_path(self, oid: str) -> Optional[str]:
+        """Get the cache file path for a streamed valueset (one concept per line)"""
+        cache_path = self._get_cache_path(oid)
+        if cache_path:
+            return cache_path[:-len(".json")] + ".ndjson"
+        return None
+
+    def _load_cache_meta(self, cache_path: str) -> Optional[Dict]:
+        """
+        Load the metadata stored next to a cache file.
+
+        Returns:
+            Metadata dict (fetched_at, etag, last_modified, version, manifest,
+            valueset_version), or None if missing or unreadable
+        """
+        meta_path = cache_path + self.CACHE_META_SUFFIX
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json_backend.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache metadata {meta_path}: {e}")
+            return None
+
+    def _save_cache_meta(self, cache_path: str, meta: Dict):
+        """
+        Write the metadata stored next to a cache file.
+
+        Raises:
+            CacheError: If the metadata file cannot be written
+        """
+        try:
+            os.replace(self._write_temp_json(cache_path + self.CACHE_META_SUFFIX, meta),
+                       cache_path + self.CACHE_META_SUFFIX)
+        except OSError as e:
+            raise CacheError(f"Failed to write cache metadata {cache_path}: {e}")
+
+    def _write_temp_json(self, path: str, data) -> str:
+        """
+        Write JSON to a new temporary file next to path (to be moved over it
+        with os.replace, so readers never see a partly written file).
+
+        Returns:
+            The temporary file path
+        """
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path) or ".",
+                                         prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                         delete=False) as f:
+            try:
+                json_backend.dump(data, f, indent=2)
+            except BaseException:
+                f.close()
+                os.remove(f.name)
+                raise
+        return f.name
+
+    def _make_cache_meta(self, valueset: Optional[Dict], response_headers=None) -> Dict:
+        """Build cache metadata for a freshly fetched expansion"""
+        response_headers = response_headers or {}
+        return {
+            "fetched_at": time.time(),
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "version": (valueset or {}).get("version"),
+            "manifest": self.manifest,
+            "valueset_version": self.valueset_version
+        }
+
+    def _meta_matches_pin(self, meta: Optional[Dict]) -> bool:
+        """Return True if a cache entry was fetched with this client's manifest/version pin"""
+        if meta is None:
+            # Entries from before metadata was kept are unpinned
+            return not self.manifest and not self.valueset_version
+        return (meta.get("manifest") == self.manifest and
+                meta.get("valueset_version") == self.valueset_version)
+
+    def _meta_is_fresh(self, meta: Optional[Dict]) -> bool:
+        """Return True if a cache entry is within cache_ttl"""
+        if self.cache_ttl is None:
+            return True
+        if not meta or not meta.get("fetched_at"):
+            return False
+        return time.time() - meta["fetched_at"] < self.cache_ttl
+
+    def _conditional_headers(self, oid: str) -> Dict:
+        """
+        Return If-None-Match/If-Modified-Since headers for an expired cache entry.
+
+        Only entries with a cached body matching the current pin are
+        revalidated; anything else is downloaded in full.
+        """
+        cache_path = self._get_cache_path(oid)
+        if not cache_path or not os.path.exists(cache_path):
+            return {}
+        meta = self._load_cache_meta(cache_path)
+        if not meta or not self._meta_matches_pin(meta):
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
     def _load_from_cache(self, oid: str) -> Optional[Dict]:
         """
         Load valueset from file cache.
@@ -197,6 +615,18 @@ class VSACClient:
         Returns:
             Cached valueset dict, or None if not cached
 
+        Raises:
+            CacheError: If cache file exists but cannot be read
+        """
+        data = self._read_cache_file(oid)
+        if data is not None:
+            self._record("cache_hits")
+        return data
+
+    def _read_cache_file(self, oid: str) -> Optional[Dict]:
+        """
+        Read a valueset from the file cache without recording a cache hit.
+
         Raises:
             CacheError: If cache file exists but cannot be read
         """
@@ -206,9 +636,7 @@ class VSACClient:
 
         try:
             with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._stats["cache_hits"] += 1
-                return data
+                return json_backend.load(f)
         except json.JSONDecodeError as e:
             logger.warning(f"Corrupted cache file for {oid}, will re-download: {e}")
             # Remove corrupted cache file
@@ -220,13 +648,19 @@ class VSACClient:
         except OSError as e:
             raise CacheError(f"Failed to read cache file for {oid}: {e}")
 
-    def _save_to_cache(self, oid: str, valueset: Dict):
+    def _save_to_cache(self, oid: str, valueset: Dict, meta: Dict = None):
         """
         Save valueset to file cache.
 
+        Both files are written to temporary files first and then moved into
+        place, the body before the metadata: an interruption in between
+        leaves the new body with the old validators, which at worst costs a
+        full download (never a 304 for a body that is out of date).
+
         Args:
             oid: The valueset OID
             valueset: The valueset data to cache
+            meta: Optional cache metadata written alongside (see _make_cache_meta)
 
         Raises:
             CacheError: If cache file cannot be written
@@ -235,13 +669,25 @@ class VSACClient:
         if not cache_path:
             return
 
+        replacements = []
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(valueset, f, indent=2)
+            replacements.append((self._write_temp_json(cache_path, valueset), cache_path))
+            if meta is not None:
+                meta_path = cache_path + self.CACHE_META_SUFFIX
+                replacements.append((self._write_temp_json(meta_path, meta), meta_path))
+            while replacements:
+                os.replace(*replacements[0])
+                replacements.pop(0)
         except OSError as e:
             raise CacheError(f"Failed to write cache file for {oid}: {e}")
+        finally:
+            for temp_path, _ in replacements:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
 
-    def _make_request(self, url: str, headers: Dict) -> Tuple[int, Optional[Dict], str]:
+    def _make_request(self, url: str, headers: Dict) -> Tuple[int, Optional[Dict], str, Dict]:
         """
         Make an HTTP request with retry logic.
 
@@ -250,24 +696,27 @@ class VSACClient:
             headers: Request headers
 
         Returns:
-            Tuple of (status_code, json_response, raw_text)
+            Tuple of (status_code, json_response, raw_text, response_headers)
 
         Raises:
             VSACConnectionError: If connection fails after all retries
         """
         last_exception = None
+        host = urlsplit(url).netloc
 
         for attempt in range(self.max_retries + 1):
             try:
-                response = requests.get(url, headers=headers, timeout=self.timeout)
+                with self._rate_limiter.request(host):
+                    response = self.session.get(url, headers=headers, timeout=self.timeout)
 
-                # Handle rate limiting
+                # Handle rate limiting: hold new requests to this host (the
+                # retry included) without interrupting ones in flight
                 if response.status_code == 429:
                     retry_after = int(response.headers.get('Retry-After', 60))
                     if attempt < self.max_retries:
-                        self._stats["retries"] += 1
+                        self._record("retries")
                         self._log(f"  Rate limited. Waiting {retry_after}s before retry...")
-                        time.sleep(retry_after)
+                        self._rate_limiter.pause(host, retry_after)
                         continue
                     raise VSACRateLimitError(retry_after)
 
@@ -277,7 +726,7 @@ class VSACClient:
                 except json.JSONDecodeError:
                     json_response = None
 
-                return response.status_code, json_response, response.text
+                return response.status_code, json_response, response.text, response.headers
 
             except requests.exceptions.Timeout:
                 last_exception = VSACConnectionError(f"Request timed out after {self.timeout}s")
@@ -288,7 +737,7 @@ class VSACClient:
 
             # Retry with backoff
             if attempt < self.max_retries:
-                self._stats["retries"] += 1
+                self._record("retries")
                 wait_time = self.RETRY_BACKOFF_FACTOR ** attempt
                 self._log(f"  Request failed, retrying in {wait_time}s... (attempt {attempt + 1}/{self.max_retries})")
                 time.sleep(wait_time)
@@ -316,55 +765,115 @@ class VSACClient:
         """
         oid = self._validate_oid(oid)
 
+        cached = self._get_cached(oid, force_refresh)
+        if cached:
+            return cached
+
+        # Download from VSAC
+        url, headers = self._expand_request(oid)
+        if not force_refresh:
+            headers.update(self._conditional_headers(oid))
+        self._log(f"Downloading valueset {oid}...")
+
+        status_code, json_response, raw_text, response_headers = self._make_request(url, headers)
+        return self._handle_response(oid, status_code, json_response, raw_text,
+                                     response_headers=response_headers)
+
+    def _get_cached(self, oid: str, force_refresh: bool = False) -> Optional[Dict]:
+        """
+        Return a valueset from the in-memory or file cache (None on a miss).
+
+        Entries fetched with a different manifest/version pin, or older than
+        cache_ttl, are misses; expired file entries are then revalidated by
+        download_valueset.
+        """
+        if force_refresh:
+            return None
+
         # Check in-memory cache
-        if not force_refresh and oid in self.cache:
-            self._log(f"  [CACHE] Using in-memory cache for {oid}")
-            return self.cache[oid]
+        if oid in self.cache:
+            meta = self._cache_meta.get(oid)
+            if self._meta_matches_pin(meta) and self._meta_is_fresh(meta):
+                self._log(f"  [CACHE] Using in-memory cache for {oid}")
+                return self.cache[oid]
 
         # Check file cache
-        if not force_refresh:
-            cached = self._load_from_cache(oid)
-            if cached:
-                self.cache[oid] = cached
-                self._log(f"  [CACHE] Loaded from file cache: {oid}")
-                return cached
+        cache_path = self._get_cache_path(oid)
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        meta = self._load_cache_meta(cache_path)
+        if not self._meta_matches_pin(meta) or not self._meta_is_fresh(meta):
+            return None
+
+        cached = self._load_from_cache(oid)
+        if cached:
+            self.cache[oid] = cached
+            self._cache_meta[oid] = meta
+            self._log(f"  [CACHE] Loaded from file cache: {oid}")
+            return cached
+        return None
+
+    def _expand_request(self, oid: str, count: int = None, offset: int = None) -> Tuple[str, Dict]:
+        """Return the $expand URL (one page of it, if count is given) and headers for a valueset"""
+        params = {}
+        if self.manifest:
+            params["manifest"] = self.manifest
+        if self.valueset_version:
+            params["valueSetVersion"] = self.valueset_version
+        if count is not None:
+            params["count"] = count
+            params["offset"] = offset or 0
 
-        # Download from VSAC
         url = f"{self.VSAC_FHIR_URL}/{oid}/$expand"
+        if params:
+            url += "?" + urlencode(params)
         headers = {
             "Accept": "application/fhir+json",
             "Authorization": f"Basic {self.api_key}"
         }
+        return url, headers
 
-        self._log(f"Downloading valueset {oid}...")
-
-        status_code, json_response, raw_text = self._make_request(url, headers)
+    def _handle_response(self, oid: str, status_code: int, json_response: Optional[Dict],
+                         raw_text: str, store: bool = True, response_headers=None) -> Dict:
+        """
+        Map an $expand response to the valueset or a VSACError.
 
-        # Handle response codes
+        Shared by VSACClient and AsyncVSACClient so both record the same
+        statistics and raise the same exceptions. With store=False (a page of
+        a streamed expansion) the response is neither counted nor cached.
+        A 304 to a conditional request refreshes the cached entry.
+        """
         if status_code == 200:
             if not json_response:
                 raise VSACResponseError(status_code, "Empty response body")
+            if not store:
+                return json_response
 
-            self._stats["downloads"] += 1
+            meta = self._make_cache_meta(json_response, response_headers)
+            self._record("downloads")
             self.cache[oid] = json_response
-            self._save_to_cache(oid, json_response)
+            self._cache_meta[oid] = meta
+            self._save_to_cache(oid, json_response, meta)
             self._log(f"  [OK] Successfully downloaded {oid}")
             return json_response
 
+        elif status_code == 304 and store:
+            return self._revalidate_cached(oid, response_headers)
+
         elif status_code == 401:
-            self._stats["failures"] += 1
+            self._record("failures")
             raise VSACAuthenticationError(
                 "Authentication failed. Please verify your VSAC API key is valid and properly encoded."
             )
 
         elif status_code == 403:
-            self._stats["failures"] += 1
+            self._record("failures")
             raise VSACAuthenticationError(
                 "Access forbidden. Your API key may not have permission to access this valueset."
             )
 
         elif status_code == 404:
-            self._stats["failures"] += 1
+            self._record("failures")
             # Check if it's a FHIR OperationOutcome
             if json_response and json_response.get("resourceType") == "OperationOutcome":
                 issues = json_response.get("issue", [])
@@ -375,11 +884,11 @@ class VSACClient:
 
         elif status_code == 429:
             # Should be handled in _make_request, but just in case
-            self._stats["failures"] += 1
+            self._record("failures")
             raise VSACRateLimitError()
 
         else:
-            self._stats["failures"] += 1
+            self._record("failures")
             raise VSACResponseError(status_code, raw_text)
 
     def extract_codes(self, valueset_json: Dict) -> List[Dict]:
@@ -403,57 +912,225 @@ class VSACClient:
 
         codes = []
 
+        for concept in self._expansion_contains(valueset_json):
+            code_entry = self._concept_to_code(concept)
+            if code_entry:
+                codes.append(code_entry)
+
+        return codes
+
+    def _revalidate_cached(self, oid: str, response_headers=None) -> Dict:
+        """
+        Serve a file cache entry VSAC reported as not modified (304).
+
+        The entry's fetched_at is reset, so it is fresh for another cache_ttl.
+
+        Raises:
+            VSACResponseError: If the cached copy has disappeared
+        """
+        cache_path = self._get_cache_path(oid)
+        meta = self._load_cache_meta(cache_path) if cache_path else None
+        cached = self._read_cache_file(oid) if meta else None
+        if not cached:
+            self._record("failures")
+            raise VSACResponseError(304, "Not modified, but no cached copy is available")
+
+        response_headers = response_headers or {}
+        meta["fetched_at"] = time.time()
+        meta["etag"] = response_headers.get("ETag") or meta.get("etag")
+        meta["last_modified"] = response_headers.get("Last-Modified") or meta.get("last_modified")
+        self._save_cache_meta(cache_path, meta)
+
+        self._record("revalidated")
+        self.cache[oid] = cached
+        self._cache_meta[oid] = meta
+        self._log(f"  [CACHE] Not modified, revalidated file cache: {oid}")
+        return cached
+
+    def _expansion_contains(self, valueset_json: Dict) -> List:
+        """Return expansion.contains of a valueset (empty, with a warning, if missing)"""
         # Check for expansion
         expansion = valueset_json.get("expansion")
         if not expansion:
             logger.warning(f"ValueSet has no expansion: {valueset_json.get('id', 'unknown')}")
-            return codes
+            return []
 
         contains = expansion.get("contains")
         if not contains:
             logger.warning(f"ValueSet expansion has no contains: {valueset_json.get('id', 'unknown')}")
-            return codes
+            return []
 
         if not isinstance(contains, list):
             raise VSACValidationError(f"expansion.contains must be a list, got {type(contains).__name__}")
 
-        for concept in contains:
-            if not isinstance(concept, dict):
-                logger.warning(f"Skipping invalid concept: {concept}")
-                continue
+        return contains
 
-            code_entry = {
-                "system": concept.get("system"),
-                "code": concept.get("code"),
-                "display": concept.get("display")
-            }
+    def _concept_to_code(self, concept) -> Optional[Dict]:
+        """Convert an expansion concept to a code dict (None, with a warning, if invalid)"""
+        if not isinstance(concept, dict):
+            logger.warning(f"Skipping invalid concept: {concept}")
+            return None
 
-            # Validate required fields
-            if not code_entry["system"] or not code_entry["code"]:
-                logger.warning(f"Skipping concept with missing system or code: {concept}")
-                continue
+        code_entry = {
+            "system": concept.get("system"),
+            "code": concept.get("code"),
+            "display": concept.get("display")
+        }
 
-            codes.append(code_entry)
+        # Validate required fields
+        if not code_entry["system"] or not code_entry["code"]:
+            logger.warning(f"Skipping concept with missing system or code: {concept}")
+            return None
 
-        return codes
+        return code_entry
 
-    def get_codes(self, oid: str, force_refresh: bool = False) -> List[Dict]:
+    def get_codes(self, oid: str, force_refresh: bool = False, stream: bool = False,
+                  page_size: int = None) -> Union[List[Dict], Iterator[Dict]]:
         """
         Get list of codes for a valueset.
 
         Args:
             oid: The OID of the valueset
             force_refresh: If True, bypass cache and re-download
+            stream: If True, return an iterator over the codes instead of a
+                    list, fetching the expansion page by page (see iter_codes)
+            page_size: Concepts per $expand page when streaming
+                       (default: EXPAND_PAGE_SIZE)
 
         Returns:
-            List of code dicts [{system, code, display}]
+            List of code dicts [{system, code, display}] (an iterator if stream)
 
         Raises:
             VSACError: For any VSAC-related errors
         """
+        if stream:
+            return self.iter_codes(oid, force_refresh, page_size)
         valueset = self.download_valueset(oid, force_refresh)
         return self.extract_codes(valueset)
 
+    def iter_codes(self, oid: str, force_refresh: bool = False,
+                   page_size: int = None) -> Iterator[Dict]:
+        """
+        Iterate over the codes of a valueset without holding the expansion in memory.
+
+        Args:
+            oid: The OID of the valueset
+            force_refresh: If True, bypass cache and re-download
+            page_size: Concepts per $expand page (default: EXPAND_PAGE_SIZE)
+
+        Yields:
+            Code dicts {system, code, display}
+
+        Raises:
+            VSACError: For any VSAC-related errors
+        """
+        for concept in self.iter_expansion(oid, force_refresh, page_size):
+            code_entry = self._concept_to_code(concept)
+            if code_entry:
+                yield code_entry
+
+    def iter_expansion(self, oid: str, force_refresh: bool = False,
+                       page_size: int = None) -> Iterator[Dict]:
+        """
+        Iterate over expansion.contains of a valueset using paged $expand.
+
+        Pages are requested with count/offset until expansion.total concepts
+        (or a short page) have been read. Concepts are appended to the file
+        cache ({oid}.ndjson, one concept per line) as pages arrive; the file
+        is written under a private temporary name and only moved into place
+        once the expansion is complete, and later calls stream from it. A
+        valueset already cached whole (in memory or as {oid}.json) is served
+        from that cache. Streamed expansions are not added to the in-memory
+        cache.
+
+        Args:
+            oid: The OID of the valueset
+            force_refresh: If True, bypass cache and re-download
+            page_size: Concepts per $expand page (default: EXPAND_PAGE_SIZE)
+
+        Yields:
+            Expansion concept dicts, as returned by VSAC
+
+        Raises:
+            VSACValidationError: If OID format or page_size is invalid
+            VSACError: For other VSAC-related errors (as download_valueset)
+            CacheError: If the stream cache cannot be read or written
+        """
+        oid = self._validate_oid(oid)
+        page_size = page_size or self.EXPAND_PAGE_SIZE
+        if page_size < 1:
+            raise VSACValidationError(f"page_size must be positive, got {page_size}")
+
+        cached = self._get_cached(oid, force_refresh)
+        if cached:
+            yield from self._expansion_contains(cached)
+            return
+
+        stream_path = self._get_stream_cache_path(oid)
+        stream_meta = self._load_cache_meta(stream_path) if stream_path and os.path.exists(stream_path) else None
+        if not force_refresh and stream_path and os.path.exists(stream_path) and \
+                self._meta_matches_pin(stream_meta) and self._meta_is_fresh(stream_meta):
+            self._record("cache_hits")
+            self._log(f"  [CACHE] Streaming from file cache: {oid}")
+            try:
+                with open(stream_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            yield json_backend.loads(line)
+            except (OSError, ValueError) as e:
+                raise CacheError(f"Failed to read stream cache file for {oid}: {e}")
+            return
+
+        self._log(f"Downloading valueset {oid} in pages of {page_size}...")
+        part_path = None
+        cache_file = None
+        meta = None
+        try:
+            if stream_path:
+                # A private temp file, so concurrent streams of the same
+                # valueset never write to (or delete) each other's file
+                try:
+                    cache_file = tempfile.NamedTemporaryFile(
+                        'w', encoding='utf-8', dir=self.cache_dir, delete=False,
+                        prefix=os.path.basename(stream_path) + ".", suffix=".part"
+                    )
+                except OSError as e:
+                    raise CacheError(f"Failed to write stream cache file for {oid}: {e}")
+                part_path = cache_file.name
+
+            offset = 0
+            while True:
+                url, headers = self._expand_request(oid, count=page_size, offset=offset)
+                status_code, json_response, raw_text, response_headers = self._make_request(url, headers)
+                page = self._handle_response(oid, status_code, json_response, raw_text, store=False)
+                if meta is None:
+                    meta = self._make_cache_meta(page, response_headers)
+
+                contains = page.get("expansion", {}).get("contains") or []
+                if not isinstance(contains, list):
+                    raise VSACValidationError(f"expansion.contains must be a list, got {type(contains).__name__}")
+                if cache_file:
+                    cache_file.writelines(json_backend.dumps(concept) + "\n" for concept in contains)
+                yield from contains
+
+                offset += len(contains)
+                total = page.get("expansion", {}).get("total")
+                if not contains or (total is not None and offset >= total) or \
+                        (total is None and len(contains) < page_size):
+                    break
+
+            self._record("downloads")
+            if cache_file:
+                cache_file.close()
+                os.replace(part_path, stream_path)
+                self._save_cache_meta(stream_path, meta)
+            self._log(f"  [OK] Streamed {offset} concepts from {oid}")
+        finally:
+            if cache_file and not cache_file.closed:
+                cache_file.close()
+            if part_path and os.path.exists(part_path):
+                os.remove(part_path)
+
     def get_sample_code(self, oid: str, index: int = 0) -> Optional[Dict]:
         """
         Get a single sample code from a valueset.
@@ -506,7 +1183,7 @@ class VSACClient:
         }
 
     def download_multiple(self, oids: Dict[str, str], force_refresh: bool = False,
-                          continue_on_error: bool = True) -> Dict[str, List[Dict]]:
+                          continue_on_error: bool = True, max_workers: int = 1) -> Dict[str, List[Dict]]:
         """
         Download multiple valuesets at once.
 
@@ -515,9 +1192,16 @@ class VSACClient:
                   {"encounter_inpatient": "2.16.840.1.113883.3.666.5.307"}
             force_refresh: If True, bypass cache and re-download
             continue_on_error: If True, continue downloading other valuesets on error
+            max_workers: Number of valuesets downloaded concurrently. Requests
+                         still go through the client's rate limiter (see
+                         requests_per_second and max_concurrent_per_host).
+                         Only the first name of each OID is fetched
+                         concurrently; repeats are fetched afterwards, as in
+                         a serial run, so results, errors and statistics are
+                         the same for any max_workers.
 
         Returns:
-            Dict mapping names to code lists
+            Dict mapping names to code lists (in the order of oids)
 
         Raises:
             VSACError: If continue_on_error is False and any download fails
@@ -532,27 +1216,46 @@ class VSACClient:
         self._log("VSAC Value Set Download")
         self._log("=" * 60)
 
-        for name, oid in oids.items():
-            self._log(f"\n[{name}]")
-            self._log(f"OID: {oid}")
+        if max_workers is None or max_workers < 1:
+            max_workers = os.cpu_count() or 1
 
-            try:
-                codes = self.get_codes(oid, force_refresh)
-                results[name] = codes
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {}
+            if max_workers > 1:
+                # One download per OID at a time: a repeated OID is fetched
+                # again (or served from the in-memory cache) once the first
+                # one is done, exactly as in a serial run
+                for oid in oids.values():
+                    if oid not in futures:
+                        futures[oid] = pool.submit(self.get_codes, oid, force_refresh)
 
-                if codes:
-                    self._log(f"  Extracted {len(codes)} codes")
-                    sample = codes[0]
-                    self._log(f"  Sample: {sample['code']} - {sample.get('display', 'N/A')}")
-                else:
-                    self._log(f"  [WARNING] No codes extracted")
+            for name, oid in oids.items():
+                self._log(f"\n[{name}]")
+                self._log(f"OID: {oid}")
 
-            except VSACError as e:
-                errors[name] = str(e)
-                self._log(f"  [ERROR] {e}")
-                if not continue_on_error:
-                    raise
-                results[name] = []
+                try:
+                    future = futures.pop(oid, None)
+                    if future is not None:
+                        codes = future.result()
+                    else:
+                        codes = self.get_codes(oid, force_refresh)
+                    results[name] = codes
+
+                    if codes:
+                        self._log(f"  Extracted {len(codes)} codes")
+                        sample = codes[0]
+                        self._log(f"  Sample: {sample['code']} - {sample.get('display', 'N/A')}")
+                    else:
+                        self._log(f"  [WARNING] No codes extracted")
+
+                except VSACError as e:
+                    errors[name] = str(e)
+                    self._log(f"  [ERROR] {e}")
+                    if not continue_on_error:
+                        for future in futures.values():
+                            future.cancel()
+                        raise
+                    results[name] = []
 
         self._log("\n" + "=" * 60)
         self._log(f"Downloaded {len(results)} valuesets")
@@ -598,7 +1301,7 @@ class VSACClient:
 
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2)
+                json_backend.dump(summary, f, indent=2)
             self._log(f"\nSummary saved to: {output_file}")
         except OSError as e:
             raise OSError(f"Failed to write summary file: {e}")
@@ -617,17 +1320,314 @@ class VSACClient:
         if oid:
             oid = self._validate_oid(oid)
             self.cache.pop(oid, None)
-            cache_path = self._get_cache_path(oid)
-            if cache_path and os.path.exists(cache_path):
-                os.remove(cache_path)
+            self._cache_meta.pop(oid, None)
+            for cache_path in (self._get_cache_path(oid), self._get_stream_cache_path(oid)):
+                for path in (cache_path, cache_path and cache_path + self.CACHE_META_SUFFIX):
+                    if path and os.path.exists(path):
+                        os.remove(path)
         else:
             self.cache.clear()
+            self._cache_meta.clear()
             if self.cache_dir and os.path.exists(self.cache_dir):
                 for filename in os.listdir(self.cache_dir):
-                    if filename.endswith('.json'):
+                    if filename.endswith(('.json', '.ndjson', self.CACHE_META_SUFFIX, '.tmp', '.part')):
                         os.remove(os.path.join(self.cache_dir, filename))
 
 
+# =============================================================================
+# ASYNC VSAC CLIENT
+# =============================================================================
+
+class AsyncVSACClient:
+    """
+    Asyncio variant of VSACClient.
+
+    Wraps a VSACClient and shares its caches, rate limiter, statistics and
+    exception classes, so valuesets prefetched here are served from cache by
+    the blocking client (and vice versa). Requests use aiohttp when it is
+    installed; otherwise the client's pooled requests session is run off the
+    event loop with asyncio.to_thread. Cache file reads and writes also run
+    in worker threads, so the event loop never blocks on disk I/O.
+
+    Usage:
+        async with AsyncVSACClient(api_key="your-api-key") as client:
+            valueset = await client.download_valueset("2.16.840.1.113883.3.666.5.307")
+            results = await client.download_many(oids, concurrency=8)
+    """
+
+    def __init__(self, api_key: str = None, client: VSACClient = None,
+                 use_aiohttp: bool = None, **kwargs):
+        """
+        Initialize the async client.
+
+        Args:
+            api_key: VSAC API key (used to create a VSACClient)
+            client: Existing VSACClient to share caches and statistics with
+            use_aiohttp: Whether to use aiohttp (default: if installed)
+            **kwargs: Additional VSACClient arguments (cache_dir, timeout, ...)
+
+        Raises:
+            VSACValidationError: If api_key is invalid, or aiohttp is
+                                 requested but not installed
+        """
+        if use_aiohttp and not AIOHTTP_AVAILABLE:
+            raise VSACValidationError("aiohttp is not installed (pip install aiohttp)")
+
+        self._owns_client = client is None
+        self.client = client or VSACClient(api_key, **kwargs)
+        self.use_aiohttp = AIOHTTP_AVAILABLE if use_aiohttp is None else use_aiohttp
+        self._aiohttp_session = None
+
+    async def _get_aiohttp_session(self):
+        """Create the aiohttp session lazily (it must be created inside a running loop)"""
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.client._rate_limiter.max_per_host or 0)
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.client.timeout),
+                headers={"User-Agent": self.client.USER_AGENT}
+            )
+        return self._aiohttp_session
+
+    async def _fetch(self, url: str, headers: Dict) -> Tuple[int, Dict, str]:
+        """
+        Perform one GET request.
+
+        Returns:
+            Tuple of (status_code, response_headers, raw_text)
+
+        Raises:
+            VSACConnectionError: If the request fails at the transport level
+        """
+        if self.use_aiohttp:
+            try:
+                session = await self._get_aiohttp_session()
+                async with session.get(url, headers=headers) as response:
+                    return response.status, response.headers, await response.text()
+            except asyncio.TimeoutError:
+                raise VSACConnectionError(f"Request timed out after {self.client.timeout}s")
+            except aiohttp.ClientConnectionError as e:
+                raise VSACConnectionError(f"Connection failed: {e}")
+            except aiohttp.ClientError as e:
+                raise VSACConnectionError(f"Request failed: {e}")
+
+        try:
+            response = await asyncio.to_thread(
+                self.client.session.get, url, headers=headers, timeout=self.client.timeout
+            )
+            return response.status_code, response.headers, response.text
+        except requests.exceptions.Timeout:
+            raise VSACConnectionError(f"Request timed out after {self.client.timeout}s")
+        except requests.exceptions.ConnectionError as e:
+            raise VSACConnectionError(f"Connection failed: {e}")
+        except requests.exceptions.RequestException as e:
+            raise VSACConnectionError(f"Request failed: {e}")
+
+    async def _make_request(self, url: str, headers: Dict) -> Tuple[int, Optional[Dict], str, Dict]:
+        """
+        Make an HTTP request with the same retry logic as VSACClient._make_request.
+
+        Returns:
+            Tuple of (status_code, json_response, raw_text, response_headers)
+
+        Raises:
+            VSACConnectionError: If connection fails after all retries
+            VSACRateLimitError: If still rate limited after all retries
+        """
+        client = self.client
+        last_exception = None
+        host = urlsplit(url).netloc
+
+        for attempt in range(client.max_retries + 1):
+            try:
+                async with client._rate_limiter.request_async(host):
+                    status_code, response_headers, raw_text = await self._fetch(url, headers)
+
+                if status_code == 429:
+                    retry_after = int(response_headers.get('Retry-After', 60))
+                    if attempt < client.max_retries:
+                        client._record("retries")
+                        client._log(f"  Rate limited. Waiting {retry_after}s before retry...")
+                        client._rate_limiter.pause(host, retry_after)
+                        continue
+                    raise VSACRateLimitError(retry_after)
+
+                try:
+                    json_response = json.loads(raw_text) if raw_text else None
+                except json.JSONDecodeError:
+                    json_response = None
+
+                return status_code, json_response, raw_text, response_headers
+
+            except VSACConnectionError as e:
+                last_exception = e
+
+            # Retry with backoff
+            if attempt < client.max_retries:
+                client._record("retries")
+                wait_time = client.RETRY_BACKOFF_FACTOR ** attempt
+                client._log(f"  Request failed, retrying in {wait_time}s... (attempt {attempt + 1}/{client.max_retries})")
+                await asyncio.sleep(wait_time)
+
+        raise last_exception
+
+    async def download_valueset(self, oid: str, force_refresh: bool = False) -> Dict:
+        """
+        Download a value set from VSAC FHIR API.
+
+        Args:
+            oid: The OID of the valueset (e.g., "2.16.840.1.113883.3.666.5.307")
+            force_refresh: If True, bypass cache and re-download
+
+        Returns:
+            The valueset JSON dict
+
+        Raises:
+            The same exceptions as VSACClient.download_valueset
+        """
+        client = self.client
+        oid = client._validate_oid(oid)
+
+        cached = await asyncio.to_thread(client._get_cached, oid, force_refresh)
+        if cached:
+            return cached
+
+        url, headers = client._expand_request(oid)
+        if not force_refresh:
+            headers.update(await asyncio.to_thread(client._conditional_headers, oid))
+        client._log(f"Downloading valueset {oid}...")
+
+        status_code, json_response, raw_text, response_headers = await self._make_request(url, headers)
+        return await asyncio.to_thread(client._handle_response, oid, status_code, json_response,
+                                       raw_text, response_headers=response_headers)
+
+    async def get_codes(self, oid: str, force_refresh: bool = False) -> List[Dict]:
+        """
+        Download a valueset and extract its codes.
+
+        Args:
+            oid: The OID of the valueset
+            force_refresh: If True, bypass cache and re-download
+
+        Returns:
+            List of code dicts
+        """
+        valueset = await self.download_valueset(oid, force_refresh)
+        return self.client.extract_codes(valueset)
+
+    async def download_many(self, oids: Dict[str, str], force_refresh: bool = False,
+                            continue_on_error: bool = True, concurrency: int = None) -> Dict[str, List[Dict]]:
+        """
+        Download multiple valuesets concurrently (async counterpart of download_multiple).
+
+        Only the first name of each OID is fetched concurrently; repeats are
+        fetched afterwards, as in a serial run, so results, errors and
+        statistics are the same as download_multiple's.
+
+        Args:
+            oids: Dict mapping names to OIDs
+            force_refresh: If True, bypass cache and re-download
+            continue_on_error: If True, continue downloading other valuesets on error
+            concurrency: Maximum valuesets downloaded at once (default: unlimited;
+                         requests still go through the client's rate limiter)
+
+        Returns:
+            Dict mapping names to code lists (in the order of oids)
+
+        Raises:
+            VSACError: If continue_on_error is False and any download fails
+        """
+        if not oids:
+            return {}
+
+        client = self.client
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def fetch(oid):
+            if semaphore is None:
+                return await self.get_codes(oid, force_refresh)
+            async with semaphore:
+                return await self.get_codes(oid, force_refresh)
+
+        # One download per OID at a time, as in VSACClient.download_multiple:
+        # a repeated OID is fetched again (or served from the in-memory
+        # cache) once the first one is done
+        tasks = {}
+        for oid in oids.values():
+            if oid not in tasks:
+                tasks[oid] = asyncio.ensure_future(fetch(oid))
+
+        results = {}
+        errors = {}
+
+        client._log("=" * 60)
+        client._log("VSAC Value Set Download")
+        client._log("=" * 60)
+
+        try:
+            for name, oid in oids.items():
+                client._log(f"\n[{name}]")
+                client._log(f"OID: {oid}")
+
+                try:
+                    task = tasks.pop(oid, None)
+                    codes = await (task if task is not None else fetch(oid))
+                    results[name] = codes
+
+                    if codes:
+                        client._log(f"  Extracted {len(codes)} codes")
+                        sample = codes[0]
+                        client._log(f"  Sample: {sample['code']} - {sample.get('display', 'N/A')}")
+                    else:
+                        client._log("  [WARNING] No codes extracted")
+
+                except VSACError as e:
+                    errors[name] = str(e)
+                    client._log(f"  [ERROR] {e}")
+                    if not continue_on_error:
+                        raise
+                    results[name] = []
+        finally:
+            pending = [task for task in tasks.values() if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        client._log("\n" + "=" * 60)
+        client._log(f"Downloaded {len(results)} valuesets")
+        if errors:
+            client._log(f"Errors: {len(errors)}")
+            for name, error in errors.items():
+                client._log(f"  - {name}: {error}")
+        client._log("=" * 60)
+
+        return results
+
+    @property
+    def cache(self) -> Dict:
+        """The in-memory valueset cache (shared with the wrapped VSACClient)"""
+        return self.client.cache
+
+    def get_statistics(self) -> Dict:
+        """Get download statistics (shared with the wrapped VSACClient)"""
+        return self.client.get_statistics()
+
+    async def aclose(self):
+        """Close the aiohttp session (and the wrapped client, if created here)"""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+        return False
+
+
 # =============================================================================
 # CQL PARSING UTILITIES
 # =============================================================================